@@ -19,6 +19,7 @@ import json
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from main import run_baseline_mode
+from utils import process_runner
 from utils.llm_api import get_model_info, get_available_providers
 
 
@@ -181,6 +182,10 @@ class EnhancedBaselineAutoRepairer:
         if start_from > 0:
             self.logger.info(f"시작 인덱스: {start_from}")
         
+        # 단계별(actionlint, smell detector) 자원 사용량 집계
+        process_runner.enable_resource_accounting()
+        process_runner.get_resource_usage_summary(reset=True)
+        
         start_time = datetime.now()
         successful_repairs = []
         failed_repairs = []
@@ -263,7 +268,8 @@ class EnhancedBaselineAutoRepairer:
                 'total_processing_time': total_processing_time,
                 'start_from': start_from,
                 'requested_files': max_files,
-                'processed_files': len(input_files)
+                'processed_files': len(input_files),
+                'resource_usage': process_runner.get_resource_usage_summary(reset=True)
             },
             'results': {
                 'total_files': total_files,
@@ -314,6 +320,9 @@ class EnhancedBaselineAutoRepairer:
         self.logger.info(f"성공: {results['successful_repairs']} ({results['success_rate']:.1f}%)")
         self.logger.info(f"실패: {results['failed_repairs']}")
         self.logger.info(f"평균 처리 시간: {results['avg_processing_time']:.2f}초/파일")
+        for line in process_runner.format_resource_usage_summary(
+                summary['execution_info'].get('resource_usage', {})):
+            self.logger.info(f"자원 사용량 - {line}")
         self.logger.info(f"출력 파일 위치: {self.output_dir}")
         if hasattr(self, 'info_log_path') and hasattr(self, 'debug_log_path'):
             self.logger.info(f"INFO 로그 파일: {self.info_log_path}")
@@ -18,6 +18,7 @@ import statistics
 # 로컬 모듈 임포트
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from evaluation.evaluator import BaselineEvaluator
+from utils import process_runner
 
 
 def find_matching_files(original_dir: Path, repaired_dir: Path) -> List[tuple]:
@@ -66,6 +67,10 @@ def batch_evaluate(original_dir: str, repaired_dir: str, output_dir: str) -> Dic
     # 평가 시스템 초기화
     evaluator = BaselineEvaluator()
     
+    # 단계별(actionlint, smell detector) 자원 사용량 집계
+    process_runner.enable_resource_accounting()
+    process_runner.get_resource_usage_summary(reset=True)
+    
     # 결과 저장용
     results = []
     syntax_successes = []
@@ -125,7 +130,10 @@ def batch_evaluate(original_dir: str, repaired_dir: str, output_dir: str) -> Dic
             "max": max(edit_distances) if edit_distances else 0,
             "median": statistics.median(edit_distances) if edit_distances else 0,
             "stdev": statistics.stdev(edit_distances) if len(edit_distances) > 1 else 0
-        }
+        },
+        
+        # 단계별 자원 사용량
+        "resource_usage": process_runner.get_resource_usage_summary(reset=True)
     }
     
     # 결과 저장
@@ -149,6 +157,8 @@ def batch_evaluate(original_dir: str, repaired_dir: str, output_dir: str) -> Dic
     logger.info(f"구문 성공률: {syntax_success_rate:.2f}% ({sum(syntax_successes)}/{total_files})")
     logger.info(f"평균 스멀 제거율: {avg_smell_removal_rate:.2f}%")
     logger.info(f"평균 편집 거리: {avg_edit_distance:.2f}")
+    for line in process_runner.format_resource_usage_summary(summary["resource_usage"]):
+        logger.info(f"자원 사용량 - {line}")
     logger.info(f"요약 결과: {summary_file}")
     logger.info(f"상세 결과: {detailed_file}")
     logger.info("=" * 60)
@@ -17,6 +17,7 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from main import run_two_phase_mode
+from utils import process_runner
 
 
 class TwoPhaseAutoRepairer:
@@ -111,6 +112,10 @@ class TwoPhaseAutoRepairer:
         self.logger.info(f"출력 디렉토리: {self.output_dir}")
         self.logger.info("프롬프트 모드: Simple (2단계 복구)")
         
+        # 단계별(actionlint, smell detector) 자원 사용량 집계
+        process_runner.enable_resource_accounting()
+        process_runner.get_resource_usage_summary(reset=True)
+        
         start_time = datetime.now()
         successful_repairs = []
         failed_repairs = []
@@ -167,6 +172,7 @@ class TwoPhaseAutoRepairer:
             'failed_repairs': len(failed_repairs),
             'success_rate': (len(successful_repairs) / total_files) * 100.0 if total_files > 0 else 0.0,
             'avg_processing_time': sum(r.get('processing_time', 0) for r in successful_repairs + failed_repairs) / total_files if total_files > 0 else 0.0,
+            'resource_usage': process_runner.get_resource_usage_summary(reset=True),
             'prompt_mode': 'simple',
             'successful_files': successful_repairs,
             'failed_files': failed_repairs
@@ -180,6 +186,8 @@ class TwoPhaseAutoRepairer:
         self.logger.info(f"성공: {len(successful_repairs)} ({summary['success_rate']:.1f}%)")
         self.logger.info(f"실패: {len(failed_repairs)}")
         self.logger.info(f"평균 처리 시간: {summary['avg_processing_time']:.2f}초/파일")
+        for line in process_runner.format_resource_usage_summary(summary['resource_usage']):
+            self.logger.info(f"자원 사용량 - {line}")
         self.logger.info(f"출력 파일 위치: {self.output_dir}")
         if hasattr(self, 'info_log_path') and hasattr(self, 'debug_log_path'):
             self.logger.info(f"INFO 로그 파일: {self.info_log_path}")
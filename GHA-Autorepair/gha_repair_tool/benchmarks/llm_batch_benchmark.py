@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+LLM 배치 호출 처리량 벤치마크
+
+로컬 대역 서버(llm_client_benchmark.StandInServer)에 생성 지연을 주고
+이전 방식(순차 호출 + 요청 간 0.1초 + 배치 간 지연)과 run_llm_batch의 처리량을 비교합니다.
+
+사용법:
+    python benchmarks/llm_batch_benchmark.py --prompts 100 --response-delay 500 --rpm 600
+"""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_client_benchmark import StandInServer
+from utils import llm_api
+
+
+def sequential_batch(prompts, batch_size: int = 5, delay_between_batches: float = 1.0):
+    """이전 call_llm_batch의 호출 방식"""
+    results = []
+    for i in range(0, len(prompts), batch_size):
+        batch = prompts[i:i + batch_size]
+        for j, prompt in enumerate(batch):
+            results.append(llm_api.call_llm(prompt))
+            if j < len(batch) - 1:
+                time.sleep(0.1)
+        if i + batch_size < len(prompts):
+            time.sleep(delay_between_batches)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 배치 호출 처리량 벤치마크")
+    parser.add_argument("--prompts", type=int, default=100, help="프롬프트 수")
+    parser.add_argument("--response-delay", type=float, default=500.0,
+                        help="요청마다 흉내 낼 생성 지연 (ms)")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument("--rpm", type=float, default=600.0, help="분당 요청 수 한도")
+    parser.add_argument("--skip-sequential", action="store_true", help="이전 방식 측정 생략")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    server = StandInServer(response_delay=args.response_delay / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["LLM_PROVIDER"] = "ollama"
+    os.environ["OLLAMA_URL"] = f"{server.url}/api/chat"
+    prompts = [f"prompt {i}" for i in range(args.prompts)]
+
+    print(f"{args.prompts}개 프롬프트, 생성 지연 {args.response_delay:.0f}ms, "
+          f"동시 요청 {args.concurrency}, RPM 한도 {args.rpm:.0f}")
+    print(f"{'방식':<36} {'초':>7} {'개/분':>8} {'실패':>5}")
+    scenarios = []
+    if not args.skip_sequential:
+        scenarios.append(("이전 방식 (순차)", lambda: sequential_batch(prompts)))
+    scenarios.append(("run_llm_batch (RPM 제한)", lambda: [
+        r["response"] for r in llm_api.run_llm_batch(prompts, max_concurrency=args.concurrency,
+                                                     requests_per_minute=args.rpm)]))
+    scenarios.append(("run_llm_batch (제한 없음)", lambda: [
+        r["response"] for r in llm_api.run_llm_batch(prompts, max_concurrency=args.concurrency,
+                                                     requests_per_minute=0)]))
+    for name, run in scenarios:
+        start = time.perf_counter()
+        results = run()
+        seconds = time.perf_counter() - start
+        failures = sum(1 for r in results if not r)
+        print(f"{name:<36} {seconds:7.2f} {len(prompts) / seconds * 60:8.0f} {failures:5d}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+LLM 클라이언트 재사용 벤치마크
+
+로컬 대역 서버(OpenAI 호환 /v1/chat/completions, Ollama /api/chat)에 대해
+호출마다 클라이언트를 새로 만드는 방식과 utils.llm_api의 재사용 클라이언트를 비교합니다.
+
+사용법:
+    python benchmarks/llm_client_benchmark.py --calls 200 --connect-delay 20
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import llm_api
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """OpenAI/Ollama 응답 형식을 흉내 내는 요청 처리기 (keep-alive 지원)"""
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문을 따로 쓰므로 Nagle 알고리즘이 재사용 연결의 응답을 지연시키지 않도록 끔
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+        # 새 연결마다 TCP/TLS 핸드셰이크 지연을 흉내 냄
+        if self.server.connect_delay > 0:
+            time.sleep(self.server.connect_delay)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if self.server.response_delay > 0:
+            time.sleep(self.server.response_delay)
+        content = "on: push\njobs: {}\n"
+        if self.path.endswith("/chat/completions"):
+            body = {
+                "id": "chatcmpl-standin",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get("model", ""),
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": content}}],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+            }
+        elif self.path == "/api/chat":
+            body = {"model": request.get("model", ""), "done": True,
+                    "message": {"role": "assistant", "content": content}}
+        else:
+            self.send_error(404)
+            return
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    """새로 맺어진 연결 수를 세는 로컬 대역 서버"""
+    daemon_threads = True
+
+    def __init__(self, connect_delay: float = 0.0, response_delay: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _StandInHandler)
+        self.connect_delay = connect_delay
+        self.response_delay = response_delay
+        self.connections = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+def run_scenario(server: StandInServer, call: Callable[[], object], calls: int,
+                 threads: int) -> Dict[str, float]:
+    """
+    call을 calls번 실행하고 호출당 시간과 새로 맺어진 연결 수를 반환합니다.
+    """
+    llm_api.close_llm_clients()
+    server.connections = 0
+    start = time.perf_counter()
+    if threads > 1:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(lambda _: call(), range(calls)))
+    else:
+        results = [call() for _ in range(calls)]
+    seconds = time.perf_counter() - start
+    failures = sum(1 for r in results if not r)
+    return {"ms_per_call": 1000 * seconds / calls, "connections": server.connections,
+            "failures": failures}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 클라이언트 재사용 벤치마크")
+    parser.add_argument("--calls", type=int, default=200, help="시나리오별 호출 수")
+    parser.add_argument("--threads", type=int, default=1, help="동시 호출 스레드 수")
+    parser.add_argument("--connect-delay", type=float, default=20.0,
+                        help="새 연결마다 흉내 낼 핸드셰이크 지연 (ms)")
+    parser.add_argument("--response-delay", type=float, default=0.0,
+                        help="요청마다 흉내 낼 생성 지연 (ms)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    server = StandInServer(args.connect_delay / 1000, args.response_delay / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    ollama_url = f"{server.url}/api/chat"
+    payload = {"model": "standin", "messages": [{"role": "user", "content": "hi"}],
+               "stream": False}
+    scenarios: List = []
+    if llm_api.requests_available:
+        import requests
+        scenarios.append(("ollama: 호출마다 requests.post",
+                          lambda: requests.post(ollama_url, json=payload, timeout=30).json()))
+        scenarios.append(("ollama: 재사용 세션 (call_ollama_api)",
+                          lambda: llm_api.call_ollama_api("hi", model="standin",
+                                                          ollama_url=ollama_url)))
+    if llm_api.openai_available:
+        os.environ["OPENAI_BASE_URL"] = f"{server.url}/v1"
+        scenarios.append(("openai: 호출마다 OpenAI()",
+                          lambda: llm_api.OpenAI(api_key="standin", base_url=f"{server.url}/v1")
+                          .chat.completions.create(model="standin", max_tokens=10,
+                                                   messages=[{"role": "user", "content": "hi"}])))
+        scenarios.append(("openai: 재사용 클라이언트 (call_openai_api)",
+                          lambda: llm_api.call_openai_api("hi", model="standin",
+                                                          api_key="standin")))
+    else:
+        print("openai 라이브러리가 없어 OpenAI 시나리오는 건너뜁니다.")
+
+    print(f"{args.calls}회 호출, 스레드 {args.threads}개, 연결 지연 {args.connect_delay:.0f}ms")
+    print(f"{'시나리오':<44} {'ms/호출':>9} {'새 연결':>7} {'실패':>5}")
+    for name, call in scenarios:
+        result = run_scenario(server, call, args.calls, args.threads)
+        print(f"{name:<44} {result['ms_per_call']:9.2f} {result['connections']:7d} "
+              f"{result['failures']:5d}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,7 @@ import yaml
 import json
 import argparse
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from collections import defaultdict
 
 # 상위 디렉토리를 Python 경로에 추가
@@ -39,12 +39,13 @@ def setup_logging():
     )
 
 
-def check_yaml_syntax(file_path: str) -> Dict[str, Any]:
+def check_yaml_syntax(file_path: str, actionlint_result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     YAML 파일의 구문을 검증합니다.
     
     Args:
         file_path: 검증할 YAML 파일 경로
+        actionlint_result: 미리 실행한 actionlint 결과 (None이면 여기서 실행)
         
     Returns:
         Dict: 검증 결과
@@ -77,7 +78,8 @@ def check_yaml_syntax(file_path: str) -> Dict[str, Any]:
     
     # 2. actionlint 검증 (evaluator.py와 동일한 로직)
     try:
-        actionlint_result = process_runner.run_actionlint(file_path)
+        if actionlint_result is None:
+            actionlint_result = process_runner.run_actionlint(file_path)
         
         if actionlint_result.get('success', True):
             # 성공: 오류 없음
@@ -266,10 +268,13 @@ def main():
     print(f"\n파일 검증 중... (총 {len(yaml_files)}개)")
     print("-"*80)
     
+    # actionlint는 파일들을 묶어서 한 번에 실행
+    actionlint_results = process_runner.run_actionlint_batch([str(f) for f in yaml_files])
+    
     for i, yaml_file in enumerate(yaml_files, 1):
         logger.info(f"[{i}/{len(yaml_files)}] {yaml_file.name} 검증 중...")
         
-        result = check_yaml_syntax(str(yaml_file))
+        result = check_yaml_syntax(str(yaml_file), actionlint_results.get(str(yaml_file)))
         results.append(result)
         
         # 간단한 진행 상황 출력
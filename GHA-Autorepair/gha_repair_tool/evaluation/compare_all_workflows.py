@@ -39,6 +39,18 @@ class AllWorkflowsComparator:
         self.logger = logging.getLogger(__name__)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # 미리 묶어서 실행한 actionlint 결과 (파일 경로 -> run_actionlint 결과)
+        self.actionlint_results: Dict[str, Dict] = {}
+    
+    def prefetch_actionlint(self, file_pairs: List[Tuple[str, str]]):
+        """
+        파일 쌍들의 actionlint 결과를 run_actionlint_batch로 한 번에 구해 둡니다.
+        이미 검사한 파일(여러 step에 나오는 step1 파일 등)은 다시 검사하지 않습니다.
+        """
+        pending = [str(path) for pair in file_pairs for path in pair
+                   if str(path) not in self.actionlint_results]
+        if pending:
+            self.actionlint_results.update(process_runner.run_actionlint_batch(pending))
     
     def check_yaml_syntax(self, file_path: str) -> Tuple[bool, str]:
         """YAML 파싱 검증"""
@@ -63,7 +75,9 @@ class AllWorkflowsComparator:
             Tuple[valid, all_errors, syntax_errors, expression_errors]
         """
         try:
-            result = process_runner.run_actionlint(file_path)
+            result = self.actionlint_results.get(str(file_path))
+            if result is None:
+                result = process_runner.run_actionlint(file_path)
             
             if result.get('success', True):
                 return True, [], [], []
@@ -362,6 +376,7 @@ class AllWorkflowsComparator:
             self.logger.info(f"{'='*60}")
             
             step_results = []
+            self.prefetch_actionlint(file_pairs)
             
             for i, (step1_file, stepN_file) in enumerate(file_pairs, 1):
                 if i % 100 == 0 or i == 1:
@@ -480,6 +495,7 @@ class AllWorkflowsComparator:
             
             # 파일 평가
             step_results = []
+            self.prefetch_actionlint(file_pairs)
             
             for i, (step1_file, stepN_file) in enumerate(file_pairs, 1):
                 if i % 10 == 0 or i == 1:
@@ -87,13 +87,15 @@ class BaselineEvaluator:
         # 타겟 스멜 번호 (baseline과 동일)
         self.TARGET_SMELLS = {'1', '4', '5', '10', '11', '15', '16'}
         
-    def evaluate_file(self, original_file: str, repaired_file: str) -> EvaluationResult:
+    def evaluate_file(self, original_file: str, repaired_file: str,
+                      actionlint_result: Optional[Dict[str, Any]] = None) -> EvaluationResult:
         """
         단일 파일 쌍을 평가합니다.
         
         Args:
             original_file: 원본 YAML 파일 경로
             repaired_file: 수정된 YAML 파일 경로
+            actionlint_result: 수정된 파일의 actionlint 결과 (None이면 여기서 실행)
             
         Returns:
             EvaluationResult: 평가 결과
@@ -103,7 +105,8 @@ class BaselineEvaluator:
         
         try:
             # 1. 구문 성공률 평가
-            syntax_success, actionlint_errors = self._evaluate_syntax_success(repaired_file)
+            syntax_success, actionlint_errors = self._evaluate_syntax_success(repaired_file,
+                                                                              actionlint_result)
             
             # 2. 타겟 스멜 제거율 평가
             initial_smells, final_smells, removal_rate = self._evaluate_smell_removal(
@@ -151,12 +154,14 @@ class BaselineEvaluator:
                 error_message=str(e)
             )
     
-    def _evaluate_syntax_success(self, repaired_file: str) -> Tuple[bool, List[Dict]]:
-        """구문 성공률 평가"""
+    def _evaluate_syntax_success(self, repaired_file: str,
+                                 result: Optional[Dict[str, Any]] = None) -> Tuple[bool, List[Dict]]:
+        """구문 성공률 평가 (result: 미리 실행한 actionlint 결과)"""
         self.logger.debug(f"구문 검사 시작: {repaired_file}")
         
         # actionlint 실행
-        result = process_runner.run_actionlint(repaired_file)
+        if result is None:
+            result = process_runner.run_actionlint(repaired_file)
         
         if result.get("success", True):
             # 성공: 오류 없음
@@ -289,8 +294,13 @@ class BaselineEvaluator:
         total_edit_distance = 0.0
         successful_files_for_edit = 0
         
+        # 수정된 파일들은 actionlint 프로세스 몇 개로 묶어서 한 번에 검사
+        actionlint_results = process_runner.run_actionlint_batch(
+            [repaired_file for _, repaired_file in file_pairs])
+        
         for original_file, repaired_file in file_pairs:
-            result = self.evaluate_file(original_file, repaired_file)
+            result = self.evaluate_file(original_file, repaired_file,
+                                        actionlint_results.get(repaired_file))
             detailed_results.append(result)
             
             # 통계 누적
@@ -329,63 +329,43 @@ def run_two_phase_mode(input_path: str, output_path: str, use_guided_prompt: boo
         # Phase 2: Semantic Repair (smell detection → LLM)
         logger.info("=== Phase 2: 스멜 수정 ===")
         
-        # 6단계: 임시 파일로 Phase 1 결과 저장 (smell detection을 위해)
-        logger.info("6단계: 임시 파일 생성 및 스멜 검사")
-        temp_path = f"{input_path}_temp_phase1.yml"
+        # 6-7단계: Phase 1 결과를 파일로 저장하지 않고 메모리에서 smell detection 실행
+        # (이름 기반 휴리스틱에는 원본 파일 경로를 사용)
+        logger.info("6-7단계: Phase 1 결과 smell detection 실행")
+        from utils import process_runner
+        smell_result = process_runner.run_smell_detector(input_path, content=phase1_yaml)
+        smells = smell_result.get("smells", [])
         
-        try:
-            # 임시 파일 저장
-            success = yaml_parser.write_yaml_content(phase1_yaml, temp_path)
-            if not success:
-                logger.error("임시 파일 저장 실패")
+        if smells:
+            logger.info(f"스멜 {len(smells)}개 발견")
+            for i, smell in enumerate(smells[:3]):  # 처음 3개만 로그
+                logger.info(f"  스멜 {i+1}: {smell.get('description', 'N/A')}")
+            
+            # 8단계: 스멜 수정 프롬프트 생성
+            logger.info("8단계: 스멜 수정 프롬프트 생성")
+            semantic_prompt = create_semantic_repair_prompt(phase1_yaml, smells, use_guided_prompt)
+            
+            # 9단계: 스멜 수정 LLM 호출
+            logger.info("9단계: 스멜 수정 LLM 호출")
+            llm_response = llm_api.call_llm_with_retry(semantic_prompt, max_tokens=6000)
+            
+            if not llm_response:
+                logger.error("스멜 수정 LLM 호출 실패")
                 return False
             
-            # 7단계: smell detection 실행
-            logger.info("7단계: smell detection 실행")
-            from utils import process_runner
-            smell_result = process_runner.run_smell_detector(temp_path)
-            smells = smell_result.get("smells", [])
+            # 10단계: 최종 수정된 YAML 추출
+            logger.info("10단계: 최종 수정된 YAML 추출")
+            final_yaml = llm_api.extract_code_from_response(llm_response, "yaml")
+            
+            if not final_yaml:
+                logger.warning("YAML 코드 블록을 찾을 수 없음, 전체 응답 사용")
+                final_yaml = llm_response.strip()
+            
+            logger.info(f"Phase 2 완료, 최종 YAML 크기: {len(final_yaml)} 문자")
+        else:
+            logger.info("스멜 없음, Phase 2 건너뛰기")
+            final_yaml = phase1_yaml
             
-            if smells:
-                logger.info(f"스멜 {len(smells)}개 발견")
-                for i, smell in enumerate(smells[:3]):  # 처음 3개만 로그
-                    logger.info(f"  스멜 {i+1}: {smell.get('description', 'N/A')}")
-                
-                # 8단계: 스멜 수정 프롬프트 생성
-                logger.info("8단계: 스멜 수정 프롬프트 생성")
-                semantic_prompt = create_semantic_repair_prompt(phase1_yaml, smells, use_guided_prompt)
-                
-                # 9단계: 스멜 수정 LLM 호출
-                logger.info("9단계: 스멜 수정 LLM 호출")
-                llm_response = llm_api.call_llm_with_retry(semantic_prompt, max_tokens=6000)
-                
-                if not llm_response:
-                    logger.error("스멜 수정 LLM 호출 실패")
-                    return False
-                
-                # 10단계: 최종 수정된 YAML 추출
-                logger.info("10단계: 최종 수정된 YAML 추출")
-                final_yaml = llm_api.extract_code_from_response(llm_response, "yaml")
-                
-                if not final_yaml:
-                    logger.warning("YAML 코드 블록을 찾을 수 없음, 전체 응답 사용")
-                    final_yaml = llm_response.strip()
-                
-                logger.info(f"Phase 2 완료, 최종 YAML 크기: {len(final_yaml)} 문자")
-            else:
-                logger.info("스멜 없음, Phase 2 건너뛰기")
-                final_yaml = phase1_yaml
-                
-        finally:
-            # 임시 파일 삭제
-            import os
-            try:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-                    logger.debug(f"임시 파일 삭제: {temp_path}")
-            except Exception as e:
-                logger.warning(f"임시 파일 삭제 실패: {e}")
-        
         # 11단계: 최종 결과 검증 및 저장
         logger.info("11단계: 최종 결과 검증 및 저장")
         validation_result = yaml_parser.validate_github_actions_workflow(final_yaml)
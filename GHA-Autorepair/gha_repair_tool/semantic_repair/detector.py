@@ -67,19 +67,24 @@ def _run_custom_smell_detector(yaml_path: str) -> List[Dict[str, Any]]:
     logger = logging.getLogger(__name__)
     
     try:
-        # TODO: 기존 smell_detector 모듈과 연동
-        # 예시: gha_ci_detector 모듈 활용
+        # gha_ci_detector를 in-process로 실행 (대상 스멜만 반환됨)
+        result = process_runner.run_smell_detector(yaml_path)
         
-        # 임시 구현: 기존 프로젝트의 smell_detector 호출
-        command = f"python -m gha_ci_detector single {yaml_path}"
-        result = process_runner.run_command(command)
-        
-        if result['returncode'] != 0:
-            logger.warning(f"Custom smell detector 실행 실패: {result['stderr']}")
+        if not result['success']:
+            logger.warning(f"Custom smell detector 실행 실패: {result.get('error', '')}")
             return []
         
-        # TODO: smell_detector 출력을 파싱하여 구조화된 데이터로 변환
-        smells = _parse_custom_detector_output(result['stdout'])
+        smells = [
+            {
+                'smell_type': f"smell_{smell['id']}",
+                'line': smell.get('line') or 0,
+                'column': 0,
+                'message': smell['message'],
+                'severity': smell['severity'],
+                'detector': 'custom'
+            }
+            for smell in result['smells']
+        ]
         
         logger.info(f"Custom detector에서 {len(smells)}개 스멜 탐지")
         return smells
@@ -122,36 +127,6 @@ def _run_actionlint_semantic_check(yaml_path: str) -> List[Dict[str, Any]]:
         return []
 
 
-def _parse_custom_detector_output(output: str) -> List[Dict[str, Any]]:
-    """
-    커스텀 스멜 탐지기의 출력을 파싱합니다.
-    
-    Args:
-        output: 탐지기 출력
-        
-    Returns:
-        List[Dict]: 파싱된 스멜 정보
-    """
-    # TODO: 실제 smell_detector 출력 형식에 맞게 파싱 로직 구현
-    
-    smells = []
-    lines = output.strip().split('\n')
-    
-    for line in lines:
-        if 'smell' in line.lower() or 'warning' in line.lower():
-            # 간단한 파싱 예시
-            smells.append({
-                'smell_type': 'custom_detected',
-                'line': 0,
-                'column': 0,
-                'message': line.strip(),
-                'severity': 'medium',
-                'detector': 'custom'
-            })
-    
-    return smells
-
-
 def _parse_actionlint_semantic_output(output: str) -> List[Dict[str, Any]]:
     """
     actionlint의 의미론적 체크 출력을 파싱합니다.
@@ -52,17 +52,17 @@ def repair_syntax(input_yaml_path: str, use_guided_prompt: bool = True) -> Optio
             logger.error("LLM 수정 실패")
             return None
         
-        # 4. 수정된 내용을 임시 파일에 저장
-        temp_file = _save_to_temp_file(repaired_content)
-        
-        # 5. 수정된 파일을 다시 actionlint로 검증
-        logger.info("수정된 파일 검증 중...")
-        verification_errors = _detect_syntax_errors(temp_file)
+        # 4. 수정된 내용을 파일로 저장하지 않고 actionlint 표준 입력으로 검증
+        logger.info("수정된 내용 검증 중...")
+        verification_errors = _detect_syntax_errors(input_yaml_path, content=repaired_content)
         
         if verification_errors:
             logger.warning(f"수정 후에도 {len(verification_errors)}개의 오류가 남아있습니다.")
             # TODO: 재시도 로직 구현 가능
         
+        # 5. 검증이 끝난 결과만 파일로 저장
+        temp_file = _save_to_temp_file(repaired_content)
+        
         logger.info("구문 복구 완료")
         return temp_file
         
@@ -71,65 +71,33 @@ def repair_syntax(input_yaml_path: str, use_guided_prompt: bool = True) -> Optio
         return None
 
 
-def _detect_syntax_errors(yaml_path: str) -> list:
+def _detect_syntax_errors(yaml_path: str, content: Optional[str] = None) -> list:
     """
     actionlint를 사용하여 구문 오류를 탐지합니다.
     
     Args:
-        yaml_path: YAML 파일 경로
+        yaml_path: YAML 파일 경로 (content가 있으면 오류에 표시될 이름)
+        content: 검사할 YAML 내용 (None이면 파일을 검사)
         
     Returns:
         list: 오류 정보 리스트
+              예: [{"message": "...", "line": 10, "column": 5, "kind": "syntax-check"}]
     """
     logger = logging.getLogger(__name__)
     
     try:
-        # TODO: actionlint 실행 및 오류 정보 파싱
-        # 예시 명령어: actionlint -format '{{json .}}' workflow.yml
-        command = f"./actionlint -format '{{{{json .}}}}' {yaml_path}"
-        result = process_runner.run_command(command)
+        result = process_runner.run_actionlint(yaml_path, content=content)
         
-        if result['returncode'] == 0:
+        if result.get('success', False):
             return []  # 오류 없음
         
-        # TODO: JSON 출력을 파싱하여 구조화된 오류 정보 반환
-        errors = _parse_actionlint_output(result['stderr'])
-        return errors
+        return [error for error in result.get('errors', []) if isinstance(error, dict)]
         
     except Exception as e:
         logger.error(f"actionlint 실행 중 오류: {e}")
         return []
 
 
-def _parse_actionlint_output(output: str) -> list:
-    """
-    actionlint 출력을 파싱하여 구조화된 오류 정보로 변환합니다.
-    
-    Args:
-        output: actionlint의 stderr 출력
-        
-    Returns:
-        list: 파싱된 오류 정보 리스트
-    """
-    # TODO: actionlint JSON 출력 파싱 로직 구현
-    # 예상 구조: [{"message": "...", "line": 10, "column": 5, "kind": "..."}]
-    
-    errors = []
-    lines = output.strip().split('\n')
-    
-    for line in lines:
-        if line.strip():
-            # 간단한 파싱 예시 (실제로는 JSON 파싱 필요)
-            errors.append({
-                'message': line,
-                'line': 0,
-                'column': 0,
-                'kind': 'syntax'
-            })
-    
-    return errors
-
-
 def _generate_repair_prompt(yaml_path: str, errors: list, use_guided_prompt: bool) -> str:
     """
     수정을 위한 프롬프트를 생성합니다.
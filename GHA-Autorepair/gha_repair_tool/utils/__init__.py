@@ -8,7 +8,7 @@ from .yaml_parser import (
 )
 
 from .llm_api import (
-    LLMProvider, call_llm, call_llm_with_retry, call_llm_batch,
+    LLMProvider, call_llm, call_llm_with_retry, call_llm_batch, run_llm_batch,
     call_openai_api, call_ollama_api, call_openai, call_ollama,
     get_available_providers, create_workflow_repair_prompt
 )
@@ -27,7 +27,7 @@ __all__ = [
     'validate_github_actions_workflow',
     
     # llm_api
-    'call_llm', 'call_llm_with_retry', 'call_llm_batch', 'validate_llm_response',
+    'call_llm', 'call_llm_with_retry', 'call_llm_batch', 'run_llm_batch', 'validate_llm_response',
     'extract_code_from_response', 'format_prompt_for_repair', 'get_model_info',
     'estimate_token_cost',
     
@@ -0,0 +1,193 @@
+"""
+actionlint 결과 캐시 모듈
+
+같은 내용의 워크플로우를 여러 번 검사하지 않도록 actionlint 결과를 디스크에 저장합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import subprocess
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "gha_repair_tool",
+                                  "actionlint.sqlite3")
+
+
+class ActionlintCache:
+    """
+    actionlint 결과의 디스크 캐시입니다 (gha_ci_detector의 SmellCache와 같은 구조).
+
+    항목은 워크플로우 내용의 sha256, actionlint 바이너리 버전, 실행 옵션으로 구분됩니다.
+    오류의 filepath는 검사할 때마다 달라질 수 있으므로 비워서 저장하고 조회 시 채웁니다.
+    max_entries개 또는 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 100_000,
+                 max_bytes: int = 256 * 1024 * 1024):
+        self.path = path if path is not None else DEFAULT_CACHE_PATH
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if os.path.dirname(self.path) != "":
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # 여러 프로세스가 같은 파일을 사용하므로 쓰기가 끝날 때까지 기다림
+        self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS results ("
+                                     "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                                     "size INTEGER NOT NULL, last_used REAL NOT NULL)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS results_last_used "
+                                     "ON results (last_used)")
+            # 바이너리 버전 확인도 프로세스 실행이므로 파일 정보(경로, 크기, 수정 시각)별로 저장
+            self._connection.execute("CREATE TABLE IF NOT EXISTS binaries ("
+                                     "identity TEXT PRIMARY KEY, version TEXT NOT NULL)")
+
+    def binary_version(self, actionlint_path: str) -> Optional[str]:
+        """
+        actionlint 바이너리의 버전을 반환합니다 (`actionlint -version`의 첫 줄).
+
+        Args:
+            actionlint_path: actionlint 실행파일 경로
+
+        Returns:
+            Optional[str]: 버전 문자열 (확인할 수 없으면 None, 이 경우 캐시를 사용하지 않음)
+        """
+        try:
+            real_path = os.path.realpath(actionlint_path)
+            stat = os.stat(real_path)
+        except OSError:
+            return None
+        identity = f"{real_path}\0{stat.st_size}\0{stat.st_mtime_ns}"
+        with self._lock:
+            row = self._connection.execute("SELECT version FROM binaries WHERE identity = ?",
+                                           (identity,)).fetchone()
+        if row is not None:
+            return row[0]
+        try:
+            result = subprocess.run([actionlint_path, "-version"], capture_output=True,
+                                    text=True, encoding='utf-8', errors='replace', timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+        version = result.stdout.strip().split('\n')[0]
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO binaries VALUES (?, ?)",
+                                     (identity, version))
+        return version
+
+    @staticmethod
+    def key(content: bytes, version: str, flags: List[str]) -> str:
+        """
+        Args:
+            content: 워크플로우 내용
+            version: actionlint 바이너리 버전
+            flags: 파일 경로를 제외한 actionlint 실행 옵션
+
+        Returns:
+            str: 캐시 키
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+        return hashlib.sha256("\0".join([content_hash, version] + flags).encode()).hexdigest()
+
+    def get(self, key: str, filepath: str) -> Optional[Dict[str, Any]]:
+        """
+        저장된 결과를 반환합니다.
+
+        Args:
+            key: 캐시 키
+            filepath: 오류의 filepath에 채울 경로 (actionlint가 출력했을 경로)
+
+        Returns:
+            Optional[Dict]: run_actionlint와 같은 형식의 결과 (없으면 None)
+        """
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT value FROM results WHERE key = ?",
+                                           (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._connection.execute("UPDATE results SET last_used = ? WHERE key = ?",
+                                     (time.time(), key))
+        errors = json.loads(row[0])
+        for error in errors:
+            if "filepath" in error:
+                error["filepath"] = filepath
+        return {
+            "success": not errors,
+            "errors": errors,
+            "raw_output": json.dumps(errors) if errors else "",
+            "error_message": "actionlint found issues" if errors else "",
+            "execution_time": 0.0,
+            "cached": True
+        }
+
+    def put(self, key: str, errors: List[Dict[str, Any]]) -> None:
+        """
+        actionlint가 찾은 오류 목록을 저장합니다 (filepath는 비움).
+
+        Args:
+            key: 캐시 키
+            errors: 오류 딕셔너리 리스트 (오류가 없으면 빈 리스트)
+        """
+        data = json.dumps([{k: (None if k == "filepath" else v) for k, v in error.items()}
+                           for error in errors])
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                                     (key, data, len(data), time.time()))
+            self._evict()
+
+    def _evict(self) -> None:
+        (count, size) = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        while count > self.max_entries or size > self.max_bytes:
+            # 가득 찬 캐시가 저장할 때마다 삭제하지 않도록 오래된 10%를 한 번에 삭제
+            batch = max(1, count // 10)
+            self._connection.execute("DELETE FROM results WHERE key IN (SELECT key FROM results "
+                                     "ORDER BY last_used LIMIT ?)", (batch,))
+            (count, size) = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+# 프로세스당 한 번 여는 캐시 (None: 아직 생성 전, False: 비활성화)
+_actionlint_cache = None
+
+
+def get_actionlint_cache() -> Optional[ActionlintCache]:
+    """
+    run_actionlint가 사용할 결과 캐시를 반환합니다 (프로세스당 한 번 생성).
+
+    GHA_ACTIONLINT_CACHE 환경변수로 캐시 파일 경로를 지정하며, "off"로 설정하면 캐시를 사용하지 않습니다.
+
+    Returns:
+        ActionlintCache 또는 None (비활성화/생성 실패 시)
+    """
+    global _actionlint_cache
+    if _actionlint_cache is None:
+        cache_path = os.environ.get("GHA_ACTIONLINT_CACHE")
+        if cache_path is not None and cache_path.lower() in ("off", "0", "false", ""):
+            _actionlint_cache = False
+        else:
+            try:
+                _actionlint_cache = ActionlintCache(cache_path)
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"actionlint 결과 캐시를 사용할 수 없음: {e}")
+                _actionlint_cache = False
+    return _actionlint_cache or None
@@ -4,14 +4,19 @@ LLM API 호출 유틸리티 모듈
 OpenAI API와 Ollama API를 지원하여 다양한 LLM 모델을 사용할 수 있습니다.
 """
 
+import atexit
 import logging
 import os
 import re
-from typing import Optional, Dict, Any, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Callable, Tuple
 import json
 import time
 from enum import Enum
 
+from .llm_cache import get_llm_cache
+
 try:
     from openai import OpenAI
     openai_available = True
@@ -21,6 +26,7 @@ except ImportError:
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     requests_available = True
 except ImportError:
     requests_available = False
@@ -54,6 +60,108 @@ class LLMAPIError(Exception):
     pass
 
 
+# 제공자 클라이언트 재사용 (호출마다 TCP/TLS 연결을 새로 맺지 않도록 프로세스당 하나의
+# keep-alive 연결 풀을 유지하며, 여러 스레드가 같은 클라이언트를 함께 사용함)
+# LLM_POOL_MAXSIZE: 호스트당 유지할 연결 수 (기본 10)
+# LLM_KEEPALIVE_EXPIRY: 유휴 연결 유지 시간 (초, 기본 60, OpenAI만 해당)
+_clients: Dict[Tuple, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _client_settings() -> Tuple[int, float]:
+    """환경변수의 클라이언트 설정 (연결 풀 크기, keep-alive 유지 시간)"""
+    pool_maxsize = int(os.getenv("LLM_POOL_MAXSIZE", "10"))
+    keepalive_expiry = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60"))
+    return pool_maxsize, keepalive_expiry
+
+
+def _get_client(key: Tuple, factory: Callable[[], Any]) -> Any:
+    """
+    key에 해당하는 클라이언트를 반환하고, 없으면 factory로 만들어 보관합니다.
+    
+    Args:
+        key: 클라이언트 구분 키 (제공자, 인증 정보, 설정)
+        factory: 클라이언트 생성 함수
+        
+    Returns:
+        Any: 재사용되는 클라이언트
+    """
+    with _clients_lock:
+        if key not in _clients:
+            _clients[key] = factory()
+        return _clients[key]
+
+
+def get_openai_client(api_key: str, base_url: Optional[str] = None) -> "OpenAI":
+    """
+    재사용되는 OpenAI 클라이언트를 반환합니다.
+    
+    Args:
+        api_key: API 키
+        base_url: API 주소 (None이면 OPENAI_BASE_URL 환경변수 또는 기본 주소)
+        
+    Returns:
+        OpenAI: 연결 풀을 공유하는 클라이언트
+    """
+    pool_maxsize, keepalive_expiry = _client_settings()
+    base_url = base_url or os.getenv("OPENAI_BASE_URL") or None
+    
+    def create():
+        import openai
+        limit_options = dict(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize,
+                             keepalive_expiry=keepalive_expiry)
+        if hasattr(openai, "DefaultHttpxClient") and hasattr(openai, "DEFAULT_CONNECTION_LIMITS"):
+            # openai가 제공하는 기본 설정(타임아웃, 리다이렉트)을 유지하면서 연결 풀만 조정
+            # (Limits 클래스는 openai가 사용하는 HTTP 라이브러리의 것을 그대로 사용)
+            limits_class = type(openai.DEFAULT_CONNECTION_LIMITS)
+            http_client = openai.DefaultHttpxClient(limits=limits_class(**limit_options))
+        else:
+            # DefaultHttpxClient가 없는 openai 1.0.x: httpx 클라이언트를 직접 생성
+            import httpx
+            http_client = httpx.Client(limits=httpx.Limits(**limit_options),
+                                       timeout=getattr(openai, "DEFAULT_TIMEOUT", 600),
+                                       follow_redirects=True)
+        logging.getLogger(__name__).debug(f"OpenAI 클라이언트 생성 (연결 풀: {pool_maxsize})")
+        return OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+    
+    return _get_client(("openai", api_key, base_url, pool_maxsize, keepalive_expiry), create)
+
+
+def get_ollama_session() -> "requests.Session":
+    """
+    재사용되는 requests 세션을 반환합니다 (Ollama API 호출용).
+    
+    Returns:
+        requests.Session: keep-alive 연결 풀을 가진 세션
+    """
+    pool_maxsize, _ = _client_settings()
+    
+    def create():
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        logging.getLogger(__name__).debug(f"Ollama 세션 생성 (연결 풀: {pool_maxsize})")
+        return session
+    
+    return _get_client(("ollama", pool_maxsize), create)
+
+
+def close_llm_clients() -> None:
+    """보관 중인 모든 클라이언트의 연결을 닫습니다 (다음 호출 시 다시 생성)."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+atexit.register(close_llm_clients)
+
+
 def call_openai_api(
     prompt: str,
     model: str = "gpt-4o-mini",
@@ -84,8 +192,8 @@ def call_openai_api(
         # API 키 우선순위: 파라미터 > 환경변수 > 기본값
         final_api_key = api_key or os.getenv("OPENAI_API_KEY") or ""
         
-        # OpenAI 클라이언트 생성
-        client = OpenAI(api_key=final_api_key)
+        # 프로세스에서 재사용되는 OpenAI 클라이언트
+        client = get_openai_client(final_api_key)
         
         logger.info(f"OpenAI API 호출 시작 (모델: {model})")
         
@@ -168,7 +276,8 @@ def call_ollama_api(
     try:
         logger.info(f"Ollama API 호출 시작 (모델: {model}, URL: {ollama_url})")
         
-        response = requests.post(ollama_url, json=payload, timeout=timeout)
+        # keep-alive 연결을 재사용하는 세션으로 요청
+        response = get_ollama_session().post(ollama_url, json=payload, timeout=timeout)
         response.raise_for_status()
         
         result = response.json()
@@ -295,57 +404,177 @@ def call_llm_with_retry(
     return None
 
 
-def call_llm_batch(
+class TokenBucket:
+    """
+    분당 속도 제한을 위한 토큰 버킷 (스레드 안전).
+    
+    토큰은 rate_per_minute / 60 속도로 capacity까지 채워집니다.
+    capacity보다 큰 요청도 버킷이 가득 차면 통과시키고 부족분은 이후 요청이 기다리게 하여
+    장기적으로 rate_per_minute를 넘지 않습니다.
+    """
+    
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        if rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute는 0보다 커야 합니다: {rate_per_minute}")
+        self.rate = rate_per_minute / 60.0
+        # 기본 버스트는 1초 분량 (제공자가 분당 한도를 더 짧은 구간으로 나눠 적용하는 경우 대비)
+        self.capacity = capacity if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, amount: float = 1.0) -> float:
+        """
+        amount만큼의 토큰을 사용할 수 있을 때까지 기다립니다.
+        
+        Args:
+            amount: 사용할 토큰 수
+            
+        Returns:
+            float: 기다린 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= min(amount, self.capacity):
+                    self._tokens -= amount
+                    return waited
+                wait = (min(amount, self.capacity) - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+def _rate_limit_from_env(value: Optional[float], env_name: str) -> Optional[float]:
+    """인자가 없으면 환경변수에서 분당 한도를 읽습니다 (없거나 0이면 제한 없음)."""
+    if value is None:
+        value = float(os.getenv(env_name, "0") or 0)
+    return value if value > 0 else None
+
+
+def run_llm_batch(
     prompts: List[str],
-    batch_size: int = 5,
-    delay_between_batches: float = 1.0,
+    max_concurrency: int = 5,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+    max_retries: int = 0,
+    retry_delay: float = 1.0,
     **kwargs
-) -> List[Optional[str]]:
+) -> List[Dict[str, Any]]:
     """
-    여러 프롬프트를 배치로 처리합니다.
+    여러 프롬프트를 동시에 최대 max_concurrency개씩 처리합니다.
+    
+    요청 시작은 분당 요청 수(RPM)와 분당 토큰 수(TPM) 토큰 버킷으로 제한되며,
+    토큰 수는 estimate_token_cost와 같은 방식(프롬프트 4글자당 1토큰 + max_tokens)으로 추정합니다.
+    max_concurrency가 LLM_POOL_MAXSIZE보다 크면 초과한 연결은 keep-alive로 재사용되지 않습니다.
     
     Args:
         prompts: 프롬프트 리스트
-        batch_size: 배치 크기
-        delay_between_batches: 배치 간 지연 시간 (초)
+        max_concurrency: 동시에 진행할 최대 요청 수
+        requests_per_minute: 분당 최대 요청 수 (None이면 LLM_RPM 환경변수, 없으면 제한 없음)
+        tokens_per_minute: 분당 최대 토큰 수 (None이면 LLM_TPM 환경변수, 없으면 제한 없음)
+        max_retries: 프롬프트별 최대 재시도 횟수 (재시도도 속도 제한을 따름)
+        retry_delay: 재시도 간격 (초, 지수 백오프)
         **kwargs: call_llm에 전달될 추가 인자들
         
     Returns:
-        List[Optional[str]]: 응답 리스트
+        List[Dict]: 프롬프트 순서대로 정렬된 결과
+            (index, success, response, error, cached, attempts, wait_time, execution_time)
     """
     logger = logging.getLogger(__name__)
     
-    results = []
+    rpm = _rate_limit_from_env(requests_per_minute, "LLM_RPM")
+    tpm = _rate_limit_from_env(tokens_per_minute, "LLM_TPM")
+    request_bucket = TokenBucket(rpm) if rpm else None
+    token_bucket = TokenBucket(tpm) if tpm else None
+    max_tokens = kwargs.get("max_tokens", 2000)
     total_prompts = len(prompts)
+    results: List[Optional[Dict[str, Any]]] = [None] * total_prompts
     
-    logger.info(f"배치 LLM 호출 시작: {total_prompts}개 프롬프트, 배치 크기: {batch_size}")
-    
-    for i in range(0, total_prompts, batch_size):
-        batch = prompts[i:i + batch_size]
-        batch_results = []
-        
-        logger.info(f"배치 {i//batch_size + 1} 처리 중: {len(batch)}개 프롬프트")
-        
-        for j, prompt in enumerate(batch):
-            logger.debug(f"  프롬프트 {i + j + 1}/{total_prompts} 처리 중...")
-            result = call_llm(prompt, **kwargs)
-            batch_results.append(result)
-            
-            # 배치 내 요청 간 지연 (API 레이트 제한 방지)
-            if j < len(batch) - 1:
-                time.sleep(0.1)
+    def process(index: int) -> None:
+        prompt = prompts[index]
+        estimated_tokens = len(prompt) // 4 + max_tokens
+        result = {"index": index, "success": False, "response": None, "error": "",
+                  "cached": False, "attempts": 0, "wait_time": 0.0, "execution_time": 0.0}
         
-        results.extend(batch_results)
+        def acquire() -> None:
+            # 응답 캐시에 없어 실제로 API를 호출할 때만 속도 제한 토큰을 사용
+            result["cached"] = False
+            if request_bucket:
+                result["wait_time"] += request_bucket.acquire(1)
+            if token_bucket:
+                result["wait_time"] += token_bucket.acquire(estimated_tokens)
         
-        # 배치 간 지연
-        if i + batch_size < total_prompts:
-            logger.info(f"다음 배치 전 {delay_between_batches}초 대기...")
-            time.sleep(delay_between_batches)
-    
-    logger.info(f"배치 LLM 호출 완료: {len(results)}개 응답")
+        delay = retry_delay
+        start_time = time.time()
+        for attempt in range(max_retries + 1):
+            result["attempts"] = attempt + 1
+            result["cached"] = True
+            try:
+                response = _call_llm(prompt, before_request=acquire, **kwargs)
+                if response:
+                    result.update(success=True, response=response, error="")
+                    break
+                result["error"] = "LLM 응답 없음"
+            except Exception as e:
+                result["error"] = str(e)
+            if attempt < max_retries:
+                logger.warning(f"프롬프트 {index + 1} 실패 ({result['error']}), {delay}초 후 재시도 "
+                               f"({attempt + 1}/{max_retries})")
+                time.sleep(delay)
+                delay *= 2
+        result["execution_time"] = time.time() - start_time
+        results[index] = result
+    
+    logger.info(f"배치 LLM 호출 시작: {total_prompts}개 프롬프트, 동시 요청: {max_concurrency}, "
+                f"RPM: {rpm or '제한 없음'}, TPM: {tpm or '제한 없음'}")
+    start_time = time.time()
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency),
+                            thread_name_prefix="llm-batch") as executor:
+        for future in [executor.submit(process, i) for i in range(total_prompts)]:
+            future.result()
+    elapsed = time.time() - start_time
+    
+    failed = [r for r in results if not r["success"]]
+    cached = sum(1 for r in results if r["success"] and r["cached"])
+    throughput = total_prompts / elapsed * 60 if elapsed > 0 else 0.0
+    logger.info(f"배치 LLM 호출 완료: {total_prompts - len(failed)}개 성공 (캐시 {cached}개), "
+                f"{len(failed)}개 실패, {elapsed:.1f}초 ({throughput:.0f}개/분)")
+    for r in failed:
+        logger.error(f"  프롬프트 {r['index'] + 1} 실패: {r['error']}")
     return results
 
 
+def call_llm_batch(
+    prompts: List[str],
+    batch_size: int = 5,
+    delay_between_batches: float = 1.0,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+    **kwargs
+) -> List[Optional[str]]:
+    """
+    여러 프롬프트를 동시에 처리합니다 (run_llm_batch 참고).
+    
+    Args:
+        prompts: 프롬프트 리스트
+        batch_size: 동시에 진행할 최대 요청 수
+        delay_between_batches: 하위 호환용 (사용하지 않음, 속도는 RPM/TPM으로 제한)
+        requests_per_minute: 분당 최대 요청 수 (None이면 LLM_RPM 환경변수)
+        tokens_per_minute: 분당 최대 토큰 수 (None이면 LLM_TPM 환경변수)
+        **kwargs: run_llm_batch 또는 call_llm에 전달될 추가 인자들
+        
+    Returns:
+        List[Optional[str]]: 프롬프트 순서대로의 응답 리스트 (실패한 프롬프트는 None)
+    """
+    results = run_llm_batch(prompts, max_concurrency=batch_size,
+                            requests_per_minute=requests_per_minute,
+                            tokens_per_minute=tokens_per_minute, **kwargs)
+    return [r["response"] for r in results]
+
+
 # 하위 호환성을 위한 별칭 함수들
 def call_openai(prompt: str, **kwargs) -> Optional[str]:
     """OpenAI API 호출 (하위 호환성)"""
@@ -624,6 +853,7 @@ def call_llm(
     - export LLM_PROVIDER=ollama
     - export OLLAMA_MODEL=llama3.1:8b
     - export OLLAMA_URL=http://115.145.178.160:11434/api/chat
+    - export GHA_LLM_CACHE=on  # 응답 캐시 사용 (utils.llm_cache 참고)
     
     Args:
         prompt: 프롬프트
@@ -635,6 +865,20 @@ def call_llm(
     Returns:
         Optional[str]: LLM 응답
     """
+    return _call_llm(prompt, model, max_tokens, temperature, api_key)
+
+
+def _call_llm(
+    prompt: str,
+    model: str = None,
+    max_tokens: int = 2000,
+    temperature: float = 0.1,
+    api_key: Optional[str] = None,
+    before_request: Optional[Callable[[], None]] = None
+) -> Optional[str]:
+    """
+    call_llm 본체. 응답 캐시를 먼저 조회하고, 없을 때만 before_request 실행 후 API를 호출합니다.
+    """
     logger = logging.getLogger(__name__)
     provider = _get_current_provider()
     
@@ -645,13 +889,14 @@ def call_llm(
         
         logger.info(f"OpenAI 모델 사용: {model}")
         
-        return call_openai_api(
-            prompt=prompt,
-            model=model,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            api_key=api_key
-        )
+        def request():
+            return call_openai_api(
+                prompt=prompt,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                api_key=api_key
+            )
     
     elif provider == LLMProvider.OLLAMA:
         if model is None:
@@ -660,21 +905,39 @@ def call_llm(
             model_key = model
         
         # 실제 모델명 가져오기
-        actual_model = OLLAMA_MODELS.get(model_key, model_key)
+        model = OLLAMA_MODELS.get(model_key, model_key)
         ollama_url = os.getenv("OLLAMA_URL", "http://115.145.178.160:11434/api/chat")
-        logger.info(f"Ollama 모델 사용: {model_key} -> {actual_model}")
+        logger.info(f"Ollama 모델 사용: {model_key} -> {model}")
         
-        return call_ollama_api(
-            prompt=prompt,
-            model=actual_model,
-            ollama_url=ollama_url,
-            temperature=temperature,
-            timeout=300
-        )
+        def request():
+            return call_ollama_api(
+                prompt=prompt,
+                model=model,
+                ollama_url=ollama_url,
+                temperature=temperature,
+                timeout=300
+            )
     
     else:
         logger.error(f"지원되지 않는 LLM 제공자: {provider}")
         return None
+    
+    # 같은 제공자/모델/프롬프트/설정의 응답이 캐시에 있으면 API를 호출하지 않음
+    cache = get_llm_cache()
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.key(provider.value, model, prompt, max_tokens, temperature)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("LLM 응답 캐시 사용")
+            return cached
+    
+    if before_request is not None:
+        before_request()
+    response = request()
+    if cache is not None and response:
+        cache.put(cache_key, response)
+    return response
 
 
 # 사용 예시 및 도움말
@@ -0,0 +1,191 @@
+"""
+LLM 응답 캐시 모듈
+
+같은 프롬프트와 설정으로 LLM을 다시 호출하지 않도록 응답을 디스크에 압축 저장합니다.
+실험 재실행용이므로 기본적으로 꺼져 있으며 GHA_LLM_CACHE 환경변수로 켭니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+from urllib.request import pathname2url
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "gha_repair_tool",
+                                  "llm_responses.sqlite3")
+
+# readwrite: 조회 후 없으면 호출하고 저장, readonly: 조회만 (저장하지 않음),
+# refresh: 조회하지 않고 호출 결과로 덮어씀
+CACHE_MODES = ("readwrite", "readonly", "refresh")
+
+
+class LLMResponseCache:
+    """
+    LLM 응답의 디스크 캐시입니다 (ActionlintCache와 같은 구조).
+
+    항목은 제공자, 모델, 프롬프트 전체, max_tokens, temperature의 해시로 구분되며
+    응답은 zlib으로 압축해 저장합니다. ttl초가 지난 항목은 없는 것으로 처리하고,
+    max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, mode: str = "readwrite",
+                 ttl: Optional[float] = None, max_bytes: int = 512 * 1024 * 1024):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"지원되지 않는 캐시 모드: {mode} (가능한 값: {', '.join(CACHE_MODES)})")
+        self.path = path if path is not None else DEFAULT_CACHE_PATH
+        self.mode = mode
+        self.ttl = ttl if ttl else None
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if mode == "readonly":
+            # 공유된 캐시 파일을 수정하지 않도록 읽기 전용으로 엶 (파일이 없으면 오류)
+            uri = f"file:{pathname2url(os.path.abspath(self.path))}?mode=ro"
+            self._connection = sqlite3.connect(uri, uri=True,
+                                               timeout=30, check_same_thread=False)
+            return
+        if os.path.dirname(self.path) != "":
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS responses ("
+                                     "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                                     "size INTEGER NOT NULL, created REAL NOT NULL, "
+                                     "last_used REAL NOT NULL)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS responses_last_used "
+                                     "ON responses (last_used)")
+
+    @staticmethod
+    def key(provider: str, model: str, prompt: str, max_tokens: int, temperature: float) -> str:
+        """
+        Args:
+            provider: LLM 제공자 ("openai", "ollama")
+            model: 실제 호출되는 모델명
+            prompt: 프롬프트 전체
+            max_tokens: 최대 토큰 수
+            temperature: 응답의 랜덤성
+
+        Returns:
+            str: 캐시 키
+        """
+        data = json.dumps([provider, model, prompt, max_tokens, float(temperature)],
+                          ensure_ascii=False)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        저장된 응답을 반환합니다 (refresh 모드에서는 항상 None).
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[str]: 응답 (없거나 만료되었으면 None)
+        """
+        if self.mode == "refresh":
+            self.misses += 1
+            return None
+        with self._lock:
+            row = self._connection.execute("SELECT value, created FROM responses WHERE key = ?",
+                                           (key,)).fetchone()
+            if row is None or (self.ttl is not None and time.time() - row[1] > self.ttl):
+                self.misses += 1
+                return None
+            self.hits += 1
+            if self.mode != "readonly":
+                with self._connection:
+                    self._connection.execute("UPDATE responses SET last_used = ? WHERE key = ?",
+                                             (time.time(), key))
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, key: str, response: str) -> None:
+        """
+        응답을 저장합니다 (readonly 모드에서는 저장하지 않음).
+
+        Args:
+            key: 캐시 키
+            response: LLM 응답
+        """
+        if self.mode == "readonly":
+            return
+        data = zlib.compress(response.encode("utf-8"))
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                                     (key, data, len(data), now, now))
+            self._evict()
+
+    def _evict(self) -> None:
+        if self.ttl is not None:
+            self._connection.execute("DELETE FROM responses WHERE created < ?",
+                                     (time.time() - self.ttl,))
+        (count, size) = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        while size > self.max_bytes:
+            # 가득 찬 캐시가 저장할 때마다 삭제하지 않도록 오래된 10%를 한 번에 삭제
+            batch = max(1, count // 10)
+            self._connection.execute("DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                                     "ORDER BY last_used LIMIT ?)", (batch,))
+            (count, size) = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+# 프로세스당 한 번 여는 캐시 (None: 아직 생성 전, False: 비활성화)
+_llm_cache = None
+# run_llm_batch의 여러 스레드가 동시에 처음 호출해도 캐시를 하나만 만들도록 함
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """
+    call_llm이 사용할 응답 캐시를 반환합니다 (프로세스당 한 번 생성).
+
+    환경변수:
+    - GHA_LLM_CACHE: 캐시 파일 경로, 또는 "on"/"1"이면 기본 경로 (설정하지 않으면 사용하지 않음)
+    - GHA_LLM_CACHE_MODE: readwrite(기본), readonly, refresh
+    - GHA_LLM_CACHE_TTL: 항목 유효 시간 (초, 0이면 만료 없음)
+    - GHA_LLM_CACHE_MAX_MB: 압축된 응답의 최대 총 크기 (MB, 기본 512)
+
+    Returns:
+        LLMResponseCache 또는 None (비활성화/생성 실패 시)
+    """
+    global _llm_cache
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = _create_llm_cache()
+    return _llm_cache or None
+
+
+def _create_llm_cache():
+    """환경변수 설정으로 캐시를 생성합니다 (비활성화/생성 실패 시 False)."""
+    cache_path = os.environ.get("GHA_LLM_CACHE", "")
+    if cache_path.lower() in ("off", "0", "false", ""):
+        return False
+    if cache_path.lower() in ("on", "1", "true"):
+        cache_path = None
+    try:
+        return LLMResponseCache(
+            cache_path,
+            mode=os.environ.get("GHA_LLM_CACHE_MODE", "readwrite").lower(),
+            ttl=float(os.environ.get("GHA_LLM_CACHE_TTL", "0") or 0),
+            max_bytes=int(float(os.environ.get("GHA_LLM_CACHE_MAX_MB", "512")) * 1024 * 1024)
+        )
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"LLM 응답 캐시를 사용할 수 없음: {e}")
+        return False
@@ -4,12 +4,220 @@
 외부 명령어 실행 및 subprocess 관리를 담당합니다.
 """
 
+import asyncio
 import logging
 import subprocess
 import os
 import tempfile
 import shlex
-from typing import Dict, Any, Optional, List, Union
+import sys
+import json
+import queue
+import threading
+import types
+import collections
+from typing import Dict, Any, Optional, List, Tuple, Union
+
+
+# 대상 스멜 번호 (gha-ci-detector_paper 기준)
+TARGET_SMELLS = {'1', '4', '5', '10', '11', '15', '16'}
+
+# in-process로 사용할 smell detector 소스 경로
+DEFAULT_SMELL_DETECTOR_SRC = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    "RQ3", "gha-ci-detector_paper", "src"
+)
+
+
+# 자식 프로세스 자원 사용량 집계 (enable_resource_accounting 참고)
+_resource_accounting = os.environ.get("GHA_RESOURCE_USAGE", "").lower() in ("1", "true", "on")
+_resource_totals: Dict[str, Dict[str, float]] = {}
+_resource_totals_lock = threading.Lock()
+
+
+def enable_resource_accounting(enabled: bool = True) -> None:
+    """
+    run_command 결과에 자식 프로세스의 자원 사용량을 포함하고 단계별로 합산할지 설정합니다.
+    
+    GHA_RESOURCE_USAGE=1 환경변수로도 켤 수 있습니다.
+    
+    Args:
+        enabled: 사용 여부
+    """
+    global _resource_accounting
+    _resource_accounting = enabled
+
+
+def _max_rss_kb(ru_maxrss: int) -> int:
+    """ru_maxrss를 KB 단위로 변환합니다 (macOS는 바이트, Linux는 KB)."""
+    return ru_maxrss // 1024 if sys.platform == "darwin" else ru_maxrss
+
+
+def record_resource_usage(stage: str, usage: Dict[str, float], wall_time: float) -> None:
+    """
+    한 번의 실행 자원 사용량을 단계별 합계에 더합니다.
+    
+    Args:
+        stage: 단계 이름 (예: "actionlint", "smell_detector")
+        usage: run_command 결과의 "resource_usage"
+        wall_time: 실행 시간 (초)
+    """
+    with _resource_totals_lock:
+        totals = _resource_totals.setdefault(stage, {
+            "calls": 0, "wall_time": 0.0, "user_time": 0.0, "system_time": 0.0,
+            "wait_time": 0.0, "max_rss_kb": 0
+        })
+        totals["calls"] += 1
+        totals["wall_time"] += wall_time
+        for key in ("user_time", "system_time", "wait_time"):
+            totals[key] += usage.get(key, 0.0)
+        totals["max_rss_kb"] = max(totals["max_rss_kb"], usage.get("max_rss_kb", 0))
+
+
+def get_resource_usage_summary(reset: bool = False) -> Dict[str, Dict[str, float]]:
+    """
+    단계별 자원 사용량 합계를 반환합니다.
+    
+    Args:
+        reset: 반환 후 합계를 초기화할지 여부
+        
+    Returns:
+        Dict: 단계 이름별 {"calls", "wall_time", "user_time", "system_time",
+              "wait_time", "max_rss_kb" (최댓값)}
+    """
+    with _resource_totals_lock:
+        summary = {stage: dict(totals) for stage, totals in _resource_totals.items()}
+        if reset:
+            _resource_totals.clear()
+    return summary
+
+
+def format_resource_usage_summary(summary: Dict[str, Dict[str, float]]) -> List[str]:
+    """
+    get_resource_usage_summary 결과를 로그용 줄 리스트로 변환합니다.
+    
+    Returns:
+        List[str]: 단계별 한 줄 (CPU 시간이 실행 시간보다 많이 작으면 대기/I/O 시간이 큼)
+    """
+    lines = []
+    for stage, totals in sorted(summary.items()):
+        lines.append(
+            f"{stage}: {int(totals['calls'])}회, 실행 {totals['wall_time']:.2f}초, "
+            f"CPU user {totals['user_time']:.2f}초 / sys {totals['system_time']:.2f}초, "
+            f"대기 {totals['wait_time']:.2f}초, 최대 RSS {totals['max_rss_kb'] / 1024:.1f}MB"
+        )
+    return lines
+
+
+def _thread_rusage():
+    """
+    현재 스레드의 자원 사용량을 반환합니다 (RUSAGE_THREAD가 없으면 프로세스 전체, 불가능하면 None).
+    최대 RSS는 항상 프로세스 전체 기준입니다.
+    """
+    try:
+        import resource
+        return resource.getrusage(getattr(resource, "RUSAGE_THREAD", resource.RUSAGE_SELF))
+    except (ImportError, OSError):
+        return None
+
+
+def _run_with_rusage(cmd_args, cwd, timeout, capture_output, shell, input_text):
+    """
+    subprocess.run과 같이 실행하고 (CompletedProcess, rusage)를 반환합니다.
+    
+    communicate는 종료된 자식 프로세스를 회수하면서 rusage를 버리므로, 파이프는 스레드로
+    읽고 쓰고 자식 프로세스는 os.wait4로 직접 회수합니다.
+    """
+    pipe = subprocess.PIPE if capture_output else None
+    process = subprocess.Popen(
+        cmd_args,
+        cwd=cwd,
+        stdin=subprocess.PIPE if input_text is not None else None,
+        stdout=pipe,
+        stderr=pipe,
+        shell=shell,
+        text=True,
+        encoding='utf-8',
+        errors='replace'
+    )
+    outputs = {"stdout": None, "stderr": None}
+    
+    def read(name, stream):
+        with stream:
+            outputs[name] = stream.read()
+    
+    def write(stream):
+        try:
+            with stream:
+                stream.write(input_text)
+        except BrokenPipeError:
+            # 입력을 다 읽지 않고 종료한 경우 (communicate와 동일하게 무시)
+            pass
+    
+    threads = []
+    if process.stdin is not None:
+        threads.append(threading.Thread(target=write, args=(process.stdin,), daemon=True))
+    for name in ("stdout", "stderr"):
+        if getattr(process, name) is not None:
+            stream = getattr(process, name)
+            threads.append(threading.Thread(target=read, args=(name, stream), daemon=True))
+    
+    # 타임아웃 시 종료시키되, 이미 회수된(다른 프로세스가 재사용했을 수 있는) pid에는 신호를 보내지 않음
+    reap_lock = threading.Lock()
+    state = {"reaped": False, "timed_out": False}
+    
+    def kill():
+        with reap_lock:
+            if not state["reaped"]:
+                state["timed_out"] = True
+                process.kill()
+    
+    def reap(options):
+        # 잠금 안에서만 회수해야 kill이 회수된 pid에 신호를 보내지 않음
+        with reap_lock:
+            (pid, status, rusage) = os.wait4(process.pid, options)
+            if pid == 0:
+                return None
+            state["reaped"] = True
+            return status, rusage
+    
+    timer = threading.Timer(timeout, kill) if timeout else None
+    if timer is not None:
+        timer.daemon = True
+        timer.start()
+    reaped = None
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if hasattr(os, "waitid"):
+            # 회수하지 않고 종료만 기다린 뒤 잠금 안에서 회수
+            os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT)
+            reaped = reap(0)
+        else:
+            # waitid가 없으면 (macOS) 잠금 밖에서 기다려야 타이머가 kill할 수 있으므로 폴링
+            import time
+            delay = 0.0005
+            while (reaped := reap(os.WNOHANG)) is None:
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
+    finally:
+        if timer is not None:
+            timer.cancel()
+        if reaped is None:
+            # 예외로 빠져나가는 경우에도 자식 프로세스를 남기지 않음
+            with reap_lock:
+                if not state["reaped"]:
+                    process.kill()
+                    os.wait4(process.pid, 0)
+                    state["reaped"] = True
+    (status, rusage) = reaped
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if state["timed_out"]:
+        raise subprocess.TimeoutExpired(cmd_args, timeout, outputs["stdout"], outputs["stderr"])
+    return (subprocess.CompletedProcess(cmd_args, process.returncode, outputs["stdout"],
+                                        outputs["stderr"]), rusage)
 
 
 def run_command(
@@ -17,17 +225,26 @@ def run_command(
     cwd: Optional[str] = None,
     timeout: int = 30,
     capture_output: bool = True,
-    shell: bool = False
+    shell: bool = False,
+    input_text: Optional[str] = None,
+    resource_usage: Optional[bool] = None,
+    stage: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     외부 명령어를 실행합니다.
     
+    동시에 실행되는 프로세스 수는 스레드와 run_command_async를 합쳐
+    max_concurrent_processes()로 제한됩니다 (타임아웃은 프로세스 시작 시점부터).
+    
     Args:
         command: 실행할 명령어 (문자열 또는 리스트)
         cwd: 작업 디렉토리
         timeout: 타임아웃 (초)
         capture_output: 출력 캡처 여부
         shell: 셸 사용 여부
+        input_text: 표준 입력으로 전달할 내용 (None이면 입력 없음)
+        resource_usage: 자원 사용량 수집 여부 (None이면 enable_resource_accounting 설정을 따름)
+        stage: 자원 사용량을 합산할 단계 이름 (None이면 실행 파일 이름)
         
     Returns:
         Dict: 실행 결과
@@ -37,13 +254,21 @@ def run_command(
                   "stderr": str,
                   "success": bool,
                   "command": str,
-                  "execution_time": float
+                  "execution_time": float,
+                  "resource_usage": {  # 자원 사용량 수집 시 (os.wait4 기준)
+                      "user_time": float, "system_time": float, "max_rss_kb": int,
+                      "wait_time": float  # 실행 슬롯을 기다린 시간 (execution_time에 포함되지 않음)
+                  }  # Linux의 max_rss_kb는 fork 시점 부모 프로세스의 RSS보다 작게 나오지 않음
               }
     """
     logger = logging.getLogger(__name__)
     
     import time
-    start_time = time.time()
+    queued_time = start_time = time.time()
+    if resource_usage is None:
+        resource_usage = _resource_accounting
+    # os.wait4가 없는 플랫폼(Windows)에서는 수집하지 않음
+    resource_usage = resource_usage and hasattr(os, "wait4")
     
     try:
         # 명령어 문자열 처리
@@ -60,17 +285,29 @@ def run_command(
         
         logger.info(f"명령어 실행: {cmd_for_log}")
         
-        # 프로세스 실행
-        result = subprocess.run(
-            cmd_args,
-            cwd=cwd,
-            timeout=timeout,
-            capture_output=capture_output,
-            shell=shell,
-            text=True,
-            encoding='utf-8',
-            errors='replace'
-        )
+        # 프로세스 실행 (동시 실행 수는 max_concurrent_processes()로 제한)
+        rusage = None
+        slots = _process_slots()
+        slots.acquire()
+        try:
+            start_time = time.time()
+            if resource_usage:
+                result, rusage = _run_with_rusage(cmd_args, cwd, timeout, capture_output, shell,
+                                                  input_text)
+            else:
+                result = subprocess.run(
+                    cmd_args,
+                    cwd=cwd,
+                    timeout=timeout,
+                    capture_output=capture_output,
+                    shell=shell,
+                    input=input_text,
+                    text=True,
+                    encoding='utf-8',
+                    errors='replace'
+                )
+        finally:
+            slots.release()
         
         execution_time = time.time() - start_time
         
@@ -81,7 +318,7 @@ def run_command(
         else:
             logger.warning(f"명령어 실행 실패 (코드: {result.returncode}, 시간: {execution_time:.2f}초)")
         
-        return {
+        command_result = {
             "returncode": result.returncode,
             "stdout": result.stdout or "",
             "stderr": result.stderr or "",
@@ -89,6 +326,19 @@ def run_command(
             "command": cmd_for_log,
             "execution_time": execution_time
         }
+        if rusage is not None:
+            usage = {
+                "user_time": rusage.ru_utime,
+                "system_time": rusage.ru_stime,
+                "max_rss_kb": _max_rss_kb(rusage.ru_maxrss),
+                "wait_time": start_time - queued_time
+            }
+            command_result["resource_usage"] = usage
+            if stage is None:
+                executable = cmd_args if isinstance(cmd_args, str) else cmd_args[0]
+                stage = os.path.basename(shlex.split(executable)[0] if shell else executable)
+            record_resource_usage(stage, usage, execution_time)
+        return command_result
         
     except subprocess.TimeoutExpired:
         execution_time = time.time() - start_time
@@ -115,18 +365,238 @@ def run_command(
         }
 
 
+def _get_actionlint_cache():
+    """
+    run_actionlint가 사용할 결과 캐시를 반환합니다 (utils.actionlint_cache 참고).
+    
+    Returns:
+        ActionlintCache 또는 None (비활성화/생성 실패 시)
+    """
+    from .actionlint_cache import get_actionlint_cache
+    return get_actionlint_cache()
+
+
+def _find_actionlint(actionlint_path: str = "actionlint") -> Optional[str]:
+    """
+    actionlint 실행파일 경로를 찾습니다.
+    
+    Args:
+        actionlint_path: actionlint 실행파일 경로 ("actionlint"이면 알려진 위치와 PATH에서 검색)
+        
+    Returns:
+        Optional[str]: actionlint 실행파일 경로 (없으면 None)
+    """
+    logger = logging.getLogger(__name__)
+    
+    if actionlint_path != "actionlint":
+        return actionlint_path
+    
+    # 기본값인 경우 사용 가능한 actionlint 바이너리를 찾음
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(os.path.dirname(current_dir))
+    
+    # 여러 위치에서 actionlint 바이너리 검색
+    search_paths = [
+        # 현재 프로젝트의 syntax_repair 디렉토리
+        os.path.join(project_root, "syntax_repair", "actionlint"),
+        # smell_linter 디렉토리들 (절대 경로로 수정)
+        "/Users/nam/Desktop/repository/Catching-Smells/smell_linter/actionlint_mac",
+        "/Users/nam/Desktop/repository/Catching-Smells/smell_linter/src/actionlint_mac",
+        "/Users/nam/Desktop/repository/Catching-Smells/smell_linter/actionlint_linux",
+        "/Users/nam/Desktop/repository/Catching-Smells/smell_linter/src/actionlint_linux",
+    ]
+    
+    for path in search_paths:
+        if os.path.exists(path) and os.access(path, os.X_OK):
+            logger.info(f"actionlint 바이너리 발견: {path}")
+            return path
+    
+    # 시스템 PATH에서 찾기 시도
+    return find_executable("actionlint")
+
+
+def _parse_actionlint_errors(result: Dict[str, Any], output_format: str = "json") -> List[Any]:
+    """
+    actionlint 실행 결과에서 오류 목록을 추출합니다.
+    
+    Args:
+        result: run_command 결과
+        output_format: 출력 형식 ("json", "text")
+        
+    Returns:
+        List: JSON 형식이면 오류 딕셔너리, 아니면 출력 줄 리스트
+    """
+    logger = logging.getLogger(__name__)
+    
+    if output_format == "json":
+        try:
+            # actionlint는 JSON 출력을 stdout에 보냄
+            output_text = result["stdout"].strip()
+            if output_text.startswith('['):
+                # JSON 배열 형태로 출력됨
+                return json.loads(output_text)
+            # 줄별로 JSON 객체가 출력되는 경우
+            errors = []
+            for line in output_text.split('\n'):
+                if line.strip() and line.startswith('{'):
+                    errors.append(json.loads(line))
+            return errors
+        except Exception as e:
+            logger.warning(f"actionlint JSON 출력 파싱 실패: {e}")
+    
+    # 텍스트 형식이거나 JSON 파싱 실패 시 텍스트로 처리 (stdout과 stderr 모두 확인)
+    output_text = result["stdout"] if result["stdout"] else result["stderr"]
+    return output_text.strip().split('\n') if output_text else []
+
+
+def _actionlint_display_path(yaml_file_path: str, from_stdin: bool = False) -> str:
+    """
+    actionlint가 오류의 filepath로 출력하는 경로를 반환합니다.
+    
+    표준 입력은 -stdin-filename 그대로, 절대경로 파일은 작업 디렉토리 기준 상대 경로로 출력됩니다.
+    """
+    if from_stdin or not os.path.isabs(yaml_file_path):
+        return yaml_file_path
+    return os.path.relpath(yaml_file_path)
+
+
+def _actionlint_cache_key(cache, actionlint_path: str, yaml_file_path: str,
+                          content: Optional[str] = None) -> Optional[str]:
+    """
+    JSON 형식 actionlint 결과의 캐시 키를 계산합니다 (내용 sha256 + 바이너리 버전 + 옵션).
+    
+    Returns:
+        Optional[str]: 캐시 키 (버전이나 내용을 확인할 수 없으면 None)
+    """
+    version = cache.binary_version(actionlint_path)
+    if version is None:
+        return None
+    if content is not None:
+        data = content.encode('utf-8')
+    else:
+        try:
+            with open(yaml_file_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+    return cache.key(data, version, ["-format", "{{json .}}"])
+
+
+def _prepare_actionlint(
+    yaml_file_path: str,
+    actionlint_path: str,
+    output_format: str,
+    content: Optional[str]
+) -> Tuple[Optional[Dict[str, Any]], Optional[Union[str, List[str]]], Any, Optional[str]]:
+    """
+    run_actionlint와 run_actionlint_async의 실행 전 단계 (입력 확인, 캐시 조회, 명령어 구성).
+    
+    Returns:
+        Tuple: (실행 없이 반환할 결과 또는 None, actionlint 명령어, 캐시, 캐시 키)
+    """
+    logger = logging.getLogger(__name__)
+    
+    if content is None and not os.path.exists(yaml_file_path):
+        logger.error(f"YAML 파일이 존재하지 않음: {yaml_file_path}")
+        return {
+            "success": False,
+            "errors": [],
+            "raw_output": "",
+            "error_message": "File not found"
+        }, None, None, None
+    
+    # actionlint 실행파일 경로 자동 감지
+    actionlint_path = _find_actionlint(actionlint_path)
+    if actionlint_path is None:
+        logger.error("actionlint 바이너리를 찾을 수 없음")
+        return {
+            "success": False,
+            "errors": [],
+            "raw_output": "",
+            "error_message": "actionlint binary not found"
+        }, None, None, None
+    
+    # 같은 내용을 같은 바이너리와 옵션으로 검사한 결과가 있으면 actionlint를 실행하지 않음
+    cache = _get_actionlint_cache() if output_format == "json" else None
+    cache_key = None
+    if cache is not None:
+        cache_key = _actionlint_cache_key(cache, actionlint_path, yaml_file_path, content)
+        if cache_key is not None:
+            cached = cache.get(cache_key, _actionlint_display_path(yaml_file_path,
+                                                                   content is not None))
+            if cached is not None:
+                logger.info("actionlint 캐시 적중")
+                return cached, None, cache, cache_key
+    
+    # actionlint 명령어 구성
+    if content is not None:
+        # "-"는 표준 입력을 검사하라는 의미
+        command = [actionlint_path]
+        if output_format == "json":
+            command += ["-format", "{{json .}}"]
+        command += ["-stdin-filename", yaml_file_path, "-"]
+    elif output_format == "json":
+        command = f"{actionlint_path} -format '{{{{json .}}}}' {yaml_file_path}"
+    else:
+        command = f"{actionlint_path} {yaml_file_path}"
+    return None, command, cache, cache_key
+
+
+def _finish_actionlint(
+    result: Dict[str, Any],
+    output_format: str,
+    cache: Any,
+    cache_key: Optional[str]
+) -> Dict[str, Any]:
+    """
+    run_command 결과를 run_actionlint 결과 형식으로 변환하고 캐시에 저장합니다.
+    """
+    logger = logging.getLogger(__name__)
+    
+    # actionlint는 오류가 있으면 returncode가 0이 아님
+    has_errors = result["returncode"] != 0
+    
+    # actionlint 전용 로깅 (오류 발견은 정상 동작)
+    if has_errors:
+        logger.info(f"actionlint 실행 완료: 오류 발견됨 (코드: {result['returncode']})")
+    else:
+        logger.info("actionlint 실행 완료: 오류 없음")
+    
+    errors = _parse_actionlint_errors(result, output_format) if has_errors else []
+    
+    # 0: 문제 없음, 1: 문제 발견. 그 외(치명적 오류, 타임아웃)는 캐시하지 않음
+    if cache_key is not None and (result["returncode"] == 0 or (
+            result["returncode"] == 1 and errors and all(isinstance(e, dict) for e in errors))):
+        cache.put(cache_key, errors)
+    
+    return {
+        "success": not has_errors,
+        "errors": errors,
+        "raw_output": result["stdout"] if has_errors else result["stdout"],
+        "error_message": "" if not has_errors else "actionlint found issues",
+        "execution_time": result["execution_time"]
+    }
+
+
 def run_actionlint(
     yaml_file_path: str,
     actionlint_path: str = "actionlint",
-    output_format: str = "json"
+    output_format: str = "json",
+    content: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     actionlint를 실행하여 워크플로우를 검사합니다.
     
+    여러 파일을 검사할 때는 프로세스를 묶어 실행하는 run_actionlint_batch를 사용하세요.
+    content가 주어지면 파일을 만들지 않고 actionlint의 표준 입력으로 검사하며,
+    yaml_file_path는 오류에 표시될 파일 이름으로만 사용됩니다 (-stdin-filename).
+    JSON 결과는 내용 해시로 캐시되어 (GHA_ACTIONLINT_CACHE 참고) 같은 내용은 다시 검사하지 않습니다.
+    
     Args:
-        yaml_file_path: 검사할 YAML 파일 경로
+        yaml_file_path: 검사할 YAML 파일 경로 (content가 있으면 표시용 이름)
         actionlint_path: actionlint 실행파일 경로
         output_format: 출력 형식 ("json", "text")
+        content: 검사할 YAML 내용 (None이면 파일을 읽음)
         
     Returns:
         Dict: actionlint 실행 결과
@@ -134,108 +604,421 @@ def run_actionlint(
     logger = logging.getLogger(__name__)
     
     try:
-        if not os.path.exists(yaml_file_path):
-            logger.error(f"YAML 파일이 존재하지 않음: {yaml_file_path}")
-            return {
+        ready, command, cache, cache_key = _prepare_actionlint(
+            yaml_file_path, actionlint_path, output_format, content)
+        if ready is not None:
+            return ready
+        
+        # actionlint 실행
+        result = run_command(command, timeout=60, input_text=content, stage="actionlint")
+        return _finish_actionlint(result, output_format, cache, cache_key)
+        
+    except Exception as e:
+        logger.error(f"actionlint 실행 중 오류: {e}")
+        return {
+            "success": False,
+            "errors": [],
+            "raw_output": "",
+            "error_message": str(e)
+        }
+
+
+def run_actionlint_batch(
+    yaml_file_paths: List[str],
+    actionlint_path: str = "actionlint",
+    chunk_size: int = 200
+) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 워크플로우를 chunk_size개씩 actionlint 프로세스 하나로 검사하고,
+    JSON 출력의 filepath로 결과를 파일별로 나눕니다.
+    
+    actionlint가 치명적 오류로 끝났거나 (종료 코드 0, 1 이외) 파일에 대응되지 않는 결과가 있으면
+    해당 묶음만 파일별 run_actionlint로 다시 검사합니다.
+    
+    Args:
+        yaml_file_paths: 검사할 YAML 파일 경로 리스트
+        actionlint_path: actionlint 실행파일 경로
+        chunk_size: actionlint 한 번에 넘길 파일 수
+        
+    Returns:
+        Dict: 입력 경로별 run_actionlint(output_format="json")와 같은 형식의 결과
+    """
+    logger = logging.getLogger(__name__)
+    results = {}
+    
+    # 같은 파일을 가리키는 경로는 한 번만 검사
+    paths_by_abs: Dict[str, List[str]] = {}
+    for path in yaml_file_paths:
+        if path in results:
+            continue
+        if not os.path.exists(path):
+            logger.error(f"YAML 파일이 존재하지 않음: {path}")
+            results[path] = {
                 "success": False,
                 "errors": [],
                 "raw_output": "",
                 "error_message": "File not found"
             }
+            continue
+        paths_by_abs.setdefault(os.path.abspath(path), []).append(path)
+    
+    if not paths_by_abs:
+        return results
+    
+    resolved_path = _find_actionlint(actionlint_path)
+    if resolved_path is None:
+        logger.error("actionlint 바이너리를 찾을 수 없음")
+        for paths in paths_by_abs.values():
+            for path in paths:
+                results[path] = {
+                    "success": False,
+                    "errors": [],
+                    "raw_output": "",
+                    "error_message": "actionlint binary not found"
+                }
+        return results
+    
+    # 캐시에 있는 파일은 actionlint에 넘기지 않음
+    cache = _get_actionlint_cache()
+    cache_keys: Dict[str, str] = {}
+    abs_paths = []
+    for abs_path in paths_by_abs:
+        cache_key = _actionlint_cache_key(cache, resolved_path, abs_path) \
+            if cache is not None else None
+        cached = cache.get(cache_key, _actionlint_display_path(abs_path)) \
+            if cache_key is not None else None
+        if cached is not None:
+            for path in paths_by_abs[abs_path]:
+                results[path] = cached
+            continue
+        if cache_key is not None:
+            cache_keys[abs_path] = cache_key
+        abs_paths.append(abs_path)
+    if cache is not None:
+        logger.info(f"actionlint 캐시 적중 {len(paths_by_abs) - len(abs_paths)}개 / "
+                    f"검사할 파일 {len(abs_paths)}개")
+    
+    for start in range(0, len(abs_paths), chunk_size):
+        chunk = abs_paths[start:start + chunk_size]
+        result = run_command([resolved_path, "-format", "{{json .}}"] + chunk,
+                             timeout=60 + len(chunk), stage="actionlint")
         
-        # actionlint 실행파일 경로 자동 감지
-        if actionlint_path == "actionlint":
-            # 기본값인 경우 사용 가능한 actionlint 바이너리를 찾음
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.dirname(os.path.dirname(current_dir))
-            
-            # 여러 위치에서 actionlint 바이너리 검색
-            search_paths = [
-                # 현재 프로젝트의 syntax_repair 디렉토리
-                os.path.join(project_root, "syntax_repair", "actionlint"),
-                # smell_linter 디렉토리들 (절대 경로로 수정)
-                "/Users/nam/Desktop/repository/Catching-Smells/smell_linter/actionlint_mac",
-                "/Users/nam/Desktop/repository/Catching-Smells/smell_linter/src/actionlint_mac",
-                "/Users/nam/Desktop/repository/Catching-Smells/smell_linter/actionlint_linux",
-                "/Users/nam/Desktop/repository/Catching-Smells/smell_linter/src/actionlint_linux",
-            ]
-            
-            actionlint_found = None
-            for path in search_paths:
-                if os.path.exists(path) and os.access(path, os.X_OK):
-                    actionlint_found = path
-                    logger.info(f"actionlint 바이너리 발견: {actionlint_found}")
-                    break
-            
-            if actionlint_found:
-                actionlint_path = actionlint_found
-            else:
-                # 시스템 PATH에서 찾기 시도
-                actionlint_found = find_executable("actionlint")
-                if actionlint_found:
-                    actionlint_path = actionlint_found
+        chunk_results = None
+        # 0: 문제 없음, 1: 문제 발견. 그 외에는 파일별 결과를 믿을 수 없음
+        if result["returncode"] in (0, 1):
+            errors_by_file = {path: [] for path in chunk}
+            unmatched = 0
+            errors = _parse_actionlint_errors(result) if result["returncode"] == 1 else []
+            for error in errors:
+                # actionlint는 filepath를 작업 디렉토리 기준 상대 경로로 출력할 수 있음
+                key = os.path.abspath(error["filepath"]) \
+                    if isinstance(error, dict) and error.get("filepath") else None
+                if key in errors_by_file:
+                    errors_by_file[key].append(error)
                 else:
-                    logger.error("actionlint 바이너리를 찾을 수 없음")
-                    return {
-                        "success": False,
-                        "errors": [],
-                        "raw_output": "",
-                        "error_message": "actionlint binary not found"
+                    unmatched += 1
+            if unmatched == 0 and (result["returncode"] == 0 or errors):
+                time_per_file = result["execution_time"] / len(chunk)
+                chunk_results = {
+                    path: {
+                        "success": not file_errors,
+                        "errors": file_errors,
+                        "raw_output": json.dumps(file_errors) if file_errors else "",
+                        "error_message": "actionlint found issues" if file_errors else "",
+                        "execution_time": time_per_file
                     }
+                    for path, file_errors in errors_by_file.items()
+                }
         
-        # actionlint 명령어 구성
-        if output_format == "json":
-            command = f"{actionlint_path} -format '{{{{json .}}}}' {yaml_file_path}"
+        if chunk_results is None:
+            logger.warning(f"actionlint 묶음 결과를 나눌 수 없어 파일별로 다시 실행 "
+                           f"(코드: {result['returncode']}, {len(chunk)}개 파일)")
+            chunk_results = {path: run_actionlint(path, resolved_path) for path in chunk}
         else:
-            command = f"{actionlint_path} {yaml_file_path}"
+            logger.info(f"actionlint 묶음 실행 완료: {len(chunk)}개 파일 "
+                        f"({result['execution_time']:.2f}초)")
+            for abs_path, file_result in chunk_results.items():
+                if abs_path in cache_keys:
+                    cache.put(cache_keys[abs_path], file_result["errors"])
         
-        # actionlint 실행
-        result = run_command(command, timeout=60)
+        for abs_path, file_result in chunk_results.items():
+            for path in paths_by_abs[abs_path]:
+                results[path] = file_result
+    
+    return results
+
+
+class _ProcessSlots:
+    """
+    스레드와 이벤트 루프가 함께 사용하는 외부 프로세스 실행 슬롯입니다.
+    
+    threading.Semaphore와 같지만 이벤트 루프를 막지 않고 기다릴 수 있으며,
+    슬롯은 기다린 순서대로 넘겨줍니다.
+    """
+    
+    def __init__(self, limit: int):
+        self._lock = threading.Lock()
+        self._free = limit
+        # (이벤트 루프, Future) 또는 (None, threading.Event)
+        self._waiters: "collections.deque" = collections.deque()
+    
+    def acquire(self) -> None:
+        with self._lock:
+            if self._free > 0 and not self._waiters:
+                self._free -= 1
+                return
+            event = threading.Event()
+            self._waiters.append((None, event))
+        event.wait()
+    
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._free > 0 and not self._waiters:
+                self._free -= 1
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            # 취소와 동시에 슬롯을 넘겨받았으면 다음 대기자에게 돌려줌
+            self.release()
+            raise
+    
+    def release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                if loop is None:
+                    waiter.set()
+                    return
+                try:
+                    loop.call_soon_threadsafe(_wake_waiter, waiter)
+                    return
+                except RuntimeError:
+                    # 대기자의 이벤트 루프가 이미 닫힘
+                    continue
+            self._free += 1
+
+
+def _wake_waiter(waiter: "asyncio.Future") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+# 프로세스 전체에서 공유하는 외부 프로세스 동시 실행 제한 (GHA_MAX_PROCESSES 참고)
+_process_slots_instance: Optional[_ProcessSlots] = None
+_process_slots_lock = threading.Lock()
+
+
+def max_concurrent_processes() -> int:
+    """
+    동시에 실행할 외부 프로세스 수를 반환합니다 (run_command, run_command_async 공통).
+    
+    GHA_MAX_PROCESSES 환경변수로 지정하며, 기본값은 CPU 수입니다.
+    
+    Returns:
+        int: 최대 동시 실행 프로세스 수
+    """
+    try:
+        return max(1, int(os.environ.get("GHA_MAX_PROCESSES", "")))
+    except ValueError:
+        return os.cpu_count() or 1
+
+
+def _process_slots() -> _ProcessSlots:
+    """
+    외부 프로세스 실행 슬롯을 반환합니다 (프로세스당 하나 생성).
+    run_command와 run_command_async를 거치는 모든 호출이 스레드와 이벤트 루프에
+    관계없이 같은 제한을 공유합니다.
+    """
+    global _process_slots_instance
+    if _process_slots_instance is None:
+        with _process_slots_lock:
+            if _process_slots_instance is None:
+                _process_slots_instance = _ProcessSlots(max_concurrent_processes())
+    return _process_slots_instance
+
+
+async def run_command_async(
+    command: Union[str, List[str]],
+    cwd: Optional[str] = None,
+    timeout: int = 30,
+    shell: bool = False,
+    input_text: Optional[str] = None,
+    resource_usage: Optional[bool] = None,
+    stage: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    외부 명령어를 asyncio 서브프로세스로 실행합니다.
+    
+    동시에 실행되는 프로세스 수는 run_command와 함께 max_concurrent_processes()로 제한되며,
+    타임아웃이나 작업 취소 시 프로세스를 종료합니다 (취소는 CancelledError로 다시 전달).
+    자원 사용량은 실행 슬롯 대기 시간(wait_time)만 수집합니다. 자식 프로세스를 asyncio가
+    회수하므로 CPU 시간과 최대 RSS는 run_command에서만 제공됩니다.
+    
+    Args:
+        command: 실행할 명령어 (문자열 또는 리스트)
+        cwd: 작업 디렉토리
+        timeout: 타임아웃 (초, 프로세스 시작 시점부터)
+        shell: 셸 사용 여부
+        input_text: 표준 입력으로 전달할 내용 (None이면 입력 없음)
+        resource_usage: 자원 사용량 수집 여부 (None이면 enable_resource_accounting 설정을 따름)
+        stage: 자원 사용량을 합산할 단계 이름 (None이면 실행 파일 이름)
         
-        # actionlint는 오류가 있으면 returncode가 0이 아님
-        has_errors = result["returncode"] != 0
+    Returns:
+        Dict: run_command와 같은 형식의 실행 결과
+    """
+    logger = logging.getLogger(__name__)
+    
+    import time
+    
+    if isinstance(command, str):
+        cmd_args = command if shell else shlex.split(command)
+        cmd_for_log = command
+    else:
+        cmd_args = command
+        cmd_for_log = ' '.join(command)
+    
+    if resource_usage is None:
+        resource_usage = _resource_accounting
+    queued_time = time.time()
+    
+    slots = _process_slots()
+    await slots.acquire_async()
+    try:
+        start_time = time.time()
+        logger.info(f"명령어 실행 (async): {cmd_for_log}")
+        try:
+            stdin = asyncio.subprocess.PIPE if input_text is not None else asyncio.subprocess.DEVNULL
+            if shell:
+                process = await asyncio.create_subprocess_shell(
+                    cmd_args if isinstance(cmd_args, str) else shlex.join(cmd_args),
+                    cwd=cwd, stdin=stdin,
+                    stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+                )
+            else:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd_args,
+                    cwd=cwd, stdin=stdin,
+                    stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+                )
+        except Exception as e:
+            logger.error(f"명령어 실행 중 오류: {e}")
+            return {
+                "returncode": -1,
+                "stdout": "",
+                "stderr": str(e),
+                "success": False,
+                "command": cmd_for_log,
+                "execution_time": time.time() - start_time
+            }
         
-        # actionlint 전용 로깅 (오류 발견은 정상 동작)
-        if has_errors:
-            logger.info(f"actionlint 실행 완료: 오류 발견됨 (코드: {result['returncode']})")
-        else:
-            logger.info("actionlint 실행 완료: 오류 없음")
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(input_text.encode('utf-8') if input_text is not None else None),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            await _kill_async(process)
+            execution_time = time.time() - start_time
+            logger.error(f"명령어 실행 타임아웃 ({timeout}초)")
+            return {
+                "returncode": -1,
+                "stdout": "",
+                "stderr": f"Command timed out after {timeout} seconds",
+                "success": False,
+                "command": cmd_for_log,
+                "execution_time": execution_time
+            }
+        except asyncio.CancelledError:
+            # 취소된 작업의 프로세스가 남지 않도록 종료를 기다린 뒤 취소를 전달
+            await _kill_async(process)
+            logger.info(f"명령어 실행 취소: {cmd_for_log}")
+            raise
         
-        errors = []
-        if has_errors and output_format == "json":
-            try:
-                import json
-                # actionlint는 JSON 출력을 stdout에 보냄
-                output_text = result["stdout"].strip()
-                if output_text.startswith('['):
-                    # JSON 배열 형태로 출력됨
-                    errors = json.loads(output_text)
-                else:
-                    # 줄별로 JSON 객체가 출력되는 경우
-                    stdout_lines = output_text.split('\n')
-                    for line in stdout_lines:
-                        if line.strip() and line.startswith('{'):
-                            error_data = json.loads(line)
-                            errors.append(error_data)
-            except Exception as e:
-                logger.warning(f"actionlint JSON 출력 파싱 실패: {e}")
-                # JSON 파싱 실패 시 텍스트로 처리 (stdout과 stderr 모두 확인)
-                output_text = result["stdout"] if result["stdout"] else result["stderr"]
-                errors = output_text.strip().split('\n') if output_text else []
+        execution_time = time.time() - start_time
+    finally:
+        slots.release()
+    
+    success = process.returncode == 0
+    if success:
+        logger.debug(f"명령어 실행 성공 ({execution_time:.2f}초)")
+    else:
+        logger.warning(f"명령어 실행 실패 (코드: {process.returncode}, 시간: {execution_time:.2f}초)")
+    
+    command_result = {
+        "returncode": process.returncode,
+        "stdout": stdout.decode('utf-8', errors='replace') if stdout else "",
+        "stderr": stderr.decode('utf-8', errors='replace') if stderr else "",
+        "success": success,
+        "command": cmd_for_log,
+        "execution_time": execution_time
+    }
+    if resource_usage:
+        usage = {"wait_time": start_time - queued_time}
+        command_result["resource_usage"] = usage
+        if stage is None:
+            stage = os.path.basename(shlex.split(cmd_args)[0] if isinstance(cmd_args, str)
+                                     else cmd_args[0])
+        record_resource_usage(stage, usage, execution_time)
+    return command_result
+
+
+async def _kill_async(process: "asyncio.subprocess.Process") -> None:
+    """프로세스를 강제 종료하고 종료될 때까지 기다립니다."""
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+    await process.wait()
+
+
+async def run_actionlint_async(
+    yaml_file_path: str,
+    actionlint_path: str = "actionlint",
+    output_format: str = "json",
+    content: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    run_actionlint의 비동기 버전입니다 (run_command_async의 동시 실행 제한을 따름).
+    
+    LLM 호출 등 다른 비동기 작업과 actionlint 실행을 겹쳐 수행할 때 사용합니다.
+    
+    Args:
+        yaml_file_path: 검사할 YAML 파일 경로 (content가 있으면 표시용 이름)
+        actionlint_path: actionlint 실행파일 경로
+        output_format: 출력 형식 ("json", "text")
+        content: 검사할 YAML 내용 (None이면 파일을 읽음)
         
-        elif has_errors:
-            # 텍스트 형식 오류 처리 (stdout과 stderr 모두 확인)
-            output_text = result["stdout"] if result["stdout"] else result["stderr"]
-            errors = output_text.strip().split('\n') if output_text else []
+    Returns:
+        Dict: run_actionlint와 같은 형식의 결과
+    """
+    logger = logging.getLogger(__name__)
+    
+    try:
+        # 캐시 조회(SQLite)와 actionlint -version 확인은 블로킹이므로 이벤트 루프 밖에서 실행
+        loop = asyncio.get_running_loop()
+        ready, command, cache, cache_key = await loop.run_in_executor(
+            None, _prepare_actionlint, yaml_file_path, actionlint_path, output_format, content)
+        if ready is not None:
+            return ready
         
-        return {
-            "success": not has_errors,
-            "errors": errors,
-            "raw_output": result["stdout"] if has_errors else result["stdout"],
-            "error_message": "" if not has_errors else "actionlint found issues",
-            "execution_time": result["execution_time"]
-        }
+        result = await run_command_async(command, timeout=60, input_text=content,
+                                         stage="actionlint")
+        if cache_key is None:
+            return _finish_actionlint(result, output_format, cache, cache_key)
+        return await loop.run_in_executor(
+            None, _finish_actionlint, result, output_format, cache, cache_key)
         
+    except asyncio.CancelledError:
+        raise
     except Exception as e:
         logger.error(f"actionlint 실행 중 오류: {e}")
         return {
@@ -510,12 +1293,258 @@ def check_tool_availability() -> Dict[str, bool]:
     return availability
 
 
-def run_smell_detector(yaml_file_path: str) -> Dict[str, Any]:
+# run_smell_detector의 결과 캐시 (None: 아직 생성 전, False: 비활성화)
+_smell_cache = None
+
+
+def _import_smell_detector():
+    """
+    gha_ci_detector의 in-process 탐지 모듈을 임포트합니다.
+    
+    탐지기 소스 경로는 GHA_CI_DETECTOR_SRC 환경변수로 변경할 수 있습니다.
+    
+    Returns:
+        module: gha_ci_detector.detection 모듈
+    """
+    detector_src = os.environ.get("GHA_CI_DETECTOR_SRC", DEFAULT_SMELL_DETECTOR_SRC)
+    if detector_src not in sys.path:
+        sys.path.insert(0, detector_src)
+    from gha_ci_detector import detection
+    return detection
+
+
+def _get_smell_cache():
+    """
+    run_smell_detector가 사용할 스멜 결과 캐시를 반환합니다 (프로세스당 한 번 생성).
+    
+    GHA_SMELL_CACHE 환경변수로 캐시 파일 경로를 지정하며, "off"로 설정하면 캐시를 사용하지 않습니다.
+    
+    Returns:
+        SmellCache 또는 None (비활성화/생성 실패 시)
+    """
+    global _smell_cache
+    if _smell_cache is None:
+        cache_path = os.environ.get("GHA_SMELL_CACHE")
+        if cache_path is not None and cache_path.lower() in ("off", "0", "false", ""):
+            _smell_cache = False
+        else:
+            try:
+                _import_smell_detector()
+                from gha_ci_detector.cache import open_cache
+                _smell_cache = open_cache(cache_path)
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"스멜 결과 캐시를 사용할 수 없음: {e}")
+                _smell_cache = False
+    return _smell_cache or None
+
+
+class SmellDetectorClient:
     """
-    기존 프로젝트의 smell detector를 실행합니다.
+    상주하는 smell detector 서버(`gha_ci_detector serve`)와 JSON lines로 통신하는 클라이언트입니다.
+    
+    탐지기를 별도 인터프리터(가상환경)에서 실행하면서도 파일마다 인터프리터 시작과
+    typer/yamllint/ruamel 임포트 비용을 치르지 않도록, 서버를 필요할 때 한 번 띄워 재사용합니다.
+    서버가 종료되었거나 응답하지 않으면 다시 시작합니다.
+    """
+    
+    def __init__(self, python_executable: str, detector_src: str, timeout: int = 60,
+                 cache_path: Optional[str] = None):
+        self.python_executable = python_executable
+        self.detector_src = detector_src
+        self.timeout = timeout
+        self.cache_path = cache_path
+        self._process: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[str]" = queue.Queue()
+        self._next_id = 0
+    
+    def _start(self) -> None:
+        logging.getLogger(__name__).info(f"smell detector 서버 시작: {self.python_executable}")
+        command = [self.python_executable, "-m", "gha_ci_detector", "serve"]
+        if self.cache_path is not None:
+            command += ["--cache", self.cache_path]
+        self._process = subprocess.Popen(
+            command,
+            cwd=self.detector_src,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1
+        )
+        # 응답 대기에 타임아웃을 두기 위해 별도 스레드가 서버 출력을 줄 단위로 전달
+        self._lines = queue.Queue()
+        threading.Thread(target=self._forward_lines, args=(self._process.stdout, self._lines),
+                         daemon=True).start()
+    
+    @staticmethod
+    def _forward_lines(stdout, lines: "queue.Queue[str]") -> None:
+        for line in stdout:
+            lines.put(line)
+        # 서버 종료 표시
+        lines.put("")
+    
+    def close(self) -> None:
+        """서버 프로세스를 종료합니다."""
+        if self._process is not None:
+            try:
+                self._process.stdin.close()
+                self._process.wait(timeout=5)
+            except Exception:
+                self._process.kill()
+            self._process = None
+    
+    def _read_response(self, request_id: int) -> Dict[str, Any]:
+        while True:
+            try:
+                line = self._lines.get(timeout=self.timeout)
+            except queue.Empty:
+                raise TimeoutError(f"smell detector 서버가 {self.timeout}초 동안 응답하지 않음")
+            if line == "":
+                raise ConnectionError("smell detector 서버가 종료됨")
+            # 서버 시작 시 출력되는 환영 메시지 등 응답이 아닌 줄은 건너뜀
+            if not line.startswith("{"):
+                continue
+            response = json.loads(line)
+            if response.get("id") == request_id:
+                return response
+    
+    def detect(self, yaml_file_path: str, smell_ids: Optional[List[int]] = None,
+               content: Optional[str] = None) -> List[Any]:
+        """
+        파일의 스멜을 탐지합니다. 서버가 죽어 있으면 다시 시작해 한 번 재시도합니다.
+        
+        Args:
+            yaml_file_path: 검사할 YAML 파일의 절대경로 (content가 있으면 이름으로만 사용)
+            smell_ids: 탐지할 스멜 번호 (None이면 전체)
+            content: 검사할 YAML 내용 (None이면 서버가 파일을 읽음)
+            
+        Returns:
+            List: SmellRecord와 같은 속성을 가진 객체 리스트
+        """
+        for attempt in range(2):
+            if self._process is None or self._process.poll() is not None:
+                self._start()
+            self._next_id += 1
+            request = {"id": self._next_id, "smell_ids": smell_ids}
+            if content is not None:
+                request.update(content=content, name=yaml_file_path)
+            else:
+                request["path"] = yaml_file_path
+            try:
+                self._process.stdin.write(json.dumps(request) + "\n")
+                self._process.stdin.flush()
+                response = self._read_response(self._next_id)
+            except (OSError, ValueError, ConnectionError, TimeoutError) as e:
+                logging.getLogger(__name__).warning(f"smell detector 서버 재시작: {e}")
+                self._process.kill()
+                self._process = None
+                if attempt == 1:
+                    raise
+                continue
+            if response["error"] is not None:
+                raise RuntimeError(response["error"])
+            return [types.SimpleNamespace(**record) for record in response["smells"]]
+
+
+class SmellDetectorPool:
+    """
+    SmellDetectorClient 풀입니다. 동시에 호출되면 최대 max_size개의 서버를 띄우고,
+    호출이 끝난 클라이언트는 다음 호출에서 재사용합니다.
+    """
+    
+    def __init__(self, python_executable: str, detector_src: str, max_size: int = 1,
+                 cache_path: Optional[str] = None):
+        self.python_executable = python_executable
+        self.detector_src = detector_src
+        self.max_size = max_size
+        self.cache_path = cache_path
+        self._idle: "queue.LifoQueue[SmellDetectorClient]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+    
+    def _acquire(self) -> SmellDetectorClient:
+        with self._lock:
+            if self._idle.empty() and self._created < self.max_size:
+                self._created += 1
+                return SmellDetectorClient(self.python_executable, self.detector_src,
+                                           cache_path=self.cache_path)
+        return self._idle.get()
+    
+    def detect(self, yaml_file_path: str, smell_ids: Optional[List[int]] = None,
+               content: Optional[str] = None) -> List[Any]:
+        client = self._acquire()
+        try:
+            return client.detect(yaml_file_path, smell_ids, content)
+        finally:
+            self._idle.put(client)
+    
+    def close(self) -> None:
+        while not self._idle.empty():
+            self._idle.get().close()
+        self._created = 0
+
+
+# 별도 인터프리터에서 실행되는 smell detector 서버 풀 (GHA_CI_DETECTOR_PYTHON 참고)
+_detector_pool: Optional[SmellDetectorPool] = None
+_detector_pool_lock = threading.Lock()
+
+
+def _get_detector_pool() -> Optional[SmellDetectorPool]:
+    """
+    GHA_CI_DETECTOR_PYTHON 환경변수에 탐지기용 파이썬 인터프리터가 지정된 경우 서버 풀을 반환합니다.
+    
+    서버 수는 GHA_CI_DETECTOR_SERVERS 환경변수로 지정합니다 (기본 1).
+    GHA_SMELL_CACHE에 캐시 파일 경로가 지정되면 서버도 그 캐시를 사용합니다.
+    
+    Returns:
+        SmellDetectorPool 또는 None (지정되지 않은 경우, in-process 실행)
+    """
+    global _detector_pool
+    python_executable = os.environ.get("GHA_CI_DETECTOR_PYTHON")
+    if not python_executable:
+        return None
+    with _detector_pool_lock:
+        if _detector_pool is None:
+            import atexit
+            cache_path = os.environ.get("GHA_SMELL_CACHE")
+            _detector_pool = SmellDetectorPool(
+                python_executable,
+                os.environ.get("GHA_CI_DETECTOR_SRC", DEFAULT_SMELL_DETECTOR_SRC),
+                max_size=int(os.environ.get("GHA_CI_DETECTOR_SERVERS", "1")),
+                cache_path=cache_path if cache_path and cache_path.lower() not in ("off", "0", "false")
+                else None
+            )
+            atexit.register(_detector_pool.close)
+    return _detector_pool
+
+
+def _smell_record_to_dict(record) -> Dict[str, Any]:
+    """SmellRecord를 기존 스멜 딕셔너리 형식으로 변환합니다."""
+    return {
+        'type': 'code_smell',
+        'id': str(record.id),
+        'description': record.description,
+        'message': f"- {record.message}",
+        'severity': 'medium',
+        'line': record.start_line,
+        'end_line': record.end_line,
+        'job': record.job
+    }
+
+
+def run_smell_detector(yaml_file_path: str, content: Optional[str] = None) -> Dict[str, Any]:
+    """
+    기존 프로젝트의 smell detector를 in-process로 실행합니다.
+    대상 스멜만 필터링: 1, 4, 5, 10, 11, 15, 16번
+    결과는 파일 내용 해시로 캐시되어 (GHA_SMELL_CACHE 참고) 같은 파일은 다시 탐지하지 않습니다.
+    GHA_CI_DETECTOR_PYTHON이 지정되면 그 인터프리터에서 상주하는 탐지기 서버를 사용합니다.
+    content가 주어지면 파일을 만들지 않고 메모리의 내용을 검사합니다.
     
     Args:
-        yaml_file_path: 검사할 YAML 파일 경로
+        yaml_file_path: 검사할 YAML 파일 경로 (content가 있으면 이름 기반 휴리스틱에 쓰이는 이름)
+        content: 검사할 YAML 내용 (None이면 파일을 읽음)
         
     Returns:
         Dict: smell detector 실행 결과
@@ -529,10 +1558,10 @@ def run_smell_detector(yaml_file_path: str) -> Dict[str, Any]:
     logger = logging.getLogger(__name__)
     
     try:
-        # 절대경로로 변환
+        # 절대경로로 변환 (이름 기반 휴리스틱이 경로를 사용하므로 기존과 동일하게 유지)
         abs_yaml_path = os.path.abspath(yaml_file_path)
         
-        if not os.path.exists(abs_yaml_path):
+        if content is None and not os.path.exists(abs_yaml_path):
             logger.error(f"YAML 파일이 존재하지 않음: {abs_yaml_path}")
             return {
                 "success": False,
@@ -541,54 +1570,56 @@ def run_smell_detector(yaml_file_path: str) -> Dict[str, Any]:
                 "error": "File not found"
             }
         
-        # 기존 gha-ci-detector 실행 (smell detection 전용 환경 사용)
-        detector_path = "/Users/nam/Desktop/repository/Catching-Smells/RQ3/gha-ci-detector_paper/src"
-        python_path = "/Users/nam/Desktop/repository/Catching-Smells/.venv/bin/python"
-        command = f"cd {detector_path} && {python_path} -m gha_ci_detector file {abs_yaml_path}"
+        import time
+        start_time = time.time()
+        thread_usage = _thread_rusage() if _resource_accounting else None
         
-        result = run_command(command, timeout=60, shell=True)
+        # 대상 스멜에 필요한 규칙만 실행 (스멜 #23은 실패한 대상 규칙에 대해 함께 보고됨)
+        target_ids = sorted(int(i) for i in TARGET_SMELLS)
+        smell_cache = None
+        detector_pool = _get_detector_pool()
+        if detector_pool is not None:
+            # 별도 인터프리터의 상주 서버에서 탐지
+            records = detector_pool.detect(abs_yaml_path, target_ids, content)
+        else:
+            detection = _import_smell_detector()
+            # 내용 해시 기반 캐시: 변경되지 않은 파일은 다시 탐지하지 않음
+            smell_cache = _get_smell_cache()
+            if content is not None:
+                records = detection.detect_content(content, abs_yaml_path, smell_ids=target_ids,
+                                                   cache=smell_cache)
+            else:
+                records = detection.detect_file(abs_yaml_path, smell_ids=target_ids,
+                                                cache=smell_cache)
         
-        logger.debug(f"Smell detector stdout: {result['stdout']}")
-        logger.debug(f"Smell detector stderr: {result['stderr']}")
-        logger.debug(f"Smell detector return code: {result['returncode']}")
+        execution_time = time.time() - start_time
+        if thread_usage is not None and detector_pool is None:
+            # in-process 탐지는 자식 프로세스가 없으므로 현재 스레드의 CPU 시간으로 집계
+            end_usage = _thread_rusage()
+            record_resource_usage("smell_detector", {
+                "user_time": end_usage.ru_utime - thread_usage.ru_utime,
+                "system_time": end_usage.ru_stime - thread_usage.ru_stime,
+                "max_rss_kb": _max_rss_kb(end_usage.ru_maxrss)
+            }, execution_time)
+        if smell_cache is not None:
+            logger.debug(f"스멜 캐시 적중 {smell_cache.hits}회 / 미스 {smell_cache.misses}회")
         
-        # 성공적으로 실행되었고 출력이 있는 경우
-        if result["success"] and result["stdout"].strip():
-            smells = _parse_smell_detector_output(result["stdout"])
-            logger.info(f"Smell detector 실행 완료: {len(smells)}개 스멜 발견")
-            return {
-                "success": True,
-                "smells": smells,
-                "raw_output": result["stdout"]
-            }
-        # 실행 실패한 경우도 출력을 파싱해보기 (일부 스멜이 감지되었을 수 있음)
-        elif result["stdout"].strip():
-            logger.warning(f"Smell detector 실행 실패했지만 출력 있음 (코드: {result['returncode']})")
-            smells = _parse_smell_detector_output(result["stdout"])
-            logger.info(f"Smell detector 실행 완료: {len(smells)}개 스멜 발견")
-            return {
-                "success": True,
-                "smells": smells,
-                "raw_output": result["stdout"]
-            }
-        # 성공했지만 출력이 없는 경우
-        elif result["success"] and not result["stdout"].strip():
-            logger.warning("Smell detector가 빈 출력을 반환했습니다.")
-            if result["stderr"].strip():
-                logger.warning(f"Smell detector stderr: {result['stderr']}")
-            return {
-                "success": True,
-                "smells": [],
-                "raw_output": result["stdout"]
-            }
-        else:
-            logger.warning(f"Smell detector 실행 실패: {result['stderr']}")
-            return {
-                "success": False,
-                "smells": [],
-                "raw_output": result["stdout"],
-                "error": result["stderr"]
-            }
+        smells = [_smell_record_to_dict(r) for r in records if str(r.id) in TARGET_SMELLS]
+        smell_23_count = sum(1 for r in records if r.id == 23)
+        
+        logger.debug(f"Smell detector 결과: {[r.message for r in records]}")
+        logger.info(f"Smell detector 실행 완료: {len(smells)}개 스멜 발견 ({execution_time:.2f}초)")
+        
+        # 대상 스멜이 0개이고 스멜 #23이 있을 때 로그 남기기
+        if len(smells) == 0 and smell_23_count > 0:
+            logger.info(f"대상 스멜 0개이지만 스멜 #23 (YAML 파싱 오류) {smell_23_count}개 발견됨")
+        
+        return {
+            "success": True,
+            "smells": smells,
+            "raw_output": "\n".join(f"- {r.message}" for r in records),
+            "execution_time": execution_time
+        }
             
     except Exception as e:
         logger.error(f"Smell detector 실행 중 오류: {e}")
@@ -598,96 +1629,3 @@ def run_smell_detector(yaml_file_path: str) -> Dict[str, Any]:
             "raw_output": "",
             "error": str(e)
         }
-
-
-def _parse_smell_detector_output(output: str) -> list:
-    """
-    Smell detector 출력을 파싱하여 스멜 정보를 추출합니다.
-    대상 스멜만 필터링: 1, 4, 5, 10, 11, 15, 16번
-    
-    Args:
-        output: smell detector의 stdout 출력
-        
-    Returns:
-        list: 파싱된 스멜 정보 리스트 (대상 스멜만)
-    """
-    logger = logging.getLogger(__name__)
-    smells = []
-    
-    # 대상 스멜 번호 정의
-    TARGET_SMELLS = {'1', '4', '5', '10', '11', '15', '16'}
-    
-    # 스멜 #23 (YAML 파싱 오류) 추적용
-    smell_23_count = 0
-    
-    try:
-        lines = output.strip().split('\n')
-        logger.debug(f"Smell detector 출력 라인 수: {len(lines)}")
-        
-        # 메타데이터 라인 패턴들 (제외할 라인들)
-        skip_patterns = [
-            "Welcome to GHA CI Detector",
-            "Detecting smells for",
-            "We have found",
-            "The following styling errors were found"
-        ]
-        
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-                
-            logger.debug(f"라인 {i}: {line}")
-            
-            # 메타데이터 라인 건너뛰기
-            if any(pattern in line for pattern in skip_patterns):
-                logger.debug(f"메타데이터 라인 건너뛰기: {line}")
-                continue
-            
-            # 실제 스멜 라인 패턴: "- 숫자. 설명" 또는 "숫자:숫자: 오류"
-            if (line.startswith("- ") and ". " in line) or (":" in line and ("error" in line.lower() or "warning" in line.lower())):
-                # 스멜 번호와 설명 분리
-                if line.startswith("- "):
-                    # "- 3. Use fixed version for runs-on argument (line 7)" 형태
-                    smell_text = line[2:].strip()  # "- " 제거
-                    if ". " in smell_text:
-                        parts = smell_text.split(". ", 1)
-                        smell_number = parts[0]
-                        smell_description = parts[1]
-                    else:
-                        smell_number = "unknown"
-                        smell_description = smell_text
-                    
-                    # 스멜 #23 (YAML 파싱 오류) 추적
-                    if smell_number == '23':
-                        smell_23_count += 1
-                    
-                    # 대상 스멜 번호만 필터링
-                    if smell_number in TARGET_SMELLS:
-                        smells.append({
-                            'type': 'code_smell',
-                            'id': smell_number,
-                            'description': smell_description,
-                            'message': line,
-                            'severity': 'medium'
-                        })
-                        logger.debug(f"대상 스멜 감지 (#{smell_number}): {smell_description}")
-                    else:
-                        logger.debug(f"대상 외 스멜 건너뛰기 (#{smell_number}): {smell_description}")
-                else:
-                    # "11:5: wrong indentation: expected 6 but found 4 (indentation)" 형태는 대상 스멜이 아니므로 건너뛰기
-                    logger.debug(f"스타일 오류 건너뛰기 (대상 스멜 아님): {line}")
-            elif "YAML parsing error" in line:
-                # YAML 파싱 오류는 대상 스멜이 아니므로 건너뛰기
-                logger.debug(f"파싱 오류 건너뛰기 (대상 스멜 아님): {line}")
-                
-    except Exception as e:
-        logger.error(f"Smell 출력 파싱 중 오류: {e}")
-    
-    logger.info(f"총 {len(smells)}개 대상 스멜 파싱됨 (1,4,5,10,11,15,16번만)")
-    
-    # 대상 스멜이 0개이고 스멜 #23이 있을 때 로그 남기기
-    if len(smells) == 0 and smell_23_count > 0:
-        logger.info(f"대상 스멜 0개이지만 스멜 #23 (YAML 파싱 오류) {smell_23_count}개 발견됨")
-    
-    return smells
@@ -312,6 +312,9 @@ def create_temp_yaml_file(content: str, prefix: str = "workflow_") -> Optional[s
     """
     임시 YAML 파일을 생성합니다.
     
+    actionlint 검사(run_actionlint)와 스멜 탐지(run_smell_detector)는 content 인자로
+    파일 없이 실행할 수 있으므로, 파일 경로가 꼭 필요한 도구에만 사용하세요.
+    
     Args:
         content: YAML 내용
         prefix: 파일명 접두사
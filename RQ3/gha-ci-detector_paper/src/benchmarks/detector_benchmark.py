@@ -0,0 +1,284 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CORPUS = os.path.normpath(os.path.join(SRC_DIR, "..", "..", "gha-ci-detector",
+                                               "yaml_files"))
+# Output of the paper detector as published (before any optimization) on DEFAULT_CORPUS
+DEFAULT_REFERENCE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 "golden_yaml_files.jsonl")
+
+
+def read_corpus(directories: list[str]) -> list[tuple[str, str]]:
+    """
+    :return: (name, content) of every workflow. The name is '<folder>/<file>' so the name
+    based heuristics see the same name wherever the corpus is
+    """
+    corpus = []
+    for directory in directories:
+        folder = os.path.basename(os.path.normpath(directory))
+        for fname in sorted(os.listdir(directory)):
+            fpath = os.path.join(directory, fname)
+            if os.path.isfile(fpath):
+                with open(fpath, 'r', encoding='utf-8', errors='ignore') as f:
+                    corpus.append((f"{folder}/{fname}", f.read()))
+    return corpus
+
+
+def dump(corpus: list[tuple[str, str]]) -> bytes:
+    """
+    The smells and styling problems of every workflow as JSON lines. Only uses the API shared
+    by all detector variants: Workflow(content, name) and Runner(workflow).run_all().
+    """
+    from gha_ci_detector.Runner import Runner
+    from gha_ci_detector.Workflow import Workflow
+
+    lines = []
+    for name, content in corpus:
+        with contextlib.redirect_stdout(io.StringIO()):
+            workflow = Workflow(content, name)
+            smells = Runner(workflow).run_all()
+        lines.append(json.dumps({"file": name, "smells": sorted(smells),
+                                 "styling": [str(problem) for problem in workflow.styling]}))
+    return ("\n".join(lines) + "\n").encode('utf-8')
+
+
+# Loaded by ruamel in YAML 1.1 mode, where 'on' is True
+VERSIONED_WORKFLOW = "%YAML 1.1\n---\non: push\njobs:\n  build:\n    runs-on: ubuntu-latest\n"
+
+
+@contextlib.contextmanager
+def round_trip_only():
+    """
+    Load every workflow with ruamel, as if the fast libyaml tier of parse_yaml had given up
+    """
+    from gha_ci_detector import util
+
+    fast_load_yaml = getattr(util, "fast_load_yaml", None)
+
+    def give_up(yaml_str):
+        raise ValueError("round trip only")
+
+    if fast_load_yaml is not None:
+        util.fast_load_yaml = give_up
+    try:
+        yield
+    finally:
+        if fast_load_yaml is not None:
+            util.fast_load_yaml = fast_load_yaml
+
+
+def mixed_order_dump(corpus: list[tuple[str, str]]) -> bytes:
+    """
+    Like dump, but analyzes the corpus backwards with ruamel only and a %YAML 1.1 workflow
+    before every file, so state kept between workflows (loaders, caches) shows up as a
+    different output
+    """
+    lines = {}
+    with round_trip_only():
+        for name, content in reversed(corpus):
+            dump([("versioned.yml", VERSIONED_WORKFLOW)])
+            lines[name] = dump([(name, content)])
+    return b"".join(lines[name] for name, _ in corpus)
+
+
+def reference_dump(args) -> bytes:
+    if args.reference_src is not None:
+        result = subprocess.run([sys.executable, os.path.abspath(__file__), "--dump",
+                                 "--src", args.reference_src] + args.directories,
+                                capture_output=True, check=True)
+        return result.stdout
+    with open(args.reference, 'rb') as f:
+        return f.read()
+
+
+def compare(expected: bytes, actual: bytes) -> bool:
+    if expected == actual:
+        print("Output is byte-identical to the reference")
+        return True
+    expected_lines = {json.loads(line)["file"]: line for line in expected.splitlines()}
+    actual_lines = {json.loads(line)["file"]: line for line in actual.splitlines()}
+    different = sorted(name for name in expected_lines.keys() | actual_lines.keys()
+                       if expected_lines.get(name) != actual_lines.get(name))
+    print(f"Output differs from the reference for {len(different)} workflows:")
+    for name in different[:10]:
+        print(f"  {name}")
+        for label, lines in (("reference", expected_lines), ("this tree", actual_lines)):
+            line = lines.get(name)
+            print(f"    {label:<9} {json.loads(line)['smells'] if line is not None else 'missing'}")
+    return False
+
+
+def with_dependencies(rule_class, rules: list) -> list:
+    """
+    The rule and the rules it depends on, in the order of rules.
+    """
+    needed = set()
+    pending = [rule_class]
+    while len(pending) > 0:
+        rule = pending.pop()
+        if rule not in needed:
+            needed.add(rule)
+            pending.extend(rule.depends_on)
+    return [rule for rule in rules if rule in needed]
+
+
+def measure(run, memory: bool) -> tuple[float, int, int]:
+    """
+    :return: wall time in s, then the peak and the retained traced memory in bytes, which
+    are 0 without memory
+    """
+    if not memory:
+        start = time.perf_counter()
+        run()
+        return time.perf_counter() - start, 0, 0
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = run()
+    seconds = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    del result
+    return seconds, peak - before, current - before
+
+
+def benchmark_files(corpus: list[tuple[str, str]], repeat: int, memory: bool) -> list[dict]:
+    """
+    Parse and run all rules on every workflow, as the CLI does.
+    """
+    from gha_ci_detector.Runner import Runner
+    from gha_ci_detector.Workflow import Workflow
+
+    def detect(name, content):
+        workflow = Workflow(content, name)
+        workflow.smells = Runner(workflow).run_all()
+        return workflow
+
+    results = []
+    for name, content in corpus:
+        with contextlib.redirect_stdout(io.StringIO()):
+            seconds = min(measure(lambda: Workflow(content, name), False)[0]
+                          for _ in range(repeat))
+            total = min(measure(lambda: detect(name, content), False)[0] for _ in range(repeat))
+            _, peak, retained = measure(lambda: detect(name, content), memory)
+        results.append({"file": name, "parse_ms": 1000 * seconds, "total_ms": 1000 * total,
+                        "peak_kib": peak / 1024, "retained_kib": retained / 1024})
+    return results
+
+
+def benchmark_rules(corpus: list[tuple[str, str]], repeat: int, memory: bool) -> list[dict]:
+    """
+    Run every rule (with the rules it depends on) alone over the corpus. The workflows are
+    parsed and their jobs and steps built beforehand, so only the rules are measured.
+    """
+    from gha_ci_detector import smell_detector
+    from gha_ci_detector.engine import run_rules
+    from gha_ci_detector.Workflow import Workflow
+
+    def prepared(name, content):
+        workflow = Workflow(content, name)
+        try:
+            for job in workflow.get_jobs():
+                job.get_steps()
+        except Exception:
+            # The rules report the broken graph as smell 23
+            pass
+        return workflow
+
+    results = []
+    for rule in smell_detector.RULES:
+        rules = with_dependencies(rule, smell_detector.RULES)
+        seconds, peak, retained, failures = 0.0, 0, 0, 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            for name, content in corpus:
+                runs = []
+                for _ in range(repeat):
+                    workflow = prepared(name, content)
+                    runs.append(measure(lambda: run_rules(workflow, rules), False)[0])
+                seconds += min(runs)
+                workflow = prepared(name, content)
+                _, file_peak, file_retained = measure(lambda: run_rules(workflow, rules), memory)
+                peak = max(peak, file_peak)
+                retained += file_retained
+                failures += any(smell.startswith("23.") for smell in workflow.smells)
+        results.append({"rule": rule.name, "smells": list(rule.smell_ids),
+                        "with": [r.name for r in rules if r is not rule],
+                        "total_ms": 1000 * seconds, "ms_per_file": 1000 * seconds / len(corpus),
+                        "max_peak_kib": peak / 1024, "retained_kib": retained / 1024,
+                        "failed_files": failures})
+    return results
+
+
+def print_tables(files: list[dict], rules: list[dict], top: int) -> None:
+    parse_ms = sum(f["parse_ms"] for f in files)
+    total_ms = sum(f["total_ms"] for f in files)
+    print(f"\n{len(files)} workflows: {total_ms:.1f} ms in total, {parse_ms:.1f} ms of it parsing, "
+          f"{total_ms / max(len(files), 1):.2f} ms/file")
+
+    print(f"\n{'rule':<46} {'smells':<10} {'total ms':>9} {'ms/file':>8} {'peak KiB':>9} "
+          f"{'kept KiB':>9} {'failed':>6}")
+    for r in sorted(rules, key=lambda r: -r["total_ms"]):
+        name = r["rule"] + (f" (+{len(r['with'])})" if len(r["with"]) > 0 else "")
+        print(f"{name:<46} {','.join(map(str, r['smells'])):<10} {r['total_ms']:9.1f} "
+              f"{r['ms_per_file']:8.3f} {r['max_peak_kib']:9.1f} {r['retained_kib']:9.1f} "
+              f"{r['failed_files']:6}")
+
+    print(f"\n{'slowest files':<60} {'total ms':>9} {'parse ms':>9} {'peak KiB':>9}")
+    for f in sorted(files, key=lambda f: -f["total_ms"])[:top]:
+        print(f"{f['file'][-60:]:<60} {f['total_ms']:9.2f} {f['parse_ms']:9.2f} "
+              f"{f['peak_kib']:9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the detector per rule and per file and check its output '
+                    'against the paper detector.')
+    parser.add_argument('directories', nargs='*', default=[DEFAULT_CORPUS],
+                        help='folders containing workflow files (default: RQ3 yaml_files)')
+    parser.add_argument('--src', default=SRC_DIR, help='src folder of the detector to run')
+    parser.add_argument('--reference', default=DEFAULT_REFERENCE,
+                        help='JSON lines output to compare with, see --dump')
+    parser.add_argument('--reference-src', default=None,
+                        help='src folder of a detector to compare with, instead of --reference')
+    parser.add_argument('--dump', action='store_true',
+                        help='only print the output as JSON lines, e.g. to create a reference')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs, the fastest counts')
+    parser.add_argument('--no-memory', action='store_true', help='skip tracemalloc')
+    parser.add_argument('--top', type=int, default=10, help='slowest files to list')
+    parser.add_argument('--output', default=None, help='also write the results as JSON')
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.abspath(args.src))
+    corpus = read_corpus(args.directories)
+    if args.dump:
+        sys.stdout.buffer.write(dump(corpus))
+        return
+
+    expected = reference_dump(args)
+    identical = compare(expected, dump(corpus))
+    print("In mixed order:")
+    identical = compare(expected, mixed_order_dump(corpus)) and identical
+
+    memory = not args.no_memory
+    if memory:
+        tracemalloc.start()
+    files = benchmark_files(corpus, args.repeat, memory)
+    rules = benchmark_rules(corpus, args.repeat, memory)
+    print_tables(files, rules, args.top)
+
+    if args.output is not None:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"identical": identical, "files": files, "rules": rules}, f, indent=2)
+    if not identical:
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import os
+import sys
+import time
+
+from yamllint import config, linter
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CORPUS = os.path.normpath(os.path.join(SRC_DIR, "..", "..", "gha-ci-detector",
+                                               "yaml_files"))
+sys.path.insert(0, SRC_DIR)
+
+from gha_ci_detector import smell_detector  # noqa: E402
+
+
+def read_workflows(directories: list[str]) -> list[str]:
+    contents = []
+    for directory in directories:
+        for fname in sorted(os.listdir(directory)):
+            fpath = os.path.join(directory, fname)
+            if os.path.isfile(fpath):
+                with open(fpath, 'r', encoding='utf-8', errors='ignore') as f:
+                    contents.append(f.read())
+    return contents
+
+
+def timed(check, contents: list[str]) -> tuple[float, list[bool]]:
+    start = time.perf_counter()
+    results = [check(content) for content in contents]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Time the yamllint check behind smell 14 (Avoid incorrectly formatted workflows).')
+    parser.add_argument('directories', nargs='*', default=[DEFAULT_CORPUS],
+                        help='folders containing workflow files (default: RQ3 yaml_files)')
+    args = parser.parse_args()
+
+    contents = read_workflows(args.directories)
+    modes = {
+        # What the rule used to do: load the config for every workflow and keep all problems
+        "config per file, full list": lambda c: len(list(linter.run(
+            c, config.YamlLintConfig(file=smell_detector.YAMLLINT_CONFIG_PATH)))) > 0,
+        # workflow.styling is requested (CLI output)
+        "cached config, full list": lambda c: len(list(linter.run(
+            c, smell_detector.yamllint_config()))) > 0,
+        # Only smell 14 is needed (detection API)
+        "cached config, first problem": smell_detector.has_styling_problems,
+    }
+
+    print(f"{len(contents)} workflows")
+    expected = None
+    for mode, check in modes.items():
+        seconds, results = timed(check, contents)
+        if expected is None:
+            expected = results
+        elif results != expected:
+            print(f"{mode}: results differ from the first mode", file=sys.stderr)
+            exit(1)
+        print(f"{mode:<30} {seconds:8.3f}s  {1000 * seconds / max(len(contents), 1):7.3f} ms/file")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CORPUS = os.path.normpath(os.path.join(SRC_DIR, "..", "..", "gha-ci-detector",
+                                               "yaml_files"))
+sys.path.insert(0, SRC_DIR)
+
+from gha_ci_detector import smell_detector  # noqa: E402
+from gha_ci_detector.keywords import KeywordMatcher  # noqa: E402
+from gha_ci_detector.Workflow import Workflow  # noqa: E402
+
+
+# The heuristics as they were written before the keyword matchers
+def legacy_is_pull_based_name(name: str) -> bool:
+    return (" pr " in name or "_pr" in name or "pr_" in name or "issue" in name or
+            "review" in name or "branch" in name or "pull request" in name
+            or "pull_request" in name or "pull-request" in name or "label" in name)
+
+
+def legacy_is_ci_workflow(workflow: Workflow) -> bool:
+    ci_list = ["lint", "build", "test", "compile", "style", "ci", "codeql", "cypress"]
+    is_ci_file_name = any(word in workflow.name.lower() for word in ci_list)
+    is_ci_in_workflow = any(word in str(workflow.yaml).lower() for word in ci_list)
+    return is_ci_file_name or is_ci_in_workflow
+
+
+def legacy_is_cachable_action(step_yaml: dict) -> bool:
+    cacheable_actions = ["actions/setup-python", "actions/setup-java", "actions/setup-node"]
+    return (any(action in str(step_yaml) for action in cacheable_actions)
+            and "cache" not in str(step_yaml))
+
+
+# The 'in' tests KeywordMatcher.contains_any would do without its combined regex
+def any_is_ci_workflow(workflow: Workflow) -> bool:
+    keywords = smell_detector.CI_KEYWORDS.keywords
+    return (any(keyword in workflow.name.lower() for keyword in keywords)
+            or any(keyword in str(workflow.yaml).lower() for keyword in keywords))
+
+
+# What _is_pull_based_name would be with a matcher, it keeps the 'in' chain for short names
+PULL_BASED_NAMES = KeywordMatcher([" pr ", "_pr", "pr_", "issue", "review", "branch",
+                                   "pull request", "pull_request", "pull-request", "label"])
+
+
+def is_ci_workflow(workflow: Workflow) -> bool:
+    return (smell_detector.CI_KEYWORDS.contains_any(workflow.name.lower())
+            or smell_detector.CI_KEYWORDS.contains_any(str(workflow.yaml).lower()))
+
+
+def is_cachable_action(step_yaml: dict) -> bool:
+    text = str(step_yaml)
+    return (smell_detector.UseCacheFromSetup.cacheable_actions.contains_any(text)
+            and "cache" not in text)
+
+
+def load_inputs(directories: list[str]) -> dict[str, list]:
+    inputs = {"names": [], "workflows": [], "steps": []}
+    for directory in directories:
+        for fname in sorted(os.listdir(directory)):
+            fpath = os.path.join(directory, fname)
+            if not os.path.isfile(fpath):
+                continue
+            workflow = Workflow.from_file(fpath)
+            if workflow is None or not isinstance(workflow.yaml, dict):
+                continue
+            inputs["workflows"].append(workflow)
+            inputs["names"].append(fpath)
+            try:
+                for job in workflow.get_jobs():
+                    inputs["names"].append(str(job.name))
+                    for step in job.get_steps():
+                        if isinstance(step.yaml, dict):
+                            inputs["steps"].append(step.yaml)
+            except Exception:
+                # Malformed jobs are reported as smell 23, they do not matter here
+                continue
+    return inputs
+
+
+def compare(label: str, before, after, values: list, repeat: int) -> None:
+    timings = []
+    results = []
+    for check in (before, after):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = [check(value) for value in values]
+        timings.append(time.perf_counter() - start)
+        results.append(result)
+    status = "ok" if results[0] == results[1] else "DIFFERENT RESULTS"
+    print(f"{label:<34} {len(values):7} inputs  before {timings[0]:7.3f}s  "
+          f"after {timings[1]:7.3f}s  x{timings[0] / max(timings[1], 1e-9):5.2f}  {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare the compiled keyword matchers with the original substring checks.')
+    parser.add_argument('directories', nargs='*', default=[DEFAULT_CORPUS],
+                        help='folders containing workflow files (default: RQ3 yaml_files)')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per check')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        inputs = load_inputs(args.directories)
+
+    compare("pull based names", legacy_is_pull_based_name, smell_detector._is_pull_based_name,
+            inputs["names"], args.repeat)
+    compare("pull based names, in -> matcher", smell_detector._is_pull_based_name,
+            PULL_BASED_NAMES.contains_any, inputs["names"], args.repeat)
+    compare("CI workflows", legacy_is_ci_workflow, is_ci_workflow, inputs["workflows"],
+            args.repeat)
+    # The combined regex against any() over the same keywords
+    compare("CI workflows, any() -> matcher", any_is_ci_workflow, is_ci_workflow,
+            inputs["workflows"], args.repeat)
+    compare("cachable setup steps", legacy_is_cachable_action, is_cachable_action,
+            inputs["steps"], args.repeat)
+    # One 'in' scan per keyword (and the step stringified again for each) against the single
+    # regex scan of find_all
+    keywords = smell_detector.UseCacheFromSetup.cache_keywords
+    compare("all cache keywords (find_all)",
+            lambda s: {k for k in keywords.keywords if k in str(s)},
+            lambda s: keywords.find_all(str(s)), inputs["steps"], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# "import time:   self [us] | cumulative | imported package"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# name: (python arguments, default budget in ms, modules that must not be imported)
+SCENARIOS = {
+    "cli --version": (["-m", "gha_ci_detector", "--version"], 150,
+                      ["pandas", "yamllint", "ruamel.yaml", "yaml", "gha_ci_detector.smell_detector"]),
+    "cli --help": (["-m", "gha_ci_detector", "--help"], 400,
+                   ["pandas", "yamllint", "ruamel.yaml", "gha_ci_detector.smell_detector"]),
+    "import detection": (["-c", "import gha_ci_detector.detection"], 150,
+                         ["pandas", "typer", "yamllint"]),
+}
+
+
+def import_times(arguments: list[str]) -> list[tuple[str, int, int]]:
+    """
+    Run python -X importtime with the arguments in the src folder.
+    :return: (module, self us, cumulative us) for every imported module
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime"] + arguments, cwd=SRC_DIR,
+                            capture_output=True, text=True)
+    times = []
+    for line in result.stderr.splitlines():
+        if (match := _IMPORTTIME_LINE.match(line)) is not None:
+            times.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Check the import time of the detector entry points against a budget.')
+    parser.add_argument('--budget-scale', type=float, default=1.0,
+                        help='multiply all budgets, e.g. for slow machines')
+    parser.add_argument('--top', type=int, default=5, help='slowest imports to list')
+    parser.add_argument('--runs', type=int, default=3, help='runs per scenario, the fastest counts')
+    args = parser.parse_args()
+
+    failed = False
+    for name, (arguments, budget_ms, forbidden) in SCENARIOS.items():
+        runs = [import_times(arguments) for _ in range(args.runs)]
+        times = min(runs, key=lambda run: sum(t[1] for t in run))
+        total_ms = sum(t[1] for t in times) / 1000
+        budget_ms *= args.budget_scale
+        imported = {t[0] for t in times}
+        unexpected = [m for m in forbidden if m in imported]
+        status = "ok"
+        if total_ms > budget_ms or len(unexpected) > 0:
+            status = "FAILED"
+            failed = True
+        print(f"{name:<18} {total_ms:8.1f} ms  (budget {budget_ms:6.0f} ms)  {status}")
+        for module in unexpected:
+            print(f"    imports {module}")
+        # The slowest top level imports
+        top_level = [t for t in times if "." not in t[0] or t[0].startswith("gha_ci_detector")]
+        for module, _, cumulative in sorted(top_level, key=lambda t: -t[2])[:args.top]:
+            print(f"    {cumulative / 1000:8.1f} ms  {module}")
+    if failed:
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
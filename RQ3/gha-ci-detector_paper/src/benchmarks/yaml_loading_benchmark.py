@@ -0,0 +1,77 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+from ruamel.yaml import YAML
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CORPUS = os.path.normpath(os.path.join(SRC_DIR, "..", "..", "gha-ci-detector",
+                                               "yaml_files"))
+sys.path.insert(0, SRC_DIR)
+
+from gha_ci_detector import util  # noqa: E402
+
+
+def read_workflows(directories: list[str]) -> list[str]:
+    contents = []
+    for directory in directories:
+        for fname in sorted(os.listdir(directory)):
+            fpath = os.path.join(directory, fname)
+            if os.path.isfile(fpath):
+                with open(fpath, 'r', encoding='utf-8', errors='ignore') as f:
+                    contents.append(f.read())
+    return contents
+
+
+def load_with(yaml: YAML, content: str):
+    try:
+        return yaml.load(io.StringIO(content))
+    except Exception:
+        return None
+
+
+def fast_tier(content: str) -> bool:
+    try:
+        util.fast_load_yaml(content)
+        return True
+    except Exception:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Time util.parse_yaml against the ruamel round-trip loader it replaces.')
+    parser.add_argument('directories', nargs='*', default=[DEFAULT_CORPUS],
+                        help='folders containing workflow files (default: RQ3 yaml_files)')
+    args = parser.parse_args()
+
+    contents = read_workflows(args.directories)
+    shared = YAML()
+    modes = {
+        # What parse_yaml used to do: a new round-trip loader for every file
+        "round-trip, loader per file": lambda c: load_with(YAML(), c),
+        "round-trip, shared loader": lambda c: load_with(shared, c),
+        "two-tier parse_yaml": util.parse_yaml,
+    }
+
+    print(f"{len(contents)} workflows, "
+          f"{sum(map(fast_tier, contents))} loaded by the fast tier alone")
+    expected = None
+    for mode, load in modes.items():
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = [str(load(content)) for content in contents]
+        seconds = time.perf_counter() - start
+        if expected is None:
+            expected = results
+        elif results != expected:
+            print(f"{mode}: results differ from the first mode", file=sys.stderr)
+            exit(1)
+        print(f"{mode:<30} {seconds:8.3f}s  {1000 * seconds / max(len(contents), 1):7.3f} ms/file")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,17 @@
 import pandas as pd
 import re
 import argparse
+import io
 import os
 
+# 워크플로우 경로에서 (조직, 저장소, YAML 파일명)을 추출하는 패턴 (앞에서부터 시도)
+PATH_PATTERNS = [
+    r'\./\.github/workflows/(.+?)_(.+?)__(.+)',  # 기존 패턴
+    r'(?:.*/)?([^/]+)/([^/]+)/\.github/workflows/(.+)',  # GitHub 표준 경로
+    r'(?:.*/)?([^/]+)_([^/]+)__(.+)',  # 대체 형식
+    r'([^/]+)/([^/]+)/(.+\.ya?ml)$'  # 단순 조직/저장소/파일 패턴
+]
+
 def extract_path_info(yaml_path: str) -> tuple:
     """
     YAML 파일 경로에서 조직, 저장소, 파일 이름을 추출합니다.
@@ -14,14 +23,7 @@ def extract_path_info(yaml_path: str) -> tuple:
         tuple: (조직명, 저장소명, YAML 파일명)
     """
     # 여러 가지 경로 패턴을 시도합니다
-    patterns = [
-        r'\./\.github/workflows/(.+?)_(.+?)__(.+)',  # 기존 패턴
-        r'(?:.*/)?([^/]+)/([^/]+)/\.github/workflows/(.+)',  # GitHub 표준 경로
-        r'(?:.*/)?([^/]+)_([^/]+)__(.+)',  # 대체 형식
-        r'([^/]+)/([^/]+)/(.+\.ya?ml)$'  # 단순 조직/저장소/파일 패턴
-    ]
-    
-    for pattern in patterns:
+    for pattern in PATH_PATTERNS:
         match = re.match(pattern, yaml_path)
         if match:
             return match.groups()
@@ -94,17 +96,93 @@ def process_log_file(log_file_path: str, output_path: str = "result_table.csv"):
     print(f"결과가 다음 파일에 저장되었습니다: {output_path}")
     return df
 
+def extract_path_info_frame(yaml_paths: pd.Series) -> pd.DataFrame:
+    """
+    extract_path_info를 경로 Series 전체에 한 번에 적용합니다.
+    
+    Args:
+        yaml_paths (pd.Series): YAML 파일 경로들
+    
+    Returns:
+        pd.DataFrame: Org, Repo, Yaml 열
+    """
+    columns = ['Org', 'Repo', 'Yaml']
+    paths = yaml_paths.astype(str)
+    result = pd.DataFrame(index=paths.index, columns=columns, dtype=object)
+    # extract_path_info와 같은 순서로 패턴을 시도하고, 먼저 매치된 패턴의 결과를 사용합니다
+    for pattern in PATH_PATTERNS:
+        extracted = paths.str.extract('^' + pattern)
+        extracted.columns = columns
+        result = result.combine_first(extracted)
+
+    # 패턴이 매치되지 않으면 경로를 분리하여 처리
+    unmatched = result['Yaml'].isna()
+    parts = paths[unmatched].str.split('/')
+    has_dirs = parts.str.len() >= 3
+    result.loc[parts.index, 'Org'] = parts.str[-3].where(has_dirs, "unknown")
+    result.loc[parts.index, 'Repo'] = parts.str[-2].where(has_dirs, "unknown")
+    result.loc[parts.index, 'Yaml'] = parts.str[-1].where(has_dirs, paths[unmatched].str.strip())
+    return result[columns]
+
+
+def read_jsonl_records(jsonl_file_path: str) -> pd.DataFrame:
+    """
+    `gha-ci-detector ... --format jsonl` 출력에서 워크플로우 레코드만 읽습니다.
+    배너처럼 JSON이 아닌 줄은 건너뜁니다.
+    """
+    with open(jsonl_file_path, encoding="utf-8") as f:
+        record_lines = [line for line in f if line.startswith('{')]
+    if not record_lines:
+        return pd.DataFrame(columns=['file', 'smell_ids'])
+    return pd.read_json(io.StringIO(''.join(record_lines)), lines=True, dtype=False)
+
+
+def process_jsonl_file(jsonl_file_path: str, output_path: str = "result_table.csv"):
+    """
+    JSONL 결과 파일로부터 로그 파싱 없이 결과 테이블을 생성합니다.
+    
+    Args:
+        jsonl_file_path (str): `--format jsonl`로 생성한 결과 파일 경로
+        output_path (str): 결과 CSV 파일 저장 경로
+    """
+    if not os.path.exists(jsonl_file_path):
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {jsonl_file_path}")
+
+    records = read_jsonl_records(jsonl_file_path).reset_index(drop=True)
+    smell_columns = [f'Smell {i}' for i in range(1, 24)]
+
+    # 워크플로우 x 스멜 번호 행렬 (분석하지 못한 파일은 smell_ids가 null)
+    smell_ids = records['smell_ids'].explode().dropna().astype(int)
+    found = pd.crosstab(smell_ids.index, smell_ids.values).astype(bool)
+    found = found.reindex(index=records.index, columns=range(1, 24), fill_value=False)
+    found.columns = smell_columns
+
+    df = pd.concat([extract_path_info_frame(records['file']),
+                    found.replace({True: 'Tool', False: ''})], axis=1)
+    df.to_csv(output_path, index=False)
+    print(f"결과가 다음 파일에 저장되었습니다: {output_path}")
+    return df
+
+
 def main():
     parser = argparse.ArgumentParser(description='GitHub Actions 워크플로우 스멜 분석 결과를 요약합니다.')
-    parser.add_argument('log_file', help='분석할 로그 파일 경로')
+    parser.add_argument('log_file', help='분석할 로그 파일 경로 (또는 --format jsonl 결과 파일)')
     parser.add_argument('--output', '-o', 
                        default="result_table.csv",
                        help='결과를 저장할 CSV 파일 경로 (기본값: result_table.csv)')
+    parser.add_argument('--input-format', choices=['log', 'jsonl'],
+                       help='입력 형식 (기본값: 확장자가 .jsonl이면 jsonl, 아니면 log)')
 
     args = parser.parse_args()
+    input_format = args.input_format
+    if input_format is None:
+        input_format = 'jsonl' if args.log_file.endswith('.jsonl') else 'log'
 
     try:
-        process_log_file(args.log_file, args.output)
+        if input_format == 'jsonl':
+            process_jsonl_file(args.log_file, args.output)
+        else:
+            process_log_file(args.log_file, args.output)
     except Exception as e:
         print(f"오류 발생: {e}")
         exit(1)
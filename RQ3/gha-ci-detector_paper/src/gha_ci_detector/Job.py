@@ -4,9 +4,25 @@ from gha_ci_detector.Step import Step
 
 
 class Job:
+    __slots__ = ("name", "yaml", "if_", "_steps", "_yaml_text")
+
     def __init__(self, name, yaml):
         self.name = name
         self.yaml: dict = yaml
+        self._steps: Optional[list[Step]] = None
+        self._yaml_text: Optional[str] = None
+        # Left unset for a malformed job, see Step
+        if isinstance(yaml, dict):
+            self.if_: Optional[str] = yaml.get("if")
+
+    @property
+    def yaml_text(self) -> str:
+        """
+        str() of the job's YAML, computed once
+        """
+        if self._yaml_text is None:
+            self._yaml_text = str(self.yaml)
+        return self._yaml_text
 
     @property
     def job_name(self):
@@ -19,21 +35,23 @@ class Job:
         return "permissions" in self.yaml.keys()
 
     def get_steps(self) -> list[Step]:
-        if "steps" in self.yaml.keys():
-            return list(map(lambda x: Step(x), self.yaml["steps"]))
-        else:
-            return [Step({
-                "uses": self.yaml["uses"]
-            }, True)]
+        """
+        The steps are built on the first call and shared by every later call.
+        """
+        if self._steps is None:
+            if "steps" in self.yaml.keys():
+                self._steps = list(map(lambda x: Step(x), self.yaml["steps"]))
+            else:
+                self._steps = [Step({
+                    "uses": self.yaml["uses"]
+                }, True)]
+        return self._steps
 
     def get_if(self) -> Optional[str]:
-        if "if" in self.yaml.keys():
-            return self.yaml["if"]
-        else:
-            return None
+        return self.if_
 
     def __str__(self):
-        return "Job: \n" + self.name + " " + str(self.yaml) + "\n"
+        return "Job: \n" + self.name + " " + self.yaml_text + "\n"
 
     def __repr__(self):
         return self.__str__()
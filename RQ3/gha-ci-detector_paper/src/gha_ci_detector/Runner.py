@@ -1,30 +1,40 @@
+import time
+from typing import Iterable, Optional
+
 from gha_ci_detector.Workflow import Workflow
+from gha_ci_detector.engine import Rule, run_rules, select_rules
+from gha_ci_detector.util import report
 import gha_ci_detector.smell_detector as smell_detector
 
 
 class Runner:
-    def __init__(self, workflow: Workflow):
+    def __init__(self, workflow: Workflow, rules: Optional[Iterable[type[Rule]]] = None,
+                 smell_ids: Optional[Iterable[int]] = None, profile: bool = False):
+        """
+        :param workflow:
+        :param rules: the rules to run, all of them when None
+        :param smell_ids: only run the rules needed for these smells and only report these
+        :param profile: time every rule and store the timings in workflow.profile
+        """
         self.workflow: Workflow = workflow
+        self.profile = profile
+        self.smell_ids: Optional[set[int]] = set(smell_ids) if smell_ids is not None else None
+        self.rules: list[type[Rule]] = select_rules(
+            rules if rules is not None else smell_detector.RULES, self.smell_ids)
 
     def run_all(self) -> set[str]:
-        print("Detecting smells for " + self.workflow.name)
-        smell_detector.files_should_be_indented_correctly(self.workflow)
-        smell_detector.external_actions_must_have_permissions_workflow(self.workflow)
-        smell_detector.pull_based_actions_on_fork(self.workflow)
-        smell_detector.running_ci_when_nothing_changed(self.workflow)
-        smell_detector.use_fixed_version_runs_on(self.workflow)
-        smell_detector.use_specific_version_instead_of_dynamic(self.workflow)
-        smell_detector.action_should_have_timeout(self.workflow)
-        smell_detector.use_name_for_step(self.workflow)
-        smell_detector.scheduled_workflows_on_forks(self.workflow)
-        smell_detector.use_name_for_step(self.workflow)
-        smell_detector.stop_workflows_for_old_commit(self.workflow)
-        smell_detector.upload_artifact_must_have_if(self.workflow)
-        smell_detector.multi_line_steps(self.workflow)
-        smell_detector.comment_in_workflow(self.workflow)
-        smell_detector.deploy_from_fork(self.workflow)
-        smell_detector.run_multiple_versions(self.workflow)
-        smell_detector.installing_packages_without_version(self.workflow)
-        smell_detector.use_cache_from_setup(self.workflow)
+        report("Detecting smells for " + self.workflow.name)
+        if not self.profile:
+            return run_rules(self.workflow, self.rules, self.smell_ids)
 
-        return self.workflow.smells
+        timings: dict[str, float] = {}
+        start = time.perf_counter()
+        smells = run_rules(self.workflow, self.rules, self.smell_ids, timings)
+        self.workflow.profile = {
+            "file": self.workflow.name,
+            "parse_ms": 1000 * self.workflow.parse_seconds,
+            "run_ms": 1000 * (time.perf_counter() - start),
+            "line_lookups": self.workflow.line_lookups,
+            "rules": {rule: 1000 * seconds for rule, seconds in timings.items()}
+        }
+        return smells
@@ -2,31 +2,42 @@ from typing import Optional, Callable
 
 
 class Step:
+    # Steps are created for every job of every workflow in a corpus run, so keep them small.
+    # The fields are only filled in for mapping steps, reading them on a malformed step raises
+    # AttributeError like reading its keys would.
+    __slots__ = ("yaml", "is_inherited", "name", "uses", "run", "if_", "_yaml_text")
+
     def __init__(self, yaml, is_inherited: bool = False):
         self.yaml: dict = yaml
         self.is_inherited = is_inherited
+        self._yaml_text: Optional[str] = None
+        if isinstance(yaml, dict):
+            self.name: Optional[str] = yaml.get("name")
+            self.uses: Optional[str] = yaml.get("uses")
+            self.run: Optional[str] = yaml.get("run")
+            self.if_: Optional[str] = yaml.get("if")
+
+    @property
+    def yaml_text(self) -> str:
+        """
+        str() of the step's YAML, computed once
+        """
+        if self._yaml_text is None:
+            self._yaml_text = str(self.yaml)
+        return self._yaml_text
 
     def get_if(self) -> Optional[str]:
-        if "if" in self.yaml.keys():
-            return self.yaml["if"]
-        else:
-            return None
+        return self.if_
 
     def get_name(self) -> Optional[str]:
-        if "name" in self.yaml.keys():
-            return self.yaml["name"]
-        else:
-            return None
+        return self.name
 
     def get_uses(self) -> Optional[str]:
-        if "uses" in self.yaml.keys():
-            return self.yaml["uses"]
-        else:
-            return None
+        return self.uses
 
     def get_execution(self) -> str:
-        if (uses := self.get_uses()) is not None:
-            return uses
+        if self.uses is not None:
+            return self.uses
         else:
             return self.yaml["run"]
 
@@ -1,30 +1,58 @@
-from typing import Optional
+import time
+from functools import cached_property
+from typing import Optional, Iterable
 
 import gha_ci_detector.util as util
 from gha_ci_detector.Job import Job
 
 
 class Workflow:
-    def __init__(self, file_content: str, name: str = ""):
+    def __init__(self, file_content: str, name: str = "", collect_styling: bool = True):
         self.file_content: str = file_content
+        start = time.perf_counter()
         self.yaml: dict = util.parse_yaml(file_content)
+        self.parse_seconds = time.perf_counter() - start
+        # Calls of get_line_index/get_line_number, reported by the Runner's profile
+        self.line_lookups = 0
+        # Set by Runner(profile=True)
+        self.profile: Optional[dict] = None
         self.name = name
         self.smells = set()
         self.styling = []
+        # Without styling, smell 14 only checks whether there is any yamllint problem
+        self.collect_styling = collect_styling
+        self.__jobs: Optional[list[Job]] = None
 
     @classmethod
-    def from_file(cls, filepath):
+    def from_file(cls, filepath, collect_styling: bool = True):
         try:
             with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
                 data = f.read()
-            return cls(data, filepath)
+            return cls(data, filepath, collect_styling)
         except Exception as e:
             print(f"Error reading file {filepath}: {e}")
             return None
 
     def get_jobs(self) -> list[Job]:
-        jobs = self.yaml['jobs']
-        return list(map(lambda x: Job(x, self.yaml['jobs'][x]), jobs))
+        """
+        The jobs are built on the first call and shared by every later call.
+        """
+        if self.__jobs is None:
+            jobs = self.yaml['jobs']
+            self.__jobs = list(map(lambda x: Job(x, self.yaml['jobs'][x]), jobs))
+        return self.__jobs
+
+    def release(self) -> None:
+        """
+        Drop the parsed YAML, the text and the jobs once the analysis is done. Only the name,
+        smells and styling errors are kept, so finished workflows stay cheap in corpus runs.
+        """
+        self.file_content = None
+        self.yaml = None
+        self.__jobs = None
+        for cached in ("lines", "_Workflow__line_positions", "_Workflow__stripped_positions",
+                       "_Workflow__positions_without_spaces", "yaml_text", "lower_yaml_text"):
+            self.__dict__.pop(cached, None)
 
     def get_keys(self) -> list[str]:
         return list(self.yaml.keys())
@@ -35,18 +63,49 @@ class Workflow:
         else:
             return None
 
-    def __get_stripped_lines(self) -> list[str]:
-        return list(map(lambda x: x.replace("-", "").strip(), self.file_content.split("\n")))
+    @cached_property
+    def yaml_text(self) -> str:
+        """
+        str() of the parsed YAML, which the keyword heuristics search. Stringifying a large
+        workflow is expensive, so it is done once.
+        """
+        return str(self.yaml)
 
-    def __get_lines_without_spaces(self) -> list[str]:
-        return list(map(lambda x: x.replace("-", "").replace(" ", ""), self.__get_stripped_lines()))
+    @cached_property
+    def lower_yaml_text(self) -> str:
+        return self.yaml_text.lower()
 
-    def get_line_number(self, line: str, use_whitespace: bool = True) -> Optional[int]:
-        try:
-            if use_whitespace:
-                return self.__get_stripped_lines().index(line.replace("-", "")) + 1
-            else:
-                return self.__get_lines_without_spaces().index(line.replace("-", "")) + 1
-        except ValueError:
-            return -1
+    @cached_property
+    def lines(self) -> list[str]:
+        return self.file_content.split("\n")
+
+    @staticmethod
+    def __first_positions(lines: Iterable[str]) -> dict[str, int]:
+        # Walk backwards so the first occurrence of a line wins, like list.index
+        return {line: i for i, line in reversed(list(enumerate(lines)))}
+
+    @cached_property
+    def __line_positions(self) -> dict[str, int]:
+        return self.__first_positions(self.lines)
 
+    @cached_property
+    def __stripped_positions(self) -> dict[str, int]:
+        return self.__first_positions(map(lambda x: x.replace("-", "").strip(), self.lines))
+
+    @cached_property
+    def __positions_without_spaces(self) -> dict[str, int]:
+        return self.__first_positions(map(lambda x: x.replace("-", "").strip().replace(" ", ""),
+                                          self.lines))
+
+    def get_line_index(self, line: str) -> int:
+        """
+        :return: the index of the first line equal to the given line, -1 if there is none
+        """
+        self.line_lookups += 1
+        return self.__line_positions.get(line, -1)
+
+    def get_line_number(self, line: str, use_whitespace: bool = True) -> Optional[int]:
+        self.line_lookups += 1
+        positions = self.__stripped_positions if use_whitespace else self.__positions_without_spaces
+        index = positions.get(line.replace("-", ""))
+        return index + 1 if index is not None else -1
@@ -0,0 +1,114 @@
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Iterable
+
+from gha_ci_detector import __version__
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "gha_ci_detector",
+                                  "smells.sqlite3")
+
+
+@functools.lru_cache(maxsize=None)
+def detector_version() -> str:
+    """
+    The package version plus a digest of the detector sources, so editing a rule or the
+    yamllint config invalidates the cached results without bumping the version.
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for fname in sorted(os.listdir(package_dir)):
+        if fname.endswith(".py") or fname.endswith(".yaml"):
+            with open(os.path.join(package_dir, fname), 'rb') as f:
+                digest.update(fname.encode() + b"\0" + f.read())
+    return f"{__version__}+{digest.hexdigest()[:12]}"
+
+
+class SmellCache:
+    """
+    On-disk cache of detection results. An entry is keyed by the sha256 of the workflow text,
+    the workflow name (the name based heuristics read it), the detector version and the rule
+    set. The least recently used entries are evicted once the cache holds more than
+    max_entries entries or max_bytes of results.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 100_000,
+                 max_bytes: int = 256 * 1024 * 1024):
+        self.path = path if path is not None else DEFAULT_CACHE_PATH
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+        if os.path.dirname(self.path) != "":
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # Worker processes share the file, so wait for their writes instead of failing
+        self.__connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self.__connection:
+            self.__connection.execute("PRAGMA journal_mode=WAL")
+            self.__connection.execute("CREATE TABLE IF NOT EXISTS results ("
+                                      "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                                      "size INTEGER NOT NULL, last_used REAL NOT NULL)")
+            self.__connection.execute("CREATE INDEX IF NOT EXISTS results_last_used "
+                                      "ON results (last_used)")
+
+    @staticmethod
+    def key(content: str, name: str, rule_names: Iterable[str], variant: str = "") -> str:
+        """
+        :param content: the workflow text
+        :param name: the workflow name, usually its path
+        :param rule_names: the names of the rules that are run
+        :param variant: separates results of the same workflow that are stored differently
+        """
+        content_hash = hashlib.sha256(content.encode('utf-8', errors='ignore')).hexdigest()
+        return hashlib.sha256("\0".join([content_hash, name, detector_version(),
+                                         ",".join(rule_names), variant]).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self.__lock, self.__connection:
+            row = self.__connection.execute("SELECT value FROM results WHERE key = ?",
+                                            (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.__connection.execute("UPDATE results SET last_used = ? WHERE key = ?",
+                                      (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, key: str, value: dict) -> None:
+        data = json.dumps(value)
+        with self.__lock, self.__connection:
+            self.__connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                                      (key, data, len(data), time.time()))
+            self.__evict()
+
+    def __evict(self) -> None:
+        (count, size) = self.__connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        while count > self.max_entries or size > self.max_bytes:
+            # Drop the oldest tenth at once so a full cache does not evict on every put
+            batch = max(1, count // 10)
+            self.__connection.execute("DELETE FROM results WHERE key IN (SELECT key FROM results "
+                                      "ORDER BY last_used LIMIT ?)", (batch,))
+            (count, size) = self.__connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+
+    def clear(self) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        self.__connection.close()
+
+
+@functools.lru_cache(maxsize=None)
+def open_cache(path: Optional[str] = None) -> SmellCache:
+    """
+    The cache at path, opened once per process.
+    """
+    return SmellCache(path)
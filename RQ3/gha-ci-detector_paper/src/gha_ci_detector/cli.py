@@ -1,22 +1,48 @@
+import contextlib
 import csv
 import json
 import os
 import sys
-from os import listdir
-from os.path import isfile, join
-from typing import Optional, Annotated, Set
+from enum import Enum
+from typing import Optional, Annotated, Iterable, TextIO, TYPE_CHECKING
 
-import pandas as pd
 import typer
 
-from gha_ci_detector import __app_name__, __version__, util
-from gha_ci_detector.Workflow import Workflow
-from gha_ci_detector.Runner import Runner
+from gha_ci_detector import __app_name__, __version__
+
+# The detector, its YAML libraries and pandas are imported by the commands that use them,
+# so --version, --help and the commands that do not need them start quickly.
+# benchmarks/startup_benchmark.py checks this.
+if TYPE_CHECKING:
+    from gha_ci_detector.scan import FileResult, ScanSummary
 
 app = typer.Typer()
 
+JobsOption = Annotated[int, typer.Option(
+    "--jobs", "-j",
+    help="Number of worker processes, results are still reported in input order")]
+
+
+class OutputFormat(str, Enum):
+    text = "text"
+    jsonl = "jsonl"
 
 
+FormatOption = Annotated[OutputFormat, typer.Option(
+    "--format",
+    help="text prints the reports, jsonl prints one JSON record per workflow")]
+CacheOption = Annotated[Optional[str], typer.Option(
+    "--cache",
+    help="SQLite file caching the reports, unchanged workflows are not analyzed again")]
+OnlyOption = Annotated[Optional[str], typer.Option(
+    "--only", help="Comma separated smell ids to detect, e.g. 1,4,5. Other rules do not run")]
+SkipOption = Annotated[Optional[str], typer.Option(
+    "--skip", help="Comma separated smell ids not to detect")]
+ProfileOption = Annotated[Optional[str], typer.Option(
+    "--profile", envvar="GHA_CI_DETECTOR_PROFILE",
+    help="JSON lines file receiving the parse time, rule timings and line lookups of every "
+         "workflow, a summary table is printed to stderr at the end. Disables --cache")]
+
 
 # def main():
 #     app(prog_name=__app_name__)
@@ -38,64 +64,135 @@ def main(version: Optional[bool] = typer.Option(
     return
 
 
-def analyze_and_report_workflow(workflow: Workflow, report: bool = True) -> Set[str]:
-    runner = Runner(workflow)
-    smells = runner.run_all()
-    if report:
-        util.print_smells(smells)
-    if len(workflow.styling) > 0:
-        print("The following styling errors were found: ")
-        for s in workflow.styling:
-            print(s)
-    return smells
+def _parse_smell_ids(value: Optional[str], option: str) -> Optional[list[int]]:
+    if value is None:
+        return None
+    import gha_ci_detector.smell_detector as smell_detector
+    try:
+        ids = [int(i) for i in value.split(",") if i.strip() != ""]
+    except ValueError:
+        raise typer.BadParameter(f"expected comma separated smell ids, got '{value}'",
+                                 param_hint=option)
+    unknown = set(ids) - set(smell_detector.SMELL_IDS)
+    if len(unknown) > 0:
+        raise typer.BadParameter(f"unknown smell ids {sorted(unknown)}, the rules report "
+                                 f"{smell_detector.SMELL_IDS}", param_hint=option)
+    return ids
+
+
+def _selected_smells(only: Optional[str], skip: Optional[str]) -> Optional[set[int]]:
+    if only is None and skip is None:
+        return None
+    import gha_ci_detector.smell_detector as smell_detector
+    return smell_detector.selected_smell_ids(_parse_smell_ids(only, "--only"),
+                                             _parse_smell_ids(skip, "--skip"))
+
+
+def _print_result(result: "FileResult", output_format: OutputFormat) -> None:
+    if output_format == OutputFormat.jsonl:
+        print(json.dumps(result.to_record()))
+    else:
+        print(result.output, end="")
+
+
+def _report_files(workflow_files: Iterable[str], jobs: int, cache: Optional[str],
+                  output_format: OutputFormat, smell_ids: Optional[set[int]],
+                  profile: Optional[str] = None, done: Optional[TextIO] = None,
+                  skip_empty: bool = False) -> "ScanSummary":
+    """
+    Analyze and print the files in order. Every result is printed and dropped as soon as it
+    is ready, only the counters of the summary (printed to stderr) are kept.
+    :param workflow_files: consumed lazily
+    :param profile: sidecar file of the rule timings, None to not time the rules
+    :param done: checkpoint file receiving the name of every analyzed file, files whose
+    analysis failed are left out so a resumed run analyzes them again
+    :param skip_empty: see analyze_file
+    """
+    from gha_ci_detector.profiling import ProfileSummary
+    from gha_ci_detector.scan import ScanSummary, scan_files
+    summary = ScanSummary()
+    timings = ProfileSummary(profile) if profile is not None else None
+    try:
+        for result in scan_files(workflow_files, jobs, cache_path=cache, smell_ids=smell_ids,
+                                 profile=timings is not None, skip_empty=skip_empty):
+            _print_result(result, output_format)
+            summary.add(result)
+            if timings is not None and result.profile is not None:
+                timings.add(result.profile)
+            if done is not None and result.error is None:
+                done.write(os.path.basename(result.path) + "\n")
+                done.flush()
+    finally:
+        if timings is not None:
+            timings.close()
+            print(timings.table(), file=sys.stderr)
+    print(summary, file=sys.stderr)
+    return summary
 
 
 @app.command(name="all")
-def analyze_all(workflow_folder: Annotated[Optional[str], typer.Argument()] = None) -> None:
+def analyze_all(workflow_folder: Annotated[Optional[str], typer.Argument()] = None,
+                jobs: JobsOption = 1, cache: CacheOption = None,
+                output_format: FormatOption = OutputFormat.text,
+                only: OnlyOption = None, skip: SkipOption = None,
+                profile: ProfileOption = None) -> None:
 
+    from gha_ci_detector.scan import iter_workflow_files
     if workflow_folder is None:
         workflow_folder = "./.github/workflows"
 
-    workflow_files = [join(workflow_folder, f) for f in listdir(workflow_folder)
-                      if isfile(join(workflow_folder, f)) and (os.path.splitext(f)[1] == ".yml"
-                                                               or os.path.splitext(f)[1] == ".yaml")]
-    smell_count = {}
-    all_smells = []
-    for wf in workflow_files:
-        workflow = Workflow.from_file(wf)
-        all_smells += list(analyze_and_report_workflow(workflow))
+    _report_files(iter_workflow_files(workflow_folder, (".yml", ".yaml")), jobs, cache,
+                  output_format, _selected_smells(only, skip), profile)
 
 
 @app.command(name="file")
-def analyze_one(file_path: str = typer.Argument()) -> None:
-    workflow = Workflow.from_file(file_path)
-    analyze_and_report_workflow(workflow)
+def analyze_one(file_path: str = typer.Argument(), cache: CacheOption = None,
+                output_format: FormatOption = OutputFormat.text,
+                only: OnlyOption = None, skip: SkipOption = None) -> None:
+    from gha_ci_detector.scan import analyze_and_report_workflow, analyze_file
+    smell_ids = _selected_smells(only, skip)
+    if cache is None and output_format == OutputFormat.text:
+        from gha_ci_detector.Workflow import Workflow
+        workflow = Workflow.from_file(file_path)
+        analyze_and_report_workflow(workflow, smell_ids=smell_ids)
+    else:
+        _print_result(analyze_file(file_path, cache, smell_ids), output_format)
 
 
 @app.command(name="path")
-def analyze_path(directory_path: Annotated[Optional[str], typer.Argument()] = None) -> None:
+def analyze_path(directory_path: Annotated[Optional[str], typer.Argument()] = None,
+                 jobs: JobsOption = 1, cache: CacheOption = None,
+                 output_format: FormatOption = OutputFormat.text,
+                 only: OnlyOption = None, skip: SkipOption = None,
+                 profile: ProfileOption = None) -> None:
     """
     Analyze all workflow files in the given directory path.
     """
+    from gha_ci_detector.scan import iter_workflow_files
     workflow_folder = directory_path if directory_path is not None else "./.github/workflows"
 
-    workflow_files = [join(workflow_folder, f) for f in listdir(workflow_folder)
-                      if isfile(join(workflow_folder, f))]
-    smell_count = {}
-    all_smells = []
-    for wf in workflow_files:
-        workflow = Workflow.from_file(wf)
-        all_smells += list(analyze_and_report_workflow(workflow))
+    _report_files(iter_workflow_files(workflow_folder), jobs, cache, output_format,
+                  _selected_smells(only, skip), profile)
 
 
 @app.command(name="csv")
 def analyze_csv(
     csv_file_path: Annotated[Optional[str], typer.Argument()] = None,
-    workflow_dir: Annotated[Optional[str], typer.Argument()] = None
+    workflow_dir: Annotated[Optional[str], typer.Argument()] = None,
+    jobs: JobsOption = 1,
+    cache: CacheOption = None,
+    output_format: FormatOption = OutputFormat.text,
+    only: OnlyOption = None,
+    skip: SkipOption = None,
+    profile: ProfileOption = None,
+    checkpoint: Annotated[Optional[str], typer.Option(
+        help="File recording the analyzed hashes, an interrupted scan resumes from it")] = None
 ) -> None:
     """
     Analyze workflow files in workflow_dir whose filename matches file_hash in the given CSV file.
     """
+    import pandas as pd
+    smell_ids = _selected_smells(only, skip)
     if csv_file_path is None:
         print("CSV file path is required.", file=sys.stderr)
         return
@@ -124,12 +221,42 @@ def analyze_csv(
         print(f"Error reading CSV file: {e}", file=sys.stderr)
         return
 
+    # 체크포인트에 기록된 (이미 분석한) 해시는 건너뜀
+    finished = set()
+    if checkpoint is not None and os.path.isfile(checkpoint):
+        with open(checkpoint, 'r', encoding='utf-8') as f:
+            finished = set(line.strip() for line in f if line.strip())
+        print(f"Resuming from {checkpoint}: skipping {len(finished)} analyzed files",
+              file=sys.stderr)
+
     # workflow_dir의 모든 파일에 대해 반복
-    for fname in os.listdir(workflow_dir):
-        fpath = os.path.join(workflow_dir, fname)
-        if os.path.isfile(fpath) and fname in file_hashes:
-            workflow = Workflow.from_file(fpath)
-            if workflow and workflow.file_content: # 워크플로 객체가 유효하고 내용이 있는지 확인
-                analyze_and_report_workflow(workflow)
-            else:
-                print(f"Skipping analysis for problematic file: {fname}")
\ No newline at end of file
+    from gha_ci_detector.scan import iter_workflow_files
+    workflow_files = (path for path in iter_workflow_files(workflow_dir)
+                      if os.path.basename(path) in file_hashes
+                      and os.path.basename(path) not in finished)
+    with open(checkpoint, 'a', encoding='utf-8') if checkpoint is not None \
+            else contextlib.nullcontext() as done:
+        # csv는 기존처럼 비어 있거나 읽을 수 없는 워크플로를 분석하지 않음
+        _report_files(workflow_files, jobs, cache, output_format, smell_ids, profile, done,
+                      skip_empty=True)
+
+
+@app.command(name="serve")
+def serve(socket: Annotated[Optional[str], typer.Option(
+              help="Unix socket to listen on instead of stdin/stdout")] = None,
+          cache: CacheOption = None) -> None:
+    """
+    Keep the detector loaded and answer JSON lines requests, one per line:
+    {"path": ...} or {"content": ..., "name": ...}, optionally with "smell_ids", "skip" and "id".
+    Each request gets one response line with the smells as records.
+    """
+    from gha_ci_detector.cache import open_cache
+    from gha_ci_detector.server import serve_socket, serve_stream
+    smell_cache = open_cache(cache) if cache is not None else None
+    if socket is not None:
+        try:
+            serve_socket(socket, smell_cache)
+        except FileExistsError as e:
+            raise typer.BadParameter(str(e), param_hint="--socket")
+    else:
+        serve_stream(sys.stdin, sys.stdout, smell_cache)
@@ -0,0 +1,97 @@
+import contextlib
+import re
+from dataclasses import dataclass, asdict
+from typing import Optional, Iterable
+
+import gha_ci_detector.smell_detector as smell_detector
+from gha_ci_detector.Runner import Runner
+from gha_ci_detector.cache import SmellCache
+from gha_ci_detector.Workflow import Workflow
+from gha_ci_detector.util import quiet_output
+
+# "10. Avoid jobs without timeouts (line: 16)" -> id, description
+_SMELL_PATTERN = re.compile(r"^(\d+)\.\s+(.*)$", re.DOTALL)
+# "(line 7)", "(line: 16)", "(lines 3:9)", "(job at line: 12)", "line 3:9"
+_LINE_PATTERN = re.compile(r"lines?:?\s+(-?\d+)(?::(-?\d+))?")
+# "(job: build)" or "... for job build"
+_JOB_PATTERN = re.compile(r"\(job: ([^)]+)\)|for job (.+)$")
+
+
+@dataclass(frozen=True)
+class SmellRecord:
+    id: int
+    message: str
+    description: str
+    start_line: Optional[int] = None
+    end_line: Optional[int] = None
+    job: Optional[str] = None
+
+    @classmethod
+    def from_message(cls, message: str) -> "SmellRecord":
+        match = _SMELL_PATTERN.match(message)
+        if match is None:
+            return cls(-1, message, message)
+        description = match.group(2)
+        start_line, end_line = None, None
+        if (line_match := _LINE_PATTERN.search(description)) is not None:
+            start_line = int(line_match.group(1))
+            end_line = int(line_match.group(2)) if line_match.group(2) is not None else start_line
+        job = None
+        if (job_match := _JOB_PATTERN.search(description)) is not None:
+            job = (job_match.group(1) or job_match.group(2)).strip()
+        return cls(int(match.group(1)), message, description, start_line, end_line, job)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _smell_records(smells: set[str]) -> list[SmellRecord]:
+    return sorted(map(SmellRecord.from_message, smells), key=lambda r: (r.id, r.message))
+
+
+def detect_workflow(workflow: Workflow, smell_ids: Optional[Iterable[int]] = None,
+                    quiet: bool = True, skip: Optional[Iterable[int]] = None) -> list[SmellRecord]:
+    """
+    Run the rules on an already constructed workflow and return the smells as records,
+    ordered by smell id. If smell_ids (or skip) is given only the rules needed for the
+    selected smells run and only those smells, plus 23 for selected rules that failed,
+    are returned.
+    The rules print their diagnostics to stdout, quiet silences them in this thread only.
+    """
+    with quiet_output() if quiet else contextlib.nullcontext():
+        smells = Runner(workflow, smell_ids=smell_detector.selected_smell_ids(smell_ids, skip)
+                        ).run_all()
+    return _smell_records(smells)
+
+
+def detect_content(content: str, name: str = "", smell_ids: Optional[Iterable[int]] = None,
+                   quiet: bool = True, cache: Optional[SmellCache] = None,
+                   skip: Optional[Iterable[int]] = None) -> list[SmellRecord]:
+    """
+    Detect smells in the given YAML text. The name is used by the name based heuristics,
+    so pass the original file path when there is one. See detect_workflow for the selection.
+    With a cache, a workflow that was analyzed before is not analyzed again.
+    """
+    selected = smell_detector.selected_smell_ids(smell_ids, skip)
+    key = None
+    if cache is not None:
+        key = cache.key(content, name, [rule.name for rule in smell_detector.RULES],
+                        f"records:{sorted(selected) if selected is not None else 'all'}")
+        if (cached := cache.get(key)) is not None:
+            return _smell_records(set(cached["smells"]))
+
+    with quiet_output() if quiet else contextlib.nullcontext():
+        workflow = Workflow(content, name, collect_styling=False)
+        smells = Runner(workflow, smell_ids=selected).run_all()
+    workflow.release()
+    if key is not None:
+        cache.put(key, {"smells": sorted(smells)})
+    return _smell_records(smells)
+
+
+def detect_file(filepath: str, smell_ids: Optional[Iterable[int]] = None,
+                quiet: bool = True, cache: Optional[SmellCache] = None,
+                skip: Optional[Iterable[int]] = None) -> list[SmellRecord]:
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+    return detect_content(content, filepath, smell_ids, quiet, cache, skip)
@@ -0,0 +1,193 @@
+import time
+from functools import partial
+from typing import Iterable, Optional
+
+import yaml  # YAML 예외 처리를 위해 import 추가
+
+from gha_ci_detector.Job import Job
+from gha_ci_detector.Step import Step
+from gha_ci_detector.Workflow import Workflow
+from gha_ci_detector.util import report
+
+# Exceptions caused by an unexpected workflow structure. A rule raising one of these stops and
+# reports '23. Avoid incorrectly unparsable workflows', every other exception is a bug.
+PARSING_ERRORS = (AttributeError, TypeError, KeyError, IndexError,
+                  yaml.YAMLError,  # YAML 관련 모든 예외를 포괄적으로 처리
+                  yaml.reader.ReaderError, yaml.scanner.ScannerError,
+                  yaml.parser.ParserError)
+
+
+class Rule:
+    """
+    A smell rule driven by run_rules. The workflow is walked once and every rule receives the
+    nodes it subscribes to: visit_workflow, then visit_job for every job, visit_step for the
+    steps of the jobs it asked for and leave_job once those steps are done.
+    """
+    # Reported in smell 23 when the rule fails on the workflow structure
+    name: str = ""
+    # Rules that must not fail for this rule to run, what this rule found is discarded otherwise
+    depends_on: tuple[type["Rule"], ...] = ()
+    # Top level workflow keys the rule needs, it is skipped when one of them is missing
+    requires_keys: tuple[str, ...] = ()
+    # The smells the rule reports, used to select the rules to run
+    smell_ids: tuple[int, ...] = ()
+
+    def __init__(self):
+        self.smells: list[str] = []
+        self.failed = False
+        self.cancelled = False
+
+    @property
+    def running(self) -> bool:
+        return not self.failed and not self.cancelled
+
+    def report(self, smell: str) -> None:
+        self.smells.append(smell)
+
+    def visit_workflow(self, workflow: Workflow) -> bool:
+        """
+        :return: whether the rule wants to visit the jobs
+        """
+        return True
+
+    def visit_job(self, workflow: Workflow, job: Job) -> bool:
+        """
+        :return: whether the rule wants to visit the steps of this job
+        """
+        return False
+
+    def visit_step(self, workflow: Workflow, job: Job, step: Step) -> None:
+        pass
+
+    def leave_job(self, workflow: Workflow, job: Job) -> None:
+        pass
+
+
+def _cancel_dependents(rule: Rule, rules: list[Rule]) -> None:
+    for other in rules:
+        if not other.cancelled and type(rule) in other.depends_on:
+            other.cancelled = True
+            _cancel_dependents(other, rules)
+
+
+def _fail(rule: Rule, error: Exception, rules: list[Rule]) -> None:
+    rule.failed = True
+    # 디버깅을 위해 어떤 예외가 발생했는지 출력할 수 있습니다
+    report(f"YAML parsing error in {rule.name}: {str(error)}")
+    _cancel_dependents(rule, rules)
+
+
+def _call(rule: Rule, rules: list[Rule], method, *args) -> bool:
+    try:
+        return method(*args)
+    except PARSING_ERRORS as e:
+        _fail(rule, e, rules)
+        return False
+
+
+def _timed_call(timings: dict[str, float], rule: Rule, rules: list[Rule], method, *args) -> bool:
+    start = time.perf_counter()
+    try:
+        return _call(rule, rules, method, *args)
+    finally:
+        timings[type(rule).__name__] += time.perf_counter() - start
+
+
+def _is_missing_keys(workflow: Workflow, rule: Rule) -> bool:
+    # An unparsable workflow still runs the rule, so it reports smell 23 as before
+    return isinstance(workflow.yaml, dict) and any(key not in workflow.yaml
+                                                   for key in rule.requires_keys)
+
+
+def select_rules(rule_classes: Iterable[type[Rule]],
+                 smell_ids: Optional[Iterable[int]]) -> list[type[Rule]]:
+    """
+    The rules reporting one of the given smells, plus the rules they depend on, in their
+    original order.
+    :param rule_classes:
+    :param smell_ids: None selects all rules
+    """
+    rule_classes = list(rule_classes)
+    if smell_ids is None:
+        return rule_classes
+    wanted = set(smell_ids)
+    selected = set()
+    pending = [rule for rule in rule_classes if not wanted.isdisjoint(rule.smell_ids)]
+    while len(pending) > 0:
+        rule = pending.pop()
+        if rule not in selected:
+            selected.add(rule)
+            pending.extend(rule.depends_on)
+    return [rule for rule in rule_classes if rule in selected]
+
+
+def _smell_id(smell: str) -> int:
+    return int(smell.split(".")[0])
+
+
+def run_rules(workflow: Workflow, rule_classes: Iterable[type[Rule]],
+              smell_ids: Optional[Iterable[int]] = None,
+              timings: Optional[dict[str, float]] = None) -> set[str]:
+    """
+    Walk the workflow, its jobs and their steps once and dispatch every node to the rules
+    that subscribed to it. The smells of the rules are added to workflow.smells.
+    :param workflow:
+    :param rule_classes:
+    :param smell_ids: only keep these smells (and 23), the rest is what the selected rules'
+    dependencies found
+    :param timings: when given, the seconds spent in each rule are added to it by rule class name
+    :return: the smells of the workflow
+    """
+    rules = [rule_class() for rule_class in rule_classes]
+    smell_ids = set(smell_ids) if smell_ids is not None else None
+    call = _call
+    if timings is not None:
+        for rule in rules:
+            timings.setdefault(type(rule).__name__, 0.0)
+        call = partial(_timed_call, timings)
+
+    job_rules = []
+    for rule in rules:
+        if rule.running and not _is_missing_keys(workflow, rule):
+            if call(rule, rules, rule.visit_workflow, workflow):
+                job_rules.append(rule)
+
+    if len(job_rules) > 0:
+        try:
+            jobs = workflow.get_jobs()
+        except PARSING_ERRORS as e:
+            for rule in job_rules:
+                if rule.running:
+                    _fail(rule, e, rules)
+            jobs = []
+
+        for job in jobs:
+            step_rules = [rule for rule in job_rules
+                          if rule.running and call(rule, rules, rule.visit_job, workflow, job)]
+            if len(step_rules) == 0:
+                continue
+            try:
+                steps = job.get_steps()
+            except PARSING_ERRORS as e:
+                for rule in step_rules:
+                    if rule.running:
+                        _fail(rule, e, rules)
+                continue
+            for step in steps:
+                for rule in step_rules:
+                    if rule.running:
+                        call(rule, rules, rule.visit_step, workflow, job, step)
+            for rule in step_rules:
+                if rule.running:
+                    call(rule, rules, rule.leave_job, workflow, job)
+
+    for rule in rules:
+        if rule.cancelled:
+            continue
+        if smell_ids is None:
+            workflow.smells.update(rule.smells)
+        else:
+            workflow.smells.update(smell for smell in rule.smells if _smell_id(smell) in smell_ids)
+        if rule.failed:
+            workflow.smells.add(f"23. Avoid incorrectly unparsable workflows (error in {rule.name})")
+    return workflow.smells
@@ -0,0 +1,39 @@
+import re
+from typing import Iterable
+
+
+class KeywordMatcher:
+    """
+    Checks which of a fixed set of keywords occur in a text, built once at import by the rules.
+    Both checks scan a string once with a combined regex of all keywords, contains_any stops at
+    the first match, see benchmarks/keyword_benchmark.py. Matching is case sensitive, lower the
+    text for case insensitive checks. Like 'in', texts that are not strings are checked element
+    wise.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: tuple[str, ...] = tuple(dict.fromkeys(keywords))
+        # Longest first, so at every position the lookahead matches the longest keyword there
+        alternatives = "|".join(map(re.escape, sorted(self.keywords, key=len, reverse=True)))
+        self._search = re.compile(alternatives).search if len(self.keywords) > 0 else None
+        self._regex = re.compile(f"(?=({alternatives}))") if len(self.keywords) > 0 else None
+        # The keywords that occur whenever another one matches, e.g. "github.repository" in
+        # "github.repository_owner", since one position only reports its longest keyword
+        self._contained = {keyword: frozenset(other for other in self.keywords if other in keyword)
+                           for keyword in self.keywords}
+
+    def contains_any(self, text: str) -> bool:
+        if not isinstance(text, str) or self._search is None:
+            return any(keyword in text for keyword in self.keywords)
+        return self._search(text) is not None
+
+    def find_all(self, text: str) -> set[str]:
+        if not isinstance(text, str) or self._regex is None:
+            return {keyword for keyword in self.keywords if keyword in text}
+        found = set()
+        for match in self._regex.finditer(text):
+            found |= self._contained[match.group(1)]
+        return found
+
+    def __repr__(self):
+        return f"KeywordMatcher({list(self.keywords)})"
@@ -0,0 +1,51 @@
+import json
+from typing import TextIO
+
+# Default of the --profile option of the corpus commands
+PROFILE_ENV = "GHA_CI_DETECTOR_PROFILE"
+
+
+class ProfileSummary:
+    """
+    Writes the profiles of Runner(profile=True) to a JSON lines sidecar and aggregates them
+    per rule for the summary table printed at the end of a run.
+    """
+
+    def __init__(self, sidecar_path: str):
+        self.sidecar: TextIO = open(sidecar_path, 'w', encoding='utf-8')
+        self.workflows = 0
+        self.parse_ms = 0.0
+        self.run_ms = 0.0
+        self.line_lookups = 0
+        # rule -> [total ms, slowest ms, slowest file]
+        self.rules: dict[str, list] = {}
+
+    def add(self, profile: dict) -> None:
+        self.sidecar.write(json.dumps(profile) + "\n")
+        self.workflows += 1
+        self.parse_ms += profile["parse_ms"]
+        self.run_ms += profile["run_ms"]
+        self.line_lookups += profile["line_lookups"]
+        for rule, ms in profile["rules"].items():
+            totals = self.rules.setdefault(rule, [0.0, 0.0, None])
+            totals[0] += ms
+            if ms > totals[1]:
+                totals[1], totals[2] = ms, profile["file"]
+
+    def close(self) -> None:
+        self.sidecar.close()
+
+    def table(self) -> str:
+        count = max(self.workflows, 1)
+        lines = [f"Profiled {self.workflows} workflows: parsing {self.parse_ms:.1f} ms, "
+                 f"rules {self.run_ms:.1f} ms, {self.line_lookups} line lookups",
+                 f"{'rule':<40} {'total ms':>10} {'ms/file':>8} {'share':>6} {'max ms':>8}  slowest file"]
+        for rule, (total, slowest, file) in sorted(self.rules.items(), key=lambda r: -r[1][0]):
+            share = 100 * total / self.run_ms if self.run_ms > 0 else 0.0
+            lines.append(f"{rule:<40} {total:10.1f} {total / count:8.3f} {share:5.1f}% "
+                         f"{slowest:8.2f}  {file}")
+        # Walking the workflow and building the jobs and steps, outside of the rules
+        other = self.run_ms - sum(totals[0] for totals in self.rules.values())
+        lines.append(f"{'(engine)':<40} {other:10.1f} {other / count:8.3f}")
+        return "\n".join(lines)
+
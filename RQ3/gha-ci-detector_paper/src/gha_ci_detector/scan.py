@@ -0,0 +1,184 @@
+import contextlib
+import io
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, Future
+from dataclasses import dataclass, field
+from typing import Optional, Iterable, Iterator
+
+import gha_ci_detector.smell_detector as smell_detector
+from gha_ci_detector import util
+from gha_ci_detector.Runner import Runner
+from gha_ci_detector.cache import open_cache
+from gha_ci_detector.detection import SmellRecord
+from gha_ci_detector.Workflow import Workflow
+
+
+@dataclass
+class FileResult:
+    path: str
+    # None when the file could not be analyzed
+    smells: Optional[set[str]]
+    # Everything the analysis printed for this file
+    output: str = ""
+    error: Optional[str] = None
+    # Number of yamllint problems
+    styling: int = 0
+    # Rule timings of the analysis, see Runner(profile=True)
+    profile: Optional[dict] = None
+
+    def to_record(self) -> dict:
+        """
+        The result as one JSON lines record, see the --format jsonl option
+        """
+        smells = None
+        if self.smells is not None:
+            smells = [{"id": r.id, "start_line": r.start_line, "end_line": r.end_line,
+                       "job": r.job, "message": r.message}
+                      for r in sorted(map(SmellRecord.from_message, self.smells),
+                                      key=lambda r: (r.id, r.message))]
+        return {
+            "file": self.path,
+            "smell_ids": sorted({s["id"] for s in smells}) if smells is not None else None,
+            "smells": smells,
+            "styling": self.styling,
+            "error": self.error
+        }
+
+
+@dataclass
+class ScanSummary:
+    """
+    Counters updated with every result, so a scan keeps no results to summarize them.
+    """
+    files: int = 0
+    analyzed: int = 0
+    errors: int = 0
+    smells: int = 0
+    smell_counts: Counter = field(default_factory=Counter)
+
+    def add(self, result: FileResult) -> None:
+        self.files += 1
+        if result.error is not None:
+            self.errors += 1
+        if result.smells is not None:
+            self.analyzed += 1
+            self.smells += len(result.smells)
+            self.smell_counts.update(int(smell.split(".")[0]) for smell in result.smells)
+
+    def __str__(self):
+        counts = ", ".join(f"{i}: {n}" for i, n in sorted(self.smell_counts.items()))
+        return (f"Analyzed {self.analyzed} of {self.files} workflows ({self.errors} errors), "
+                f"found {self.smells} smells" + (f" ({counts})" if counts else ""))
+
+
+def iter_workflow_files(folder: str, extensions: Optional[tuple[str, ...]] = None) -> Iterator[str]:
+    """
+    The paths of the files in folder, in directory order, read lazily with os.scandir.
+    :param folder:
+    :param extensions: only files ending in one of these, e.g. (".yml", ".yaml")
+    """
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_file() and (extensions is None
+                                    or os.path.splitext(entry.name)[1] in extensions):
+                yield entry.path
+
+
+def analyze_and_report_workflow(workflow: Workflow, report: bool = True,
+                                smell_ids: Optional[set[int]] = None,
+                                profile: bool = False) -> set[str]:
+    runner = Runner(workflow, smell_ids=smell_ids, profile=profile)
+    smells = runner.run_all()
+    if report:
+        util.print_smells(smells)
+    if len(workflow.styling) > 0:
+        print("The following styling errors were found: ")
+        for s in workflow.styling:
+            print(s)
+    workflow.release()
+    return smells
+
+
+def _read_file(filepath: str) -> Optional[str]:
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
+    except OSError:
+        # Workflow.from_file reports it
+        return None
+
+
+def analyze_file(filepath: str, cache_path: Optional[str] = None,
+                 smell_ids: Optional[set[int]] = None, profile: bool = False,
+                 skip_empty: bool = False) -> FileResult:
+    """
+    Analyze and report a single file with its output captured. Any error stays with the file,
+    so one broken workflow does not stop the scan of the others.
+    :param filepath:
+    :param cache_path: the SmellCache to reuse reports from, None to always analyze
+    :param smell_ids: only detect these smells, see Runner
+    :param profile: time the rules, the cache is not used then
+    :param skip_empty: do not analyze unreadable or empty files (what the csv command does)
+    """
+    key, cache = None, None
+    if cache_path is not None and not profile and (content := _read_file(filepath)) is not None:
+        cache = open_cache(cache_path)
+        key = cache.key(content, filepath, [rule.name for rule in smell_detector.RULES],
+                        f"report:{sorted(smell_ids) if smell_ids is not None else 'all'}")
+        if (cached := cache.get(key)) is not None:
+            return FileResult(filepath, set(cached["smells"]), cached["output"],
+                              styling=cached["styling"])
+
+    buffer = io.StringIO()
+    smells, error, styling, timings = None, None, 0, None
+    with contextlib.redirect_stdout(buffer):
+        try:
+            workflow = Workflow.from_file(filepath)
+            if skip_empty and not (workflow and workflow.file_content):
+                print(f"Skipping analysis for problematic file: {os.path.basename(filepath)}")
+            else:
+                smells = analyze_and_report_workflow(workflow, smell_ids=smell_ids,
+                                                     profile=profile)
+                styling = len(workflow.styling)
+                timings = workflow.profile
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            print(f"Error analyzing {filepath}: {error}")
+    if key is not None and smells is not None:
+        cache.put(key, {"smells": sorted(smells), "output": buffer.getvalue(),
+                        "styling": styling})
+    return FileResult(filepath, smells, buffer.getvalue(), error, styling, timings)
+
+
+def scan_files(filepaths: Iterable[str], jobs: int = 1, max_in_flight: Optional[int] = None,
+               cache_path: Optional[str] = None, smell_ids: Optional[set[int]] = None,
+               profile: bool = False, skip_empty: bool = False) -> Iterator[FileResult]:
+    """
+    Analyze the files on a pool of jobs processes and yield the results in input order.
+    The paths are consumed lazily and at most max_in_flight files (2 * jobs by default) are
+    queued at once, so only a few reports are held in memory at any time.
+    :param filepaths:
+    :param jobs: number of worker processes, 1 analyzes the files in this process
+    :param max_in_flight:
+    :param cache_path: see analyze_file
+    :param smell_ids: see analyze_file
+    :param profile: see analyze_file
+    :param skip_empty: see analyze_file
+    :return: the results in the order of filepaths
+    """
+    if jobs <= 1:
+        for filepath in filepaths:
+            yield analyze_file(filepath, cache_path, smell_ids, profile, skip_empty)
+        return
+
+    max_in_flight = max_in_flight if max_in_flight is not None else 2 * jobs
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending: deque[Future] = deque()
+        for filepath in filepaths:
+            pending.append(executor.submit(analyze_file, filepath, cache_path, smell_ids,
+                                           profile, skip_empty))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while len(pending) > 0:
+            yield pending.popleft().result()
@@ -0,0 +1,109 @@
+import json
+import os
+import socket
+import socketserver
+import stat
+from typing import Optional, TextIO
+
+from gha_ci_detector import detection
+from gha_ci_detector.cache import SmellCache
+
+def handle_request(request: dict, cache: Optional[SmellCache] = None) -> dict:
+    """
+    Answer one request of the serve mode.
+    A request is {"path": ...} or {"content": ..., "name": ...}, optionally with "smell_ids"
+    and "skip" as in detect_content and an "id" that is copied to the response.
+    The response is {"id": ..., "smells": [SmellRecord dicts], "error": None}, or smells None
+    and the error message when the request failed.
+    """
+    response = {"id": request.get("id"), "smells": None, "error": None}
+    try:
+        if "content" in request:
+            content, name = request["content"], request.get("name", "")
+        elif "path" in request:
+            with open(request["path"], 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+            name = request.get("name", request["path"])
+        else:
+            raise ValueError("expected 'path' or 'content'")
+        records = detection.detect_content(content, name, request.get("smell_ids"),
+                                           cache=cache, skip=request.get("skip"))
+        response["smells"] = [record.to_dict() for record in records]
+    except Exception as e:
+        response["error"] = f"{type(e).__name__}: {e}"
+    return response
+
+
+def _answer(line: str, cache: Optional[SmellCache]) -> Optional[str]:
+    if line.strip() == "":
+        return None
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("expected a JSON object")
+    except ValueError as e:
+        return json.dumps({"id": None, "smells": None, "error": f"Invalid request: {e}"})
+    return json.dumps(handle_request(request, cache))
+
+
+def serve_stream(instream: TextIO, outstream: TextIO, cache: Optional[SmellCache] = None) -> None:
+    """
+    Answer JSON lines requests from instream on outstream until instream is closed.
+    Every request gets exactly one response line, in order.
+    """
+    for line in instream:
+        if (response := _answer(line, cache)) is not None:
+            outstream.write(response + "\n")
+            outstream.flush()
+
+
+class _StreamHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if (response := _answer(line.decode('utf-8', errors='ignore'),
+                                    self.server.cache)) is not None:
+                self.wfile.write(response.encode('utf-8') + b"\n")
+                self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, cache: Optional[SmellCache]):
+        self.cache = cache
+        super().__init__(path, _StreamHandler)
+
+
+def _remove_stale_socket(path: str) -> None:
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            # Left behind by a server that did not shut down cleanly
+            os.remove(path)
+            return
+        except OSError as e:
+            raise FileExistsError(f"{path} is a socket that cannot be checked: {e}")
+    raise FileExistsError(f"{path} is in use by a running server")
+
+
+def serve_socket(path: str, cache: Optional[SmellCache] = None) -> None:
+    """
+    Answer JSON lines requests on a Unix socket at path, one connection per client,
+    until interrupted. A stale socket file at path, one nothing listens on, is replaced.
+    :raises FileExistsError: path is another file or a socket of a running server
+    """
+    _remove_stale_socket(path)
+    with _UnixServer(path, cache) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(path)
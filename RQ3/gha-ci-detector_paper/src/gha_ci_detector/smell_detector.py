@@ -1,379 +1,463 @@
+import functools
+import os
 import re
-from typing import Optional
-from functools import wraps
-import yaml  # YAML 예외 처리를 위해 import 추가
-
-from yamllint import linter, config
+from typing import Optional, Iterable, Iterator, TYPE_CHECKING
 
 from gha_ci_detector.Job import Job
 from gha_ci_detector.Step import Step
 from gha_ci_detector.Workflow import Workflow
+from gha_ci_detector.engine import Rule, run_rules, select_rules
+from gha_ci_detector.keywords import KeywordMatcher
+
+# yamllint takes longer to import than the rest of the detector and only smell 14 needs it
+if TYPE_CHECKING:
+    from yamllint import config
+    from yamllint.linter import LintProblem
+
+
+YAMLLINT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "yamllintconf.yaml")
+
+
+@functools.lru_cache(maxsize=None)
+def yamllint_config() -> "config.YamlLintConfig":
+    """
+    The yamllint configuration shipped with the package, loaded once per process.
+    """
+    from yamllint import config
+    return config.YamlLintConfig(file=YAMLLINT_CONFIG_PATH)
 
 
-def handle_yaml_parsing_errors(func):
+def lint(content: str) -> Iterator["LintProblem"]:
     """
-    YAML 파싱 관련 예외들을 처리하는 데코레이터.
-    예외 발생 시, '23. Avoid incorrectly unparsable workflows' 스멜을 추가하고 계속 진행합니다.
+    The yamllint problems of content, found lazily.
     """
-    @wraps(func)
-    def wrapper(workflow: Workflow, *args, **kwargs):
-        try:
-            return func(workflow, *args, **kwargs)
-        except (AttributeError, TypeError, KeyError, IndexError,
-                yaml.YAMLError,  # YAML 관련 모든 예외를 포괄적으로 처리
-                yaml.reader.ReaderError, yaml.scanner.ScannerError,
-                yaml.parser.ParserError) as e:
-            # 예외가 발생하면, 잘못된 형식의 워크플로 스멜을 추가합니다
-            smell_message = f"23. Avoid incorrectly unparsable workflows (error in {func.__name__})"
-            workflow.smells.add(smell_message)
-            # 디버깅을 위해 어떤 예외가 발생했는지 출력할 수 있습니다
-            print(f"YAML parsing error in {func.__name__}: {str(e)}")
-            return None  # 명시적으로 None 반환
-    return wrapper
-
-
-@handle_yaml_parsing_errors
-def files_should_be_indented_correctly(workflow: Workflow) -> None:
-    rules = """
-        extends: default
-
-        rules:
-        document-start: false
-        line-length:
-            max: 400
-        truthy:
-            check-keys: false
+    from yamllint import linter
+    return iter(linter.run(content, yamllint_config()))
+
 
+def has_styling_problems(content: str) -> bool:
     """
-    #yaml_config = config.YamlLintConfig(content=rules)
-    yaml_config = config.YamlLintConfig(file="/Users/nam/Desktop/repository/Catching-Smells/RQ3/gha-ci-detector/src/gha_ci_detector/yamllintconf.yaml")
-    problems = list(linter.run(workflow.file_content, yaml_config))
-    if len(problems) > 0:
-        workflow.smells.add("14. Avoid incorrectly formatted workflows")
-    workflow.styling = problems
-    # Maybe this needs to be renamed to correctly formatted workflows?
+    Stop linting at the first problem, for when only smell 14 and not the styling is needed.
+    """
+    return next(lint(content), None) is not None
+
+
+class FilesShouldBeIndentedCorrectly(Rule):
+    name = "files_should_be_indented_correctly"
+    smell_ids = (14,)
 
+    def visit_workflow(self, workflow: Workflow) -> bool:
+        if workflow.collect_styling:
+            problems = list(lint(workflow.file_content))
+            has_problems = len(problems) > 0
+            workflow.styling = problems
+        else:
+            has_problems = has_styling_problems(workflow.file_content)
+        if has_problems:
+            self.report("14. Avoid incorrectly formatted workflows")
+        # Maybe this needs to be renamed to correctly formatted workflows?
+        return False
 
-@handle_yaml_parsing_errors
-def external_actions_must_have_permissions_workflow(workflow: Workflow) -> None:
+
+# The keyword lists of the heuristics, compiled once at import
+GITHUB_TOKENS = KeywordMatcher(["secrets.GITHUB_TOKEN", "secrets.GH_BOT_ACCESS_TOKEN"])
+REPOSITORY_CONDITIONS = KeywordMatcher(["github.repository", "github.repository_owner",
+                                        "repo.full_name"])
+CI_KEYWORDS = KeywordMatcher(["lint", "build", "test", "compile", "style", "ci", "codeql",
+                              "cypress"])
+UPLOAD_ACTIONS = KeywordMatcher(["actions/upload-artifact", "coverallsapp/github-action",
+                                 "codecov/codecov-action"])
+# Unlike REPOSITORY_CONDITIONS without repo.full_name
+REPOSITORY_OWNER_CONDITIONS = KeywordMatcher(["github.repository", "github.repository_owner"])
+BUILD_OR_TEST = KeywordMatcher(["build", "test"])
+
+
+def _uses_github_token(yaml_text: str) -> bool:
+    return GITHUB_TOKENS.contains_any(yaml_text)
+
+
+class GithubTokenPermissions(Rule):
     """
     Check if the change adds 'permission' and if we are using an external action.
     Make sure we distinguish between job and workflow
-    :param workflow:
-    :return:
+    This is the first pass of external_actions_must_have_permissions_workflow, which looks at
+    the jobs using secrets.GITHUB_TOKEN
     """
-    if "permissions" in workflow.yaml.keys():
-        return
-
-    # Are we using secrets?
-    jobs_using_secrets = []
-    if ("secrets.GITHUB_TOKEN" in str(workflow.yaml) or
-            "secrets.GH_BOT_ACCESS_TOKEN" in str(workflow.yaml)):
-        jobs_using_secrets = list(filter(lambda j: "secrets.GITHUB_TOKEN" in str(j.yaml)
-                                                   or "secrets.GH_BOT_ACCESS_TOKEN" in str(j.yaml),
-                                         workflow.get_jobs()))
-    # We have jobs with secrets.GITHUB_TOKEN
-    if len(jobs_using_secrets) > 0:
-        # There is no global permissions set
-        for job in jobs_using_secrets:
-            if not job.has_permissions():
-                line_nr = workflow.get_line_number(job.name + ":", use_whitespace=False)
-                workflow.smells.add("15. Use permissions whenever using Github Token (job at line "
-                                    f"{line_nr})")
+    name = "external_actions_must_have_permissions_workflow"
+    smell_ids = (15,)
 
-    for job in workflow.get_jobs():
-        if job.has_permissions():
-            continue
-        for step in job.get_steps():
-            if "uses" in step.yaml.keys():
-                line_nr = workflow.get_line_number(job.name + ":", use_whitespace=False)
-                workflow.smells.add("6. Define permissions for workflows with external actions ("
-                                    "job "
-                                    f"at line: {line_nr})")
+    def visit_workflow(self, workflow: Workflow) -> bool:
+        if "permissions" in workflow.yaml.keys():
+            return False
+        # Are we using secrets?
+        return _uses_github_token(workflow.yaml_text)
+
+    def visit_job(self, workflow: Workflow, job: Job) -> bool:
+        # We have a job with secrets.GITHUB_TOKEN and there is no global permissions set
+        if _uses_github_token(job.yaml_text) and not job.has_permissions():
+            line_nr = workflow.get_line_number(job.name + ":", use_whitespace=False)
+            self.report("15. Use permissions whenever using Github Token (job at line "
+                        f"{line_nr})")
+        return False
 
 
-@handle_yaml_parsing_errors
-def pull_based_actions_on_fork(workflow: Workflow) -> None:
+class ExternalActionsPermissions(Rule):
+    """
+    Second pass of external_actions_must_have_permissions_workflow, it only runs when the
+    first pass did not fail.
+    """
+    name = "external_actions_must_have_permissions_workflow"
+    smell_ids = (6,)
+    depends_on = (GithubTokenPermissions,)
+
+    def visit_workflow(self, workflow: Workflow) -> bool:
+        return "permissions" not in workflow.yaml.keys()
+
+    def visit_job(self, workflow: Workflow, job: Job) -> bool:
+        return not job.has_permissions()
+
+    def visit_step(self, workflow: Workflow, job: Job, step: Step) -> None:
+        if "uses" in step.yaml.keys():
+            line_nr = workflow.get_line_number(job.name + ":", use_whitespace=False)
+            self.report("6. Define permissions for workflows with external actions ("
+                        "job "
+                        f"at line: {line_nr})")
+
+
+def _is_pull_based_name(name) -> bool:
+    if name is None:
+        return False
+    # Names are short and this is the most frequent check, where a chain of 'in' tests is
+    # about twice as fast as a KeywordMatcher, see benchmarks/keyword_benchmark.py
+    return (" pr " in name or "_pr" in name or "pr_" in name or "issue" in name or
+            "review" in name or "branch" in name or "pull request" in name
+            or "pull_request" in name or "pull-request" in name or "label" in name)
+
+
+def _has_repository_if(if_statement) -> bool:
+    return if_statement is not None and REPOSITORY_CONDITIONS.contains_any(if_statement)
+
+
+class PullBasedActionsOnFork(Rule):
     """
     Check if the 'if' statement is added somewhere, also make sure that the action we are doing
     is 'the correct one'
     TODO: There is a paper classifying workflows, check what they did?
-    :param workflow:
-    :return:
     """
-
-    def is_pull_based_name(name) -> bool:
-        if name is None:
-            return False
-        return (" pr " in name or "_pr" in name or "pr_" in name or "issue" in name or
-                "review" in name or "branch" in name or "pull request" in name
-                or "pull_request" in name or "pull-request" in name or "label" in name)
-
-    pull_based_workflow = ("name" in workflow.yaml.keys()
-                           and is_pull_based_name(workflow.yaml["name"])) or is_pull_based_name(
-        workflow.name)
-
-    for job in workflow.get_jobs():
-        job_has_if = job.get_if() is not None and ("github.repository" in job.get_if() or
-                                                   "github.repository_owner" in job.get_if() or
-                                                   "repo.full_name" in job.get_if())
-        if is_pull_based_name(job.name) or pull_based_workflow:
+    name = "pull_based_actions_on_fork"
+    smell_ids = (2,)
+
+    def __init__(self):
+        super().__init__()
+        self.pull_based_workflow = False
+
+    def visit_workflow(self, workflow: Workflow) -> bool:
+        self.pull_based_workflow = ("name" in workflow.yaml.keys()
+                                    and _is_pull_based_name(workflow.yaml["name"])
+                                    ) or _is_pull_based_name(workflow.name)
+        return True
+
+    def visit_job(self, workflow: Workflow, job: Job) -> bool:
+        job_has_if = _has_repository_if(job.get_if())
+        if _is_pull_based_name(job.name) or self.pull_based_workflow:
             line_nr = workflow.get_line_number(f"{job.name.strip()}:".replace(" ", ""),
                                                use_whitespace=False)
             # We expect an if statement on the job
             if not job_has_if:
-                workflow.smells.add(f"2. Prevent running issue/PR actions on forks (job line"
-                                    f": {line_nr})")
-        # Otherwise we need to check
-        elif not job_has_if:
-            for step in job.get_steps():
-                step_has_if = step.get_if() is not None and ("github.repository" in step.get_if() or
-                                                             "github.repository_owner" in
-                                                             step.get_if() or "repo.full_name"
-                                                             in step.get_if())
-                if ((is_pull_based_name(str(step.get_execution())) or is_pull_based_name(str(
-                        step.get_name()))) and not step_has_if):
-                    (start, end) = step.get_line_numbers(workflow.get_line_number)
-                    workflow.smells.add(f"2. Prevent running issue/PR actions on forks line "
-                                        f"{start}:{end}")
-
-            # TODO: Maybe we can extend this further?
-
-
-@handle_yaml_parsing_errors
-def running_ci_when_nothing_changed(workflow: Workflow) -> None:
+                self.report(f"2. Prevent running issue/PR actions on forks (job line"
+                            f": {line_nr})")
+            return False
+        # Otherwise we need to check the steps
+        return not job_has_if
+
+    def visit_step(self, workflow: Workflow, job: Job, step: Step) -> None:
+        step_has_if = _has_repository_if(step.get_if())
+        if ((_is_pull_based_name(str(step.get_execution())) or _is_pull_based_name(str(
+                step.get_name()))) and not step_has_if):
+            (start, end) = step.get_line_numbers(workflow.get_line_number)
+            self.report(f"2. Prevent running issue/PR actions on forks line "
+                        f"{start}:{end}")
+        # TODO: Maybe we can extend this further?
+
+
+class RunningCiWhenNothingChanged(Rule):
     """
     CI includes building, testing, linting.
     TODO: Double check that we are actually doing some CI
     related tasks
-    :param workflow:
-    :return:
     """
-
-    def contains_path(on: dict) -> bool:
-        return isinstance(on, dict) and ("paths" in on.keys() or "paths-ignore" in on.keys())
-
-
-    def independent_on_code_change(on: dict) -> bool:
-        return "push" in on.keys()
-
-    ci_list = ["lint", "build", "test", "compile", "style", "ci", "codeql", "cypress"]
-    is_ci_file_name = any(word in workflow.name.lower() for word in ci_list)
-    is_ci_in_workflow = any(
-        word in str(workflow.yaml).lower() for word in ci_list)
-
-    if is_ci_file_name or is_ci_in_workflow:
-        if ("on" in workflow.get_keys() and isinstance(workflow.yaml["on"], dict)
-                and independent_on_code_change(workflow.yaml["on"])):
-            if not contains_path(workflow.get_on()["push"]):
-                workflow.smells.add("16. Avoid running CI related actions when no source code has "
-                                    "changed")
-        elif "on" not in workflow.get_keys():
-            workflow.smells.add("16. Avoid running CI related actions when no source code has "
+    name = "running_ci_when_nothing_changed"
+    smell_ids = (16,)
+
+    def visit_workflow(self, workflow: Workflow) -> bool:
+        def contains_path(on: dict) -> bool:
+            return isinstance(on, dict) and ("paths" in on.keys() or "paths-ignore" in on.keys())
+
+        def independent_on_code_change(on: dict) -> bool:
+            return "push" in on.keys()
+
+        # The workflow is only stringified when the file name does not tell already
+        if (CI_KEYWORDS.contains_any(workflow.name.lower())
+                or CI_KEYWORDS.contains_any(workflow.lower_yaml_text)):
+            if ("on" in workflow.get_keys() and isinstance(workflow.yaml["on"], dict)
+                    and independent_on_code_change(workflow.yaml["on"])):
+                if not contains_path(workflow.get_on()["push"]):
+                    self.report("16. Avoid running CI related actions when no source code has "
                                 "changed")
+            elif "on" not in workflow.get_keys():
+                self.report("16. Avoid running CI related actions when no source code has "
+                            "changed")
+        return False
 
 
-@handle_yaml_parsing_errors
-def use_fixed_version_runs_on(workflow: Workflow) -> None:
+class UseFixedVersionRunsOn(Rule):
     """
     Runs on should use a fixed version and not 'latest'
-    :param workflow:
-    :return:
     """
-    lines = workflow.file_content.split("\n")
-    runs_on_lines = list(filter(lambda x: "runs-on" in x and "latest" in x, lines))
-    for line in runs_on_lines:
-        line_nr = lines.index(line)
-        workflow.smells.add(f"3. Use fixed version for runs-on argument (line {line_nr})")
+    name = "use_fixed_version_runs_on"
+    smell_ids = (3,)
+
+    def visit_workflow(self, workflow: Workflow) -> bool:
+        runs_on_lines = list(filter(lambda x: "runs-on" in x and "latest" in x, workflow.lines))
+        for line in runs_on_lines:
+            line_nr = workflow.get_line_index(line)
+            self.report(f"3. Use fixed version for runs-on argument (line {line_nr})")
+        return False
 
 
-@handle_yaml_parsing_errors
-def use_specific_version_instead_of_dynamic(workflow: Workflow) -> None:
+class UseSpecificVersionInsteadOfDynamic(Rule):
     """
     Check if a version is updated to contain more dots or is changed from latest to something
     else or is updated to be a hash value
     Using tags is as versions for actions is a known security problem
-    :param workflow:
-    :return:
     """
-    lines = workflow.file_content.split("\n")
-    uses_lines = filter(lambda x: "uses:" in x, lines)
-    for line in uses_lines:
-        line_nr = lines.index(line)
-        if "@" not in line:
-            continue
-        versions = list(map(lambda x: x.strip(), line.split("#", 1)[0].split("@")))
-        # Make sure that a 'uses' is not commented
-        if versions == ['']:
-            continue
-        if len(versions) == 1:
-            workflow.smells.add(f"8. Use commit hash instead of tags for action versions (line "
-                                f"{line_nr})")
-            continue
-        if len(versions) >= 2 and ("v" in versions[1] or "." in versions[1]):
-            workflow.smells.add(f"8. Use commit hash instead of tags for action versions (line "
-                                f"{line_nr})")
-
-
-@handle_yaml_parsing_errors
-def action_should_have_timeout(workflow: Workflow) -> None:
+    name = "use_specific_version_instead_of_dynamic"
+    smell_ids = (8,)
+
+    def visit_workflow(self, workflow: Workflow) -> bool:
+        uses_lines = filter(lambda x: "uses:" in x, workflow.lines)
+        for line in uses_lines:
+            line_nr = workflow.get_line_index(line)
+            if "@" not in line:
+                continue
+            versions = list(map(lambda x: x.strip(), line.split("#", 1)[0].split("@")))
+            # Make sure that a 'uses' is not commented
+            if versions == ['']:
+                continue
+            if len(versions) == 1:
+                self.report(f"8. Use commit hash instead of tags for action versions (line "
+                            f"{line_nr})")
+                continue
+            if len(versions) >= 2 and ("v" in versions[1] or "." in versions[1]):
+                self.report(f"8. Use commit hash instead of tags for action versions (line "
+                            f"{line_nr})")
+        return False
+
+
+class ActionShouldHaveTimeout(Rule):
     """
     TODO: Try to compile a list of actions on github which tend to run long?
           Or try to compile a list of actions which access the outside world?
           Differentiate between jobs having a timeout and steps having a timeout.
           Jobs should be good practice and specific steps should be smell?
-    :param change:
-    :return:
     """
-    for job in workflow.get_jobs():
+    name = "action_should_have_timeout"
+    smell_ids = (10,)
+
+    def visit_job(self, workflow: Workflow, job: Job) -> bool:
         # We are purely running a different workflow so that should have this config
         if "steps" not in job.yaml.keys():
-            continue
+            return False
         if "timeout-minutes" not in job.yaml.keys():
             line_nr = workflow.get_line_number(job.name + ":", use_whitespace=False)
-            workflow.smells.add(f"10. Avoid jobs without timeouts (line: {line_nr})")
+            self.report(f"10. Avoid jobs without timeouts (line: {line_nr})")
+        return False
 
 
-@handle_yaml_parsing_errors
-def use_cache_from_setup(workflow: Workflow) -> None:
+class UseCacheFromSetup(Rule):
     """
     Many setup/install actions such as `setup-node` already provide a cache for the downloaded libraries
     Should it be desirable to have the cache param even when they are not yet doing caching?
-    :param workflow:
-    :return:
     """
-    cacheable_actions = ["actions/setup-python", "actions/setup-java", "actions/setup-node"]
-    for job in workflow.get_jobs():
-        is_cachable_action = False
-        is_cache_action = False
-        for index, step in enumerate(job.get_steps()):
-            is_cachable_action = ("uses" in step.yaml.keys() and any(action in str(step.yaml) for
-                                                                     action in cacheable_actions)
-                                  and "cache" not in str(step.yaml)
-                                  or is_cachable_action)
-            is_cache_action = ("uses" in step.yaml.keys() and "actions/cache" in step.get_uses()
-                                and any(keyword in str(step.yaml) for keyword in ["pip",
-                                                                                  "python",
-                                                                                  "requirements.txt", "maven", "pom.xml", "gradle", "build.gradle", "npm", "package-lock", "yarn"])
-                               or is_cache_action)
-
-        if is_cache_action and is_cachable_action:
-            workflow.smells.add("21. Use cache parameter instead of cache option")
-
-
-@handle_yaml_parsing_errors
-def scheduled_workflows_on_forks(workflow: Workflow) -> None:
-    on_dict = workflow.get_on()
-    if on_dict is not None and isinstance(on_dict, dict) and "schedule" in on_dict.keys():
+    name = "use_cache_from_setup"
+    smell_ids = (21,)
+    cacheable_actions = KeywordMatcher(["actions/setup-python", "actions/setup-java",
+                                        "actions/setup-node"])
+    cache_keywords = KeywordMatcher(["pip", "python", "requirements.txt", "maven", "pom.xml",
+                                     "gradle", "build.gradle", "npm", "package-lock", "yarn"])
+
+    def __init__(self):
+        super().__init__()
+        self.is_cachable_action = False
+        self.is_cache_action = False
+
+    def visit_job(self, workflow: Workflow, job: Job) -> bool:
+        self.is_cachable_action = False
+        self.is_cache_action = False
+        return True
+
+    def visit_step(self, workflow: Workflow, job: Job, step: Step) -> None:
+        if "uses" not in step.yaml.keys():
+            return
+        text = step.yaml_text
+        if self.cacheable_actions.contains_any(text) and "cache" not in text:
+            self.is_cachable_action = True
+        if "actions/cache" in step.get_uses() and self.cache_keywords.contains_any(text):
+            self.is_cache_action = True
+
+    def leave_job(self, workflow: Workflow, job: Job) -> None:
+        if self.is_cache_action and self.is_cachable_action:
+            self.report("21. Use cache parameter instead of cache option")
+
+
+class ScheduledWorkflowsOnForks(Rule):
+    name = "scheduled_workflows_on_forks"
+    smell_ids = (1,)
+    requires_keys = ("on",)
+    if_statements = KeywordMatcher(["github.repository", "github.repository_owner",
+                                    "repo.full_name "])
+
+    def visit_workflow(self, workflow: Workflow) -> bool:
+        on_dict = workflow.get_on()
         # We are dealing with a cron workflow
-        for job in workflow.get_jobs():
-            if_statements = ["github.repository", "github.repository_owner", "repo.full_name "]
-            if job.get_if() is None:
-                workflow.smells.add("1. Avoid executing scheduled workflows on forks")
-                continue
-            if not any(word in job.get_if() for word in if_statements):
-                workflow.smells.add("1. Avoid executing scheduled workflows on forks")
+        return on_dict is not None and isinstance(on_dict, dict) and "schedule" in on_dict.keys()
 
+    def visit_job(self, workflow: Workflow, job: Job) -> bool:
+        if job.get_if() is None:
+            self.report("1. Avoid executing scheduled workflows on forks")
+        elif not self.if_statements.contains_any(job.get_if()):
+            self.report("1. Avoid executing scheduled workflows on forks")
+        return False
 
-@handle_yaml_parsing_errors
-def use_name_for_step(workflow: Workflow) -> None:
-    for job in workflow.get_jobs():
-        for step in job.get_steps():
-            if "name" not in step.yaml.keys() and not step.is_inherited:
-                (start, end) = step.get_line_numbers(workflow.get_line_number)
-                workflow.smells.add(f"13. Use names for run steps (lines {start}:{end})")
-
-
-@handle_yaml_parsing_errors
-def upload_artifact_must_have_if(workflow: Workflow) -> None:
-    for job in workflow.get_jobs():
-        if job.get_if() is not None and "github.repository" in job.get_if():
-            continue
-        for step in job.get_steps():
-            if "uses" in step.yaml.keys() and ("actions/upload-artifact" in step.yaml["uses"] or
-                                               "coverallsapp/github-action" in step.yaml["uses"] or
-                                               "codecov/codecov-action" in step.yaml["uses"]):
-                if step.get_if() is None:
+
+class UseNameForStep(Rule):
+    name = "use_name_for_step"
+    smell_ids = (13,)
+
+    def visit_job(self, workflow: Workflow, job: Job) -> bool:
+        return True
+
+    def visit_step(self, workflow: Workflow, job: Job, step: Step) -> None:
+        if "name" not in step.yaml.keys() and not step.is_inherited:
+            (start, end) = step.get_line_numbers(workflow.get_line_number)
+            self.report(f"13. Use names for run steps (lines {start}:{end})")
+
+
+class UploadArtifactMustHaveIf(Rule):
+    name = "upload_artifact_must_have_if"
+    smell_ids = (7, 11)
+
+    def visit_job(self, workflow: Workflow, job: Job) -> bool:
+        return not (job.get_if() is not None and "github.repository" in job.get_if())
+
+    def visit_step(self, workflow: Workflow, job: Job, step: Step) -> None:
+        if "uses" in step.yaml.keys() and UPLOAD_ACTIONS.contains_any(step.yaml["uses"]):
+            if step.get_if() is None:
+                stripped = step.yaml["uses"].strip()
+                line_nr = workflow.get_line_number(f"uses: {stripped}".replace(" ", ""),
+                                                   use_whitespace=False)
+                self.report(f"7. Use 'if' for upload-artifact action (line {line_nr})")
+            else:
+                if not (REPOSITORY_OWNER_CONDITIONS.contains_any(step.get_if()) or (
+                        job.get_if() is not None
+                        and not REPOSITORY_OWNER_CONDITIONS.contains_any(job.get_if()))):
                     stripped = step.yaml["uses"].strip()
                     line_nr = workflow.get_line_number(f"uses: {stripped}".replace(" ", ""),
                                                        use_whitespace=False)
-                    workflow.smells.add(f"7. Use 'if' for upload-artifact action (line {line_nr})")
-                else:
-                    if not (("github.repository" in step.get_if() or "github.repository_owner"
-                             in step.get_if()) or (
-                                    job.get_if() is not None and not (
-                                    "github.repository" in job.get_if()
-                                    or "github.repository_owner" in job.get_if()))):
-                        stripped = step.yaml["uses"].strip()
-                        line_nr = workflow.get_line_number(f"uses: {stripped}".replace(" ", ""),
-                                                       use_whitespace=False)
-                        workflow.smells.add(f"11. Avoid uploading artifacts on forks (line"
-                                            f" {line_nr})")
-            elif step.get_name() is not None and "upload" in step.get_name().lower():
-                if (step.get_if() is not None and not ("github.repository" in step.get_if() or
-                                                       "github.repository_owner" in step.get_if())):
-                    # if ((step.get_if() is None)
-                    #         or not (("github.repository" in step.get_if() or
-                    #                                     "github.repository_owner"
-                    #                                     in step.get_if()))):
-                    (start, end) = step.get_line_numbers(workflow.get_line_number)
-                    workflow.smells.add(
-                        f"11. Avoid uploading artifacts on forks (line {start}:{end}) for job"
-                        f" {job.name}")
-
-
-@handle_yaml_parsing_errors
-def multi_line_steps(workflow: Workflow) -> None:
+                    self.report(f"11. Avoid uploading artifacts on forks (line"
+                                f" {line_nr})")
+        elif step.get_name() is not None and "upload" in step.get_name().lower():
+            if (step.get_if() is not None
+                    and not REPOSITORY_OWNER_CONDITIONS.contains_any(step.get_if())):
+                # if ((step.get_if() is None)
+                #         or not (("github.repository" in step.get_if() or
+                #                                     "github.repository_owner"
+                #                                     in step.get_if()))):
+                (start, end) = step.get_line_numbers(workflow.get_line_number)
+                self.report(
+                    f"11. Avoid uploading artifacts on forks (line {start}:{end}) for job"
+                    f" {job.name}")
+
+
+class MultiLineSteps(Rule):
     """
     TODO: This smell still needs to be renamed
-    :param workflow:
-    :return:
     """
-    for job in workflow.get_jobs():
-        for step in job.get_steps():
-            if "run" in step.yaml.keys():
-                run = step.yaml["run"]
-                unformatted_run = run.replace("\\\n", " ")
-                if "\n" in unformatted_run[:-1] or "&&" in run:
-                    line_nr = workflow.get_line_number(("-run: " + run.split("\n")[0]).strip(),
-                                                       use_whitespace=False)
-                    workflow.smells.add(f"9. Steps should only perform a single command (line "
-                                        f"{line_nr})")
+    name = "multi_line_steps"
+    smell_ids = (9,)
 
+    def visit_job(self, workflow: Workflow, job: Job) -> bool:
+        return True
 
-@handle_yaml_parsing_errors
-def comment_in_workflow(workflow: Workflow) -> None:
-    source_code = workflow.file_content
-    if "#" not in source_code:
-        workflow.smells.add("12. Avoid workflows without comments")
+    def visit_step(self, workflow: Workflow, job: Job, step: Step) -> None:
+        if "run" in step.yaml.keys():
+            run = step.yaml["run"]
+            unformatted_run = run.replace("\\\n", " ")
+            if "\n" in unformatted_run[:-1] or "&&" in run:
+                line_nr = workflow.get_line_number(("-run: " + run.split("\n")[0]).strip(),
+                                                   use_whitespace=False)
+                self.report(f"9. Steps should only perform a single command (line "
+                            f"{line_nr})")
 
 
-@handle_yaml_parsing_errors
-def deploy_from_fork(workflow: Workflow) -> None:
-    if "deploy" in workflow.name:
-        for job in workflow.get_jobs():
-            if job.get_if() is None:
-                workflow.smells.add("22. Avoid deploying jobs on forks")
-                continue
-            if ("github.repository" not in job.get_if() and
-                                        "github.repository_owner" not in job.get_if()):
-                workflow.smells.add("22. Avoid deploying from forks")
+class CommentInWorkflow(Rule):
+    name = "comment_in_workflow"
+    smell_ids = (12,)
 
-    for job in workflow.get_jobs():
+    def visit_workflow(self, workflow: Workflow) -> bool:
+        source_code = workflow.file_content
+        if "#" not in source_code:
+            self.report("12. Avoid workflows without comments")
+        return False
+
+
+class DeployFromForkByName(Rule):
+    """
+    First pass of deploy_from_fork, for workflows with deploy in their name.
+    """
+    name = "deploy_from_fork"
+    smell_ids = (22,)
+
+    def visit_workflow(self, workflow: Workflow) -> bool:
+        return "deploy" in workflow.name
+
+    def visit_job(self, workflow: Workflow, job: Job) -> bool:
+        if job.get_if() is None:
+            self.report("22. Avoid deploying jobs on forks")
+        elif not REPOSITORY_OWNER_CONDITIONS.contains_any(job.get_if()):
+            self.report("22. Avoid deploying from forks")
+        return False
+
+
+class DeployFromFork(Rule):
+    """
+    Second pass of deploy_from_fork, it only runs when the first pass did not fail.
+    """
+    name = "deploy_from_fork"
+    smell_ids = (22,)
+    depends_on = (DeployFromForkByName,)
+
+    def visit_job(self, workflow: Workflow, job: Job) -> bool:
         if job.get_if() is None:
-            workflow.smells.add("22. Avoid deploying jobs on forks")
-            continue
-        if ("github.repository" not in job.get_if() and
-                "github.repository_owner" not in job.get_if()):
-            workflow.smells.add("22. Avoid deploying jobs on forks")
+            self.report("22. Avoid deploying jobs on forks")
+        elif not REPOSITORY_OWNER_CONDITIONS.contains_any(job.get_if()):
+            self.report("22. Avoid deploying jobs on forks")
+        return False
 
 
-@handle_yaml_parsing_errors
-def run_multiple_versions(workflow: Workflow) -> None:
+class RunMultipleVersions(Rule):
+    name = "run_multiple_versions"
+    smell_ids = (19, 20)
+
+    def __init__(self):
+        super().__init__()
+        self.has_build = False
+
+    @staticmethod
     def job_has_setup_action_with_version(job: Job) -> bool:
         setup_step: list[Step] = list(filter(lambda s: s.get_uses() is not None and
                                                       "actions/setup" in
-                                                  s.get_uses(), job.get_steps()))
+                                                      s.get_uses(), job.get_steps()))
         if len(setup_step) == 0:
             return True
         for step in setup_step:
@@ -402,56 +486,143 @@ def run_multiple_versions(workflow: Workflow) -> None:
             else:
                 return True
 
-    has_build = "build" in workflow.name.lower() or "test" in workflow.name.lower()
-    for job in workflow.get_jobs():
-        if has_build or "build" in str(job.job_name).lower() or "test" in str(job.job_name).lower():
+    def visit_workflow(self, workflow: Workflow) -> bool:
+        self.has_build = BUILD_OR_TEST.contains_any(workflow.name.lower())
+        return True
+
+    def visit_job(self, workflow: Workflow, job: Job) -> bool:
+        if self.has_build or BUILD_OR_TEST.contains_any(str(job.job_name).lower()):
             if ("runs-on" in job.yaml.keys() and ("matrix" not in job.yaml["runs-on"]) and ","
                     not in str(job.yaml["runs-on"])):
-                workflow.smells.add(f"19. Run tests on multiple OS's (job: {job.name})")
-            if not job_has_setup_action_with_version(job):
-                workflow.smells.add(f"20. Run CI on multiple language versions (job: {job.name})")
+                self.report(f"19. Run tests on multiple OS's (job: {job.name})")
+            if not self.job_has_setup_action_with_version(job):
+                self.report(f"20. Run CI on multiple language versions (job: {job.name})")
+        return False
+
+
+_VERSION_PATTERN = re.compile("(((=|@)[0-9]+(.[0-9]+.[0-9]+)?))")
+
 
+class InstallingPackagesWithoutVersion(Rule):
+    name = "installing_packages_without_version"
+    smell_ids = (18,)
 
-@handle_yaml_parsing_errors
-def installing_packages_without_version(workflow: Workflow) -> None:
+    @staticmethod
     def excluded_commands(line: str) -> bool:
         return "upgrade" not in line and "mvn" not in line and ".sh" not in line
 
+    @staticmethod
     def included_commands(line: str) -> bool:
         return ("npm" in line or "npx" in line or "pip" in line or "brew" in
                 line)
 
-    for job in workflow.get_jobs():
-        for step in job.get_steps():
-            if "run" in step.yaml.keys():
-                run = step.yaml["run"]
-                lines = run.split("\n")
-                for l in lines:
-                    # Special case for playwright because it cannot handle versions
-                    if "npx playwright install" in l:
-                        continue
-                    if (" install " in l and len(l.split(" ")) >= 3 and excluded_commands(l) and
-                            included_commands(l)):
-                        version = re.search("(((=|@)[0-9]+(.[0-9]+.[0-9]+)?))", l)
-                        if version is None and "--channel" not in l and "latest" not in l:
-                            line_nr = workflow.get_line_number("-run:" + l.strip(),
-                                                               use_whitespace=False)
-                            workflow.smells.add("18. Avoid installing packages without version ("
-                                                "line "
-                                                f"{line_nr})")
-
-
-@handle_yaml_parsing_errors
-def stop_workflows_for_old_commit(workflow: Workflow) -> None:
-    if "concurrency" not in workflow.yaml.keys():
-        if ((isinstance(workflow.yaml["on"], dict) and "schedule" in workflow.get_on().keys()) or
-                "release" in workflow.name.lower()):
-            workflow.smells.add(
-                "17. Avoid starting new workflow whilst the previous one is still running")
-        if (workflow.get_on() is not None
-                and isinstance(workflow.get_on(), dict) and "push" in workflow.get_on().keys()):
-            workflow.smells.add("4. Stop running workflows when there is a newer commit in branch")
-        if workflow.get_on() is not None and isinstance(workflow.get_on(), dict) and (
-                "pull_request" in workflow.get_on().keys() or "pull_request_target" in
-                workflow.get_on().keys()):
-            workflow.smells.add("5. Stop running workflows when there is a newer commit in PR")
\ No newline at end of file
+    def visit_job(self, workflow: Workflow, job: Job) -> bool:
+        return True
+
+    def visit_step(self, workflow: Workflow, job: Job, step: Step) -> None:
+        if "run" in step.yaml.keys():
+            run = step.yaml["run"]
+            lines = run.split("\n")
+            for l in lines:
+                # Special case for playwright because it cannot handle versions
+                if "npx playwright install" in l:
+                    continue
+                if (" install " in l and len(l.split(" ")) >= 3 and self.excluded_commands(l) and
+                        self.included_commands(l)):
+                    version = _VERSION_PATTERN.search(l)
+                    if version is None and "--channel" not in l and "latest" not in l:
+                        line_nr = workflow.get_line_number("-run:" + l.strip(),
+                                                           use_whitespace=False)
+                        self.report("18. Avoid installing packages without version ("
+                                    "line "
+                                    f"{line_nr})")
+
+
+class StopWorkflowsForOldCommit(Rule):
+    name = "stop_workflows_for_old_commit"
+    smell_ids = (4, 5, 17)
+
+    def visit_workflow(self, workflow: Workflow) -> bool:
+        if "concurrency" not in workflow.yaml.keys():
+            if ((isinstance(workflow.yaml["on"], dict) and "schedule" in workflow.get_on().keys())
+                    or "release" in workflow.name.lower()):
+                self.report(
+                    "17. Avoid starting new workflow whilst the previous one is still running")
+            if (workflow.get_on() is not None
+                    and isinstance(workflow.get_on(), dict) and "push" in workflow.get_on().keys()):
+                self.report("4. Stop running workflows when there is a newer commit in branch")
+            if workflow.get_on() is not None and isinstance(workflow.get_on(), dict) and (
+                    "pull_request" in workflow.get_on().keys() or "pull_request_target" in
+                    workflow.get_on().keys()):
+                self.report("5. Stop running workflows when there is a newer commit in PR")
+        return False
+
+
+# All rules in the order Runner.run_all runs them
+RULES: list[type[Rule]] = [
+    FilesShouldBeIndentedCorrectly,
+    GithubTokenPermissions,
+    ExternalActionsPermissions,
+    PullBasedActionsOnFork,
+    RunningCiWhenNothingChanged,
+    UseFixedVersionRunsOn,
+    UseSpecificVersionInsteadOfDynamic,
+    ActionShouldHaveTimeout,
+    UseNameForStep,
+    ScheduledWorkflowsOnForks,
+    StopWorkflowsForOldCommit,
+    UploadArtifactMustHaveIf,
+    MultiLineSteps,
+    CommentInWorkflow,
+    DeployFromForkByName,
+    DeployFromFork,
+    RunMultipleVersions,
+    InstallingPackagesWithoutVersion,
+    UseCacheFromSetup,
+]
+
+
+# Every smell some rule reports, 23 is reported by the engine for rules that failed
+SMELL_IDS: list[int] = sorted({smell_id for rule in RULES for smell_id in rule.smell_ids})
+
+
+def selected_smell_ids(only: Optional[Iterable[int]] = None,
+                       skip: Optional[Iterable[int]] = None) -> Optional[set[int]]:
+    """
+    :param only: the smells to detect, all when None
+    :param skip: smells not to detect
+    :return: the selected smells, None when all of them are
+    """
+    if only is None and skip is None:
+        return None
+    selected = {int(i) for i in only} if only is not None else set(SMELL_IDS)
+    return selected - {int(i) for i in skip} if skip is not None else selected
+
+
+def _as_function(*rule_classes: type[Rule]):
+    def run(workflow: Workflow) -> None:
+        run_rules(workflow, rule_classes)
+    run.__name__ = rule_classes[0].name
+    run.__doc__ = rule_classes[0].__doc__
+    return run
+
+
+# The rules can still be run on their own, as they were before the Runner walked them together
+files_should_be_indented_correctly = _as_function(FilesShouldBeIndentedCorrectly)
+external_actions_must_have_permissions_workflow = _as_function(GithubTokenPermissions,
+                                                               ExternalActionsPermissions)
+pull_based_actions_on_fork = _as_function(PullBasedActionsOnFork)
+running_ci_when_nothing_changed = _as_function(RunningCiWhenNothingChanged)
+use_fixed_version_runs_on = _as_function(UseFixedVersionRunsOn)
+use_specific_version_instead_of_dynamic = _as_function(UseSpecificVersionInsteadOfDynamic)
+action_should_have_timeout = _as_function(ActionShouldHaveTimeout)
+use_cache_from_setup = _as_function(UseCacheFromSetup)
+scheduled_workflows_on_forks = _as_function(ScheduledWorkflowsOnForks)
+use_name_for_step = _as_function(UseNameForStep)
+upload_artifact_must_have_if = _as_function(UploadArtifactMustHaveIf)
+multi_line_steps = _as_function(MultiLineSteps)
+comment_in_workflow = _as_function(CommentInWorkflow)
+deploy_from_fork = _as_function(DeployFromForkByName, DeployFromFork)
+run_multiple_versions = _as_function(RunMultipleVersions)
+installing_packages_without_version = _as_function(InstallingPackagesWithoutVersion)
+stop_workflows_for_old_commit = _as_function(StopWorkflowsForOldCommit)
@@ -1,20 +1,126 @@
+import contextlib
+import contextvars
 import io
+import re
 
-from ruamel.yaml import YAML
+import yaml as pyyaml
+from ruamel.yaml import YAML, resolver
 from typing import Optional, Callable
 
 
+class _NeedsRoundTrip(Exception):
+    """
+    Raised by the fast loader for YAML it would not load exactly like ruamel
+    """
+
+
+class _FastLoader(getattr(pyyaml, "CSafeLoader", pyyaml.SafeLoader)):
+    """
+    Safe loader on top of libyaml that resolves plain scalars like ruamel does (YAML 1.2, so
+    'on' stays a string). Anything ruamel would construct differently, such as octal or
+    sexagesimal numbers, timestamps, merge keys and duplicate keys, is left to ruamel.
+    """
+    yaml_implicit_resolvers = {}
+
+
+for _versions, _tag, _regexp, _first in resolver.implicit_resolvers:
+    if (1, 2) in _versions:
+        _FastLoader.add_implicit_resolver(_tag, _regexp, _first)
+
+_DECIMAL_INT = re.compile(r'^[-+]?(?:0|[1-9][0-9]*)$')
+
+
+def _construct_int(loader: _FastLoader, node) -> int:
+    if _DECIMAL_INT.match(node.value) is None:
+        raise _NeedsRoundTrip(node.value)
+    return int(node.value)
+
+
+def _construct_timestamp(loader: _FastLoader, node):
+    raise _NeedsRoundTrip(node.value)
+
+
+def _construct_mapping(loader: _FastLoader, node):
+    mapping = {}
+    yield mapping
+    for key_node, value_node in node.value:
+        if key_node.tag == "tag:yaml.org,2002:merge":
+            raise _NeedsRoundTrip("merge key")
+        key = loader.construct_object(key_node, deep=True)
+        if key in mapping:
+            raise _NeedsRoundTrip(f"duplicate key {key}")
+        mapping[key] = loader.construct_object(value_node, deep=True)
+
+
+_FastLoader.add_constructor("tag:yaml.org,2002:int", _construct_int)
+_FastLoader.add_constructor("tag:yaml.org,2002:timestamp", _construct_timestamp)
+_FastLoader.add_constructor("tag:yaml.org,2002:map", _construct_mapping)
+
+
+def _has_explicit_tag(yaml_str: str) -> bool:
+    """
+    Whether a node of yaml_str has a tag such as '!!str' or '!foo'. ruamel keeps those as
+    TaggedScalar, so such documents go to ruamel.
+    """
+    for event in pyyaml.parse(yaml_str, Loader=_FastLoader):
+        if getattr(event, "tag", None) is not None:
+            return True
+    return False
+
+
+def fast_load_yaml(yaml_str: str):
+    """
+    Load yaml_str with libyaml into plain dicts and lists that print like ruamel's result.
+    :raises Exception: when the text has to be loaded by ruamel, invalid YAML included
+    """
+    # ruamel rejects some tabs libyaml accepts and handles the %YAML directive differently
+    if "\t" in yaml_str or "%YAML" in yaml_str:
+        raise _NeedsRoundTrip("tab or directive")
+    # Only a '!' can start a tag, most workflows do not need the extra pass
+    if "!" in yaml_str and _has_explicit_tag(yaml_str):
+        raise _NeedsRoundTrip("explicit tag")
+    return pyyaml.load(yaml_str, Loader=_FastLoader)
+
+
+_quiet = contextvars.ContextVar("quiet", default=False)
+
+
+@contextlib.contextmanager
+def quiet_output():
+    """
+    Silence the diagnostics of the detector (see report) in this thread or task only,
+    unlike redirecting the process-wide sys.stdout
+    """
+    token = _quiet.set(True)
+    try:
+        yield
+    finally:
+        _quiet.reset(token)
+
+
+def report(*values) -> None:
+    """
+    Print a diagnostic unless it is silenced by quiet_output
+    """
+    if not _quiet.get():
+        print(*values)
+
 
 def parse_yaml(yaml_str: Optional[str]) -> Optional[dict]:
     if yaml_str is None:
         return None
-    yaml = YAML()
     try:
-        content = yaml.load(io.StringIO(yaml_str))
+        return fast_load_yaml(yaml_str)
+    except Exception:
+        # ruamel decides, including whether the text is valid at all
+        pass
+    try:
+        # A new loader every time, a reused one keeps the version of a %YAML directive
+        content = YAML().load(io.StringIO(yaml_str))
         return content
     except Exception as e:
-        print("Unable to parse yaml file: " + yaml_str)
-        print(e)
+        report("Unable to parse yaml file: " + yaml_str)
+        report(e)
         return None
 
 
@@ -0,0 +1,99 @@
+# actionlint_batch.py
+# 여러 워크플로우 파일을 actionlint 프로세스 하나로 묶어 실행하고,
+# JSON 출력의 filepath로 결과를 파일별로 나눕니다.
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Union
+
+
+def _parse_output(stdout: str) -> List[Any]:
+    """
+    actionlint 출력을 줄 단위로 JSON 파싱합니다 (파일별 실행 시의 결과 형식).
+    """
+    issues = []
+    for line in stdout.strip().split('\n'):
+        if line:
+            try:
+                issues.append(json.loads(line))
+            except json.JSONDecodeError:
+                print(f"    WARNING: '{line}' 은(는) 유효한 JSON이 아닙니다. 건너뜁니다.", file=sys.stderr)
+    return issues
+
+
+def run_actionlint_on_file(actionlint: str, file_path: Union[str, Path]) -> List[Any]:
+    """
+    파일 하나에 대해 actionlint를 실행합니다.
+    """
+    try:
+        process = subprocess.run(
+            [actionlint, "-format", "{{json .}}", str(file_path)],
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            check=False  # actionlint는 문제를 찾으면 non-zero 코드를 반환
+        )
+        return _parse_output(process.stdout) if process.stdout else []
+    except Exception as e:
+        print(f"    ERROR: '{file_path}' 파일 분석 중 오류 발생: {e}", file=sys.stderr)
+        return [{"error": str(e)}]
+
+
+def run_actionlint_batch(actionlint: str, file_paths: Sequence[Union[str, Path]],
+                         chunk_size: int = 200) -> Dict[str, List[Any]]:
+    """
+    파일들을 chunk_size개씩 actionlint 한 번으로 검사합니다.
+
+    Args:
+        actionlint: actionlint 실행파일 경로.
+        file_paths: 검사할 파일 경로 리스트.
+        chunk_size: actionlint 한 번에 넘길 파일 수.
+
+    Returns:
+        str(파일 경로)를 키로, 파일별로 실행했을 때와 같은 형식([오류 리스트])의 결과를 값으로 하는 딕셔너리.
+        치명적 오류(종료 코드 0, 1 이외)로 끝난 묶음은 파일별로 다시 실행합니다.
+    """
+    results = {}
+    paths = list(dict.fromkeys(str(p) for p in file_paths))
+    total = len(paths)
+    for start in range(0, total, chunk_size):
+        chunk = paths[start:start + chunk_size]
+        print(f"  [{start + 1}-{start + len(chunk)}/{total}] 분석 중...")
+        # actionlint는 filepath를 작업 디렉토리 기준 상대 경로로 출력하므로 절대 경로로 맞춤
+        by_abs_path = {os.path.abspath(p): [] for p in chunk}
+        try:
+            process = subprocess.run(
+                [actionlint, "-format", "{{json .}}"] + chunk,
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                check=False
+            )
+            unmatched = 0
+            if process.returncode in (0, 1):
+                for output in _parse_output(process.stdout):
+                    for issue in output if isinstance(output, list) else [output]:
+                        key = os.path.abspath(issue.get("filepath", "")) \
+                            if isinstance(issue, dict) else None
+                        if key in by_abs_path:
+                            by_abs_path[key].append(issue)
+                        else:
+                            unmatched += 1
+            if process.returncode not in (0, 1) or unmatched > 0:
+                print(f"    WARNING: 묶음 결과를 나눌 수 없어 파일별로 다시 실행합니다 "
+                      f"(코드: {process.returncode})", file=sys.stderr)
+                for p in chunk:
+                    results[p] = run_actionlint_on_file(actionlint, p)
+                continue
+        except Exception as e:
+            print(f"    ERROR: actionlint 실행 중 오류 발생: {e}", file=sys.stderr)
+            for p in chunk:
+                results[p] = [{"error": str(e)}]
+            continue
+        for p in chunk:
+            # 파일별 실행 시 actionlint는 JSON 배열 한 줄을 출력하므로 같은 모양으로 감쌈
+            results[p] = [by_abs_path[os.path.abspath(p)]]
+    return results
@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Dict, List, Any
 from pprint import pprint
 
+from actionlint_batch import run_actionlint_batch
+
 def check_actionlint_installed():
     """
     시스템에 actionlint가 설치되어 있는지 확인합니다.
@@ -69,43 +71,19 @@ def run_actionlint_on_files(csv_path: Path, workflows_dir: Path) -> Dict[str, Li
     total_files = len(file_hashes)
     print(f"\n총 {total_files}개의 워크플로우 파일을 분석합니다...")
 
-    for i, file_hash in enumerate(file_hashes):
+    existing = {}
+    for file_hash in file_hashes:
         file_path = workflows_dir / file_hash
-        print(f"  [{i+1}/{total_files}] 분석 중: {file_hash}")
-
         if not file_path.is_file():
             print(f"    WARNING: 파일을 찾을 수 없습니다: {file_path}", file=sys.stderr)
             all_results[file_hash] = [{"error": "File not found"}]
             continue
+        existing[str(file_path)] = file_hash
 
-        try:
-            command = ["./actionlint_mac", "-format", "{{json .}}", str(file_path)]
-            process = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                check=False
-            )
-
-            if not process.stdout:
-                all_results[file_hash] = []
-                continue
-
-            file_issues = []
-            for line in process.stdout.strip().split('\n'):
-                if line:
-                    try:
-                        issue = json.loads(line)
-                        file_issues.append(issue)
-                    except json.JSONDecodeError:
-                        print(f"    WARNING: '{line}' 은(는) 유효한 JSON이 아닙니다. 건너뜁니다.", file=sys.stderr)
-            
-            all_results[file_hash] = file_issues
-
-        except Exception as e:
-            print(f"    ERROR: '{file_path}' 파일 분석 중 오류 발생: {e}", file=sys.stderr)
-            all_results[file_hash] = [{"error": str(e)}]
+    # 파일마다 프로세스를 띄우지 않고 묶어서 실행한 뒤 filepath로 파일별 결과를 나눕니다.
+    batch_results = run_actionlint_batch("./actionlint_mac", list(existing))
+    for path_str, file_hash in existing.items():
+        all_results[file_hash] = batch_results[path_str]
 
     return all_results
 
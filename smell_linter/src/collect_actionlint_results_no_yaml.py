@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Dict, List, Any
 from pprint import pprint
 
+from actionlint_batch import run_actionlint_batch
+
 def check_actionlint_installed():
     """
     시스템에 actionlint가 설치되어 있는지 확인합니다.
@@ -44,9 +46,8 @@ def run_actionlint_on_directory(target_dir: Path) -> Dict[str, List[Dict[str, An
         print(f"ERROR: 디렉토리를 찾을 수 없습니다: {target_dir}", file=sys.stderr)
         return {}
 
-    all_results = {}
     # .yml과 .yaml 파일을 모두 찾습니다.
-    workflow_files = list(target_dir.glob("**/*")) 
+    workflow_files = [p for p in target_dir.glob("**/*") if p.is_file()]
     
     total_files = len(workflow_files)
     if total_files == 0:
@@ -55,42 +56,9 @@ def run_actionlint_on_directory(target_dir: Path) -> Dict[str, List[Dict[str, An
         
     print(f"\n총 {total_files}개의 워크플로우 파일을 분석합니다...")
 
-    for i, file_path in enumerate(workflow_files):
-        # 프로젝트 루트 기준 상대 경로를 키로 사용
-        relative_path_str = str(file_path)
-        print(f"  [{i+1}/{total_files}] 분석 중: {relative_path_str}")
-
-        try:
-            # -format "{{json .}}" 옵션으로 각 문제를 JSON 형태로 출력
-            command = ["./actionlint", "-format", "{{json .}}", str(file_path)]
-            process = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                check=False # actionlint는 문제를 찾으면 non-zero 코드를 반환하므로 check=False로 설정
-            )
-
-            # actionlint는 문제를 찾지 못하면 아무것도 출력하지 않습니다.
-            if not process.stdout:
-                all_results[relative_path_str] = []
-                continue
-
-            file_issues = []
-            # 출력을 한 줄씩 읽어 JSON으로 파싱
-            for line in process.stdout.strip().split('\n'):
-                if line:
-                    try:
-                        issue = json.loads(line)
-                        file_issues.append(issue)
-                    except json.JSONDecodeError:
-                        print(f"    WARNING: '{line}' 은(는) 유효한 JSON이 아닙니다. 건너뜁니다.", file=sys.stderr)
-            
-            all_results[relative_path_str] = file_issues
-
-        except Exception as e:
-            print(f"    ERROR: '{file_path}' 파일 분석 중 오류 발생: {e}", file=sys.stderr)
-            all_results[relative_path_str] = [{"error": str(e)}]
+    # 파일마다 프로세스를 띄우지 않고 묶어서 실행한 뒤 filepath로 파일별 결과를 나눕니다.
+    # 프로젝트 루트 기준 상대 경로를 키로 사용
+    all_results = run_actionlint_batch("./actionlint", workflow_files)
 
     return all_results
 